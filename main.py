@@ -1,11 +1,18 @@
 # MUST BE IMPORTED FIRST
 from src.managers.logHandler import logger
 
-
-from src.managers.fileManager import read_files
+import argparse
+import os
+from src.managers.fileManager import read_files, follow_file, scan_files
 from src.utils.timeUtils import get_timer
 from src.managers.dirManager import get_directory, get_files
 from src.managers.outcomeWriter import process_outcome
+from src.managers.profileManager import (
+    profile_modes,
+    profile_read_files,
+    start_memory_profile,
+    log_memory_snapshot,
+)
 
 try:
     from dev.dev_vars import test_file2 as input_dir  # trimmed test file
@@ -22,18 +29,87 @@ except ImportError:
     input_dir = None
 
 
+def get_args():
+    parser = argparse.ArgumentParser(description="Parse TacView .acmi files")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of worker processes to spread files across (default: 1)",
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="follow the most recently modified file whilst it is being written (e.g.: live server session)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=300,
+        help="with --follow, stop once the file has not been written to for this many seconds (default: 300)",
+    )
+    parser.add_argument(
+        "--scan",
+        action="store_true",
+        help="only read each file's header (mission title, author, recorder, references), writing the files data only",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=profile_modes,
+        default=None,
+        help="cpu: cProfile reading each file (serially), dumping .pstats files / mem: tracemalloc snapshots after parsing and after writing outputs, logging the top allocation sites - profiles are written to the log output directory (files are read in this process: not with --workers)",
+    )
+    args = parser.parse_args()
+    if args.profile and args.workers > 1:
+        # worker processes are not seen by cProfile / tracemalloc
+        parser.error(
+            f"--profile {args.profile} reads files in this process: not allowed with --workers {args.workers}"
+        )
+    if args.profile == "cpu" and (args.scan or args.follow):
+        parser.error(
+            "--profile cpu only profiles reading files: not allowed with --scan or --follow"
+        )
+    return args
+
+
+def log_event(event):
+    logger.info(f"EVENT: {event.info()}")
+
+
 if __name__ == "__main__":
     get_timer()
+    args = get_args()
 
     # input_dir = None
     dialog_single_file = False
 
     files_dir = get_directory(dir_path=input_dir, dialog_single_file=dialog_single_file)
     files, _ = get_files(files_dir)
-    files_dict = read_files(
-        files, AuthorIsUser=True
-    )  # AuthorIsUser not implemented yet
-    process_outcome(files_dict, None)
+    if args.profile == "mem":
+        start_memory_profile()
+    if args.scan:
+        files_dict = scan_files(files)
+    elif args.follow:
+        follow_path = max(files, key=os.path.getmtime)
+        files_dict = {
+            0: follow_file(
+                follow_path,
+                AuthorIsUser=True,
+                event_listener=log_event,
+                idle_timeout=args.idle_timeout,
+            )
+        }
+    elif args.profile == "cpu":
+        files_dict = profile_read_files(files, AuthorIsUser=True)
+    else:
+        files_dict = read_files(
+            files, AuthorIsUser=True, workers=args.workers
+        )  # AuthorIsUser not implemented yet
+    if args.profile == "mem":
+        log_memory_snapshot("parsed")
+    process_outcome(files_dict)
+    if args.profile == "mem":
+        log_memory_snapshot("written")
     end_time = get_timer()
     logger.info(
         f"END\n\t{'Total Time: ':>24}{end_time:.6f}\n\t{'Average Time per File: ':>24}{end_time / len(files_dict):.6f}"
@@ -0,0 +1,128 @@
+"""Benchmarks the NumPy distance kernels of coordUtils against their scalar versions (accuracy and throughput).\n
+Run from the project root: python -m src.benchmarks.distanceBenchmark"""
+
+from src.managers.logHandler import logger
+import random
+import time
+import numpy as np
+from src.utils.coordUtils import (
+    coords_to_distance,
+    coords_to_haversine_distance_updated,
+    coords_to_haversine_distance_matrix,
+    coords_to_haversine_distances,
+    get_closest_obj_distances,
+    positions_to_distance_matrix,
+    positions_to_distances,
+)
+from src.data.valueReferences import closest_obj_alt_division
+
+units = ["nm", "km", "mi", "m", "ft"]
+
+
+def get_random_points(count: int, seed: int = 0) -> tuple[list, list]:
+    """Returns count random [lat, long, alt] points (over 4x4 degrees) and count random [U, V, alt] positions (over 400x400 km)."""
+    rng = random.Random(seed)
+    points = [
+        [rng.uniform(40, 44), rng.uniform(34, 38), rng.uniform(0, 10_000)]
+        for _ in range(count)
+    ]
+    positions = [
+        [rng.uniform(-200_000, 200_000), rng.uniform(-200_000, 200_000), alt]
+        for _, _, alt in points
+    ]
+    return points, positions
+
+
+def get_max_relative_error(scalar_dists: list, kernel_dists: np.ndarray) -> float:
+    """Returns the largest relative difference between scalar_dists and kernel_dists."""
+    scalar_dists = np.asarray(scalar_dists)
+    return float(
+        np.max(np.abs(kernel_dists - scalar_dists) / np.maximum(scalar_dists, 1e-12))
+    )
+
+
+def time_function(function, *args) -> tuple[float, object]:
+    """Returns the time taken to call function(*args), and its result."""
+    start_time = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start_time, result
+
+
+def run_benchmark(point_count: int = 100_000, matrix_size: int = 500):
+    """Logs the largest relative error (all units) and speed-up of each kernel vs its scalar version.\n
+    One-to-many kernels use point_count points, many-to-many kernels use matrix_size x matrix_size points (kernels are given arrays).
+    """
+    points, positions = get_random_points(point_count)
+    results = []  # [name, max relative error, scalar time, kernel time]
+    for name, scalar, kernel, values in [
+        ("Euclidean (U/V/alt)", coords_to_distance, positions_to_distances, positions),
+        (
+            "Haversine",
+            coords_to_haversine_distance_updated,
+            coords_to_haversine_distances,
+            points,
+        ),
+    ]:
+        error = 0.0
+        for unit in units:
+            scalar_time, scalar_dists = time_function(
+                lambda: [scalar(values[0], value, unit) for value in values]
+            )
+            kernel_time, kernel_dists = time_function(
+                kernel, values[0], np.asarray(values), unit
+            )
+            error = max(error, get_max_relative_error(scalar_dists, kernel_dists))
+        results.append([f"{name} 1:{point_count}", error, scalar_time, kernel_time])
+
+    for name, scalar, kernel, values in [
+        (
+            "Euclidean (U/V/alt)",
+            coords_to_distance,
+            positions_to_distance_matrix,
+            positions[:matrix_size],
+        ),
+        (
+            "Haversine",
+            coords_to_haversine_distance_updated,
+            coords_to_haversine_distance_matrix,
+            points[:matrix_size],
+        ),
+    ]:
+        scalar_time, scalar_dists = time_function(
+            lambda: [[scalar(a, b) for b in values] for a in values]
+        )
+        kernel_time, kernel_dists = time_function(
+            kernel, np.asarray(values), np.asarray(values)
+        )
+        error = get_max_relative_error(scalar_dists, kernel_dists)
+        results.append(
+            [f"{name} {matrix_size}:{matrix_size}", error, scalar_time, kernel_time]
+        )
+
+    def scalar_closest(pos, others):
+        return [
+            abs(pos[0] - other[0])
+            + abs(pos[1] - other[1])
+            + abs(pos[2] - other[2]) / closest_obj_alt_division
+            for other in others
+        ]
+
+    scalar_time, scalar_dists = time_function(scalar_closest, points[0], points)
+    kernel_time, kernel_dists = time_function(
+        get_closest_obj_distances, points[0], np.asarray(points)
+    )
+    if kernel_dists.tolist() != scalar_dists:
+        raise ValueError("get_closest_obj_distances differs from scalar distances")
+    results.append([f"get_closest_obj 1:{point_count}", 0.0, scalar_time, kernel_time])
+
+    logger.info(
+        "\n\tDistance kernel benchmark (max relative error over all units, scalar time, kernel time)"
+        + "".join(
+            f"\n\t{name + ': ':>32}{error:.1e} {scalar_time:.3f}s {kernel_time:.4f}s ({scalar_time / kernel_time:.0f}x)"
+            for name, error, scalar_time, kernel_time in results
+        )
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
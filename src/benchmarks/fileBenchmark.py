@@ -0,0 +1,44 @@
+"""Benchmarks reading (processing) recordings, reporting the best time of several runs per file.\n
+Run from the project root: python -m src.benchmarks.fileBenchmark [files...] (defaults to the test data)"""
+
+from src.managers.logHandler import logger
+import os
+import sys
+import time
+from src.managers.fileManager import read_files
+
+benchmark_data_dir = "src/tests/test_data"
+
+
+def time_read_files(files: list[str], repeats: int = 3) -> dict:
+    """Returns {file: best time} of reading each file repeats times."""
+    file_times = {}
+    for file in files:
+        run_times = []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            read_files([file], AuthorIsUser=True)
+            run_times.append(time.perf_counter() - start_time)
+        file_times[file] = min(run_times)
+    return file_times
+
+
+def run_benchmark(files: list[str] = None, repeats: int = 3):
+    """Logs the best time (of repeats) to read each file, and the total."""
+    if not files:
+        files = [
+            f"{benchmark_data_dir}/{file_name}"
+            for file_name in sorted(os.listdir(benchmark_data_dir))
+        ]
+    file_times = time_read_files(files, repeats)
+    results = "".join(
+        f"\n\t{file_time:>10.4f}s  {os.path.basename(file)}"
+        for file, file_time in file_times.items()
+    )
+    logger.info(
+        f"\n\tFile benchmark (best of {repeats}):{results}\n\t{sum(file_times.values()):>10.4f}s  Total"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1:])
@@ -0,0 +1,129 @@
+"""Benchmarks kill attribution (dataProcessor.process_file_tick) with hundreds of simultaneous deaths (e.g.: cluster bombs),
+and ticks vs sweep attribution (dataProcessor.sweep_kill_attribution) over a recording with thousands of engagements.\n
+Run from the project root: python -m src.benchmarks.killBenchmark"""
+
+from src.managers.logHandler import logger
+import random
+import time
+from src.classes.FileData import FileData
+from src.managers.dataProcessor import process_file_tick, sweep_kill_attribution
+from src.managers.fileManager import process_file
+
+
+def get_mass_death_file_data(cluster_count: int, cluster_size: int, seed: int = 0):
+    """Returns FileData with cluster_count clusters of cluster_size vehicles, each hit by a bomblet, all dying in the same tick."""
+    rng = random.Random(seed)
+    file_data = FileData()
+    file_data.file_name = "KILL_BENCHMARK.txt.acmi"
+    file_data.set_time(1.0)
+    dying_objs = []
+    for cluster in range(cluster_count):
+        cluster_lat, cluster_long = rng.uniform(0, 2), rng.uniform(0, 2)
+        for index in range(cluster_size):
+            lat = cluster_lat + rng.uniform(-0.02, 0.02)
+            long = cluster_long + rng.uniform(-0.02, 0.02)
+            victim = file_data.new_obj(f"v{cluster}_{index}")
+            victim.type = ["Ground", "Vehicle"]
+            victim.update_transform(str(lat), str(long), "0")
+            bomblet = file_data.new_obj(f"b{cluster}_{index}")
+            bomblet.type = ["Weapon", "Bomb"]
+            bomblet.update_transform(str(lat + 0.0005), str(long), "2")
+            dying_objs += [bomblet, victim]
+    rng.shuffle(dying_objs)
+    for obj in dying_objs:
+        obj.update_to_dying()
+    file_data.set_time(2.0)
+    return file_data
+
+
+def time_file_tick(cluster_count: int, cluster_size: int) -> tuple[float, int]:
+    """Returns the time of one process_file_tick over the mass death, and the number of kills attributed."""
+    file_data = get_mass_death_file_data(cluster_count, cluster_size)
+    start_time = time.perf_counter()
+    process_file_tick(file_data)
+    tick_time = time.perf_counter() - start_time
+    kills = sum(1 for obj in file_data.dead_objects.values() if obj.killer_weapon)
+    return tick_time, kills
+
+
+def get_engagement_lines(
+    duration: int, engagements_per_second: float, seed: int = 0
+) -> list:
+    """Returns acmi lines of duration seconds (a time frame every 0.2 seconds), with engagements_per_second bombs or shells dying near a new target.\n
+    Two thirds of targets are removed within a few seconds of the weapon (killed), the rest are missed.
+    """
+    rng = random.Random(seed)
+    lines = ["FileType=text/acmi/tacview\n", "FileVersion=2.1\n"]
+    frames = {}  # frame:lines
+    frame_count = duration * 5
+    for engagement in range(int(duration * engagements_per_second)):
+        frame = rng.randrange(5, frame_count - 50)
+        lat, long = rng.uniform(0, 2), rng.uniform(0, 2)
+        frames.setdefault(frame - 5, []).append(
+            f"t{engagement},T={long}|{lat}|0,Type=Ground+Vehicle\n"
+        )
+        killed = rng.random() < 2 / 3
+        offset = rng.uniform(-0.001, 0.001) if killed else 0.02
+        types = rng.choice(["Weapon+Bomb", "Projectile+Shell"])
+        frames.setdefault(frame, []).append(
+            f"w{engagement},T={long + offset}|{lat}|2,Type={types}\n"
+        )
+        death_frame = frame + rng.randint(0, 10)
+        frames.setdefault(death_frame, []).append(f"-w{engagement}\n")
+        if killed:
+            frames.setdefault(death_frame + rng.randint(0, 10), []).append(
+                f"-t{engagement}\n"
+            )
+    for frame in range(frame_count):
+        lines.append(f"#{frame / 5}\n")
+        lines += frames.get(frame, [])
+    return lines
+
+
+def time_kill_attribution(lines: list, sweep: bool) -> tuple[float, float, int]:
+    """Returns the time to read lines with ticks (or sweep attribution, including the sweep), the time of the sweep alone, and the number of kills."""
+    file_data = FileData()
+    file_data.file_name = "KILL_BENCHMARK.txt.acmi"
+    file_data.sweep_attribution = sweep
+    start_time = time.perf_counter()
+    process_file(file_data, iter(lines), AuthorIsUser=True)
+    sweep_start_time = time.perf_counter()
+    if sweep:
+        sweep_kill_attribution(file_data)
+    end_time = time.perf_counter()
+    kills = sum(1 for obj in file_data.get_all_objs() if obj.killer_weapon)
+    return end_time - start_time, end_time - sweep_start_time, kills
+
+
+def run_benchmark(cluster_size: int = 20, cluster_counts: tuple = (5, 15, 50)):
+    """Logs the tick time of each number of clusters (deaths = 2 x cluster count x cluster size)."""
+    results = ""
+    for cluster_count in cluster_counts:
+        tick_time, kills = time_file_tick(cluster_count, cluster_size)
+        deaths = 2 * cluster_count * cluster_size
+        results += f"\n\t{deaths:>6} deaths: {tick_time:>8.4f}s ({kills} kills)"
+    logger.info(f"\n\tKill attribution benchmark (one tick):{results}")
+
+
+def run_sweep_benchmark(
+    duration: int = 3600, engagement_rates: tuple = (0.5, 2, 8), repeats: int = 3
+):
+    """Logs the fastest read time of a recording of each engagement rate with ticks vs sweep attribution."""
+    results = ""
+    for engagement_rate in engagement_rates:
+        lines = get_engagement_lines(duration, engagement_rate)
+        mode_times = {}
+        for sweep in [False, True]:
+            times = [time_kill_attribution(lines, sweep) for _ in range(repeats)]
+            mode_times[sweep] = min(times)
+        tick_time, _, tick_kills = mode_times[False]
+        sweep_time, pass_time, sweep_kills = mode_times[True]
+        results += f"\n\t{engagement_rate:>4} engagements/s: ticks {tick_time:.3f}s ({tick_kills} kills), sweep {sweep_time:.3f}s ({sweep_kills} kills, pass {pass_time:.3f}s) - {tick_time / sweep_time:.2f}x"
+    logger.info(
+        f"\n\tKill attribution benchmark (ticks vs sweep, {duration}s recordings):{results}"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
+    run_sweep_benchmark()
@@ -0,0 +1,60 @@
+"""Benchmarks missile launcher lookups with FileData.object_grid vs a linear scan of all alive objects.\n
+Run from the project root: python -m src.benchmarks.launcherBenchmark"""
+
+from src.managers.logHandler import logger
+import random
+import time
+from src.classes.FileData import FileData
+from src.data.valueReferences import max_launch_distance
+from src.utils.coordUtils import get_closest_obj, get_closest_obj_in_grid
+
+
+def get_busy_file_data(object_count: int, seed: int = 0) -> FileData:
+    """Returns FileData with object_count alive objects spread over a 4x4 degree area (a large server)."""
+    rng = random.Random(seed)
+    file_data = FileData()
+    for index in range(object_count):
+        obj = file_data.new_obj(f"{index + 1:x}")
+        obj.update_transform(
+            str(rng.uniform(0, 4)), str(rng.uniform(0, 4)), str(rng.uniform(0, 10_000))
+        )
+    return file_data
+
+
+def run_benchmark(object_count: int = 5_000, launch_count: int = 500):
+    """Logs the time of launch_count launcher lookups amongst object_count alive objects, with and without the grid."""
+    file_data = get_busy_file_data(object_count)
+    launchers = random.Random(1).sample(list(file_data.objects.values()), launch_count)
+    missiles = []
+    for launcher in launchers:
+        missile = file_data.new_obj(f"m{launcher.id}")
+        lat, long, alt = launcher.get_pos()
+        missile.update_transform(str(lat + 0.0001), str(long), str(alt - 5))
+        missiles.append(missile)
+
+    start_time = time.perf_counter()
+    scan_results = []
+    for missile in missiles:
+        closest_obj, dist = get_closest_obj(missile, list(file_data.objects.values()))
+        scan_results.append(closest_obj if dist <= max_launch_distance else None)
+    scan_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    grid_results = [
+        get_closest_obj_in_grid(missile, file_data.object_grid, max_launch_distance)[0]
+        for missile in missiles
+    ]
+    grid_time = time.perf_counter() - start_time
+
+    if grid_results != scan_results:
+        raise ValueError("Grid launchers differ from linear scan launchers")
+    logger.info(
+        f"\n\tLauncher benchmark ({launch_count} launches, {len(file_data.objects)} alive objects)"
+        f"\n\t{'Linear scan: ':>15}{scan_time:.3f}s"
+        f"\n\t{'Object grid: ':>15}{grid_time:.3f}s"
+        f"\n\t{'Speed-up: ':>15}{scan_time / grid_time:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,85 @@
+"""Benchmarks the parse time spent on logging with handlers at INFO: lazy (level guarded) vs eager (every message built) vs disabled.\n
+Run from the project root: python -m src.benchmarks.loggingBenchmark [files]"""
+
+from src.managers.logHandler import logger
+import logging
+import sys
+import time
+from src.managers.fileManager import read_files
+
+benchmark_files = [
+    "src/tests/test_data/Tacview-20230620-222105-DCS-PG-AA-Trainer-Modern-v2.6.zip.acmi"
+]
+
+
+class DroppedRecordCounter(logging.Filter):
+    """Logger filter counting records below minimum_level (built, then dropped by every handler at minimum_level)."""
+
+    def __init__(self, minimum_level: int = logging.INFO):
+        super().__init__()
+        self.minimum_level = minimum_level
+        self.count = 0
+
+    def filter(self, record):
+        if record.levelno < self.minimum_level:
+            self.count += 1
+        return True
+
+
+def time_read_file(file: str) -> float:
+    """Returns the CPU time (of this process, so less affected by other load) taken to read file."""
+    start_time = time.process_time()
+    read_files([file], AuthorIsUser=True)
+    return time.process_time() - start_time
+
+
+def set_logging_mode(mode: str):
+    """Sets logger to a logging mode (handlers are left as they are).\n
+    Lazy: level from handlers (see Logger.update_level). Eager: level 0, so every message is built, then dropped by the handlers. Disabled: no messages.
+    """
+    logger.disabled = mode == "Disabled"
+    if mode == "Eager":
+        logger.setLevel(0)
+    else:
+        logger.update_level()
+
+
+def time_logging_modes(file: str, repeats: int = 5) -> tuple[dict, int]:
+    """Returns {mode: fastest read time} of file with all handlers at INFO (modes are interleaved, so each sees similar machine load),
+    and the number of records built then dropped per read when Eager."""
+    modes = ["Lazy", "Eager", "Disabled"]
+    mode_times = {mode: [] for mode in modes}
+    handler_levels = [handler.level for handler in logger.handlers]
+    counter = DroppedRecordCounter()
+    try:
+        for handler in logger.handlers:
+            handler.setLevel(logging.INFO)
+        for _ in range(repeats):
+            for mode in modes:
+                set_logging_mode(mode)
+                mode_times[mode].append(time_read_file(file))
+        set_logging_mode("Eager")
+        logger.addFilter(counter)
+        time_read_file(file)
+    finally:
+        logger.removeFilter(counter)
+        for handler, level in zip(logger.handlers, handler_levels):
+            handler.setLevel(level)
+        set_logging_mode("Lazy")
+    return {mode: min(times) for mode, times in mode_times.items()}, counter.count
+
+
+def run_benchmark(files: list[str] = benchmark_files, repeats: int = 5):
+    """Logs the read time of each file per logging mode, and the time spent on logging (vs Disabled)."""
+    for file in files:
+        mode_times, dropped_count = time_logging_modes(file, repeats)
+        disabled_time = mode_times["Disabled"]
+        message = f"\n\tLogging benchmark (handlers at INFO, fastest of {repeats} CPU times) {file}"
+        message += f"\n\t{dropped_count:,} records below INFO built and dropped per read when Eager"
+        for mode, mode_time in mode_times.items():
+            message += f"\n\t{mode + ': ':>10}{mode_time:.3f}s (logging {mode_time - disabled_time:+.3f}s, {(mode_time / disabled_time - 1) * 100:+.1f}%)"
+        logger.info(message)
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1:] or benchmark_files)
@@ -0,0 +1,43 @@
+"""Reports memory per DCSObject (traced with tracemalloc) held after reading a recording.\n
+Run from the project root: python -m src.benchmarks.memoryBenchmark [files]"""
+
+from src.managers.logHandler import logger
+import sys
+import tracemalloc
+from src.managers.fileManager import read_files
+
+benchmark_files = [
+    "src/tests/test_data/Tacview-20230620-222105-DCS-PG-AA-Trainer-Modern-v2.6.zip.acmi"
+]
+# files allocating the objects (instances, containers) and their attribute values (strings)
+object_files = ["DCSObject.py", "lineHandler.py", "tokenUtils.py"]
+
+
+def get_object_memory(file: str) -> tuple[int, int, int]:
+    """Returns the number of objects in file, and the memory (bytes) held after reading it: allocated in object_files, and in total."""
+    tracemalloc.start()
+    file_data = read_files([file], AuthorIsUser=True)[0]
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    object_memory = 0
+    total_memory = 0
+    for statistic in snapshot.statistics("filename"):
+        total_memory += statistic.size
+        if statistic.traceback[0].filename.endswith(tuple(object_files)):
+            object_memory += statistic.size
+    return len(file_data.all_objects), object_memory, total_memory
+
+
+def run_benchmark(files: list[str] = benchmark_files):
+    """Logs the memory per object held after reading each file."""
+    for file in files:
+        object_count, object_memory, total_memory = get_object_memory(file)
+        logger.info(
+            f"\n\tMemory benchmark ({object_count:,} objects) {file}"
+            f"\n\t{'Objects: ':>10}{object_memory / object_count:,.0f} bytes per object ({object_memory / 1024 / 1024:.1f} MB)"
+            f"\n\t{'Total: ':>10}{total_memory / object_count:,.0f} bytes per object ({total_memory / 1024 / 1024:.1f} MB)"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1:] or benchmark_files)
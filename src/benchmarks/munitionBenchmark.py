@@ -0,0 +1,87 @@
+"""Benchmarks munition metrics (analyticsUtils.get_munition_metrics, including closest approaches to every candidate aircraft) of a recording with thousands of launches.\n
+Run from the project root: python -m src.benchmarks.munitionBenchmark"""
+
+from src.managers.logHandler import logger
+import random
+import time
+from src.classes.FileData import FileData
+from src.classes.TrackStore import TrackStore
+from src.managers.fileManager import process_file
+from src.utils.analyticsUtils import get_munition_metrics
+
+
+def get_launch_heavy_lines(
+    aircraft_count: int, launch_count: int, launches_per_second: int = 5
+):
+    """Yields the lines of a recording with aircraft_count aircraft (two coalitions) launching launch_count missiles (each flying for 30 seconds)."""
+    rng = random.Random(0)
+    yield "FileType=text/acmi/tacview\n"
+    yield "FileVersion=2.1\n"
+    yield "0,ReferenceLongitude=50\n"
+    yield "0,ReferenceLatitude=25\n"
+    aircraft = {}  # id:[lat, long, alt, coalition]
+    for index in range(aircraft_count):
+        aircraft[f"{index + 1:x}"] = [
+            rng.uniform(0, 2),
+            rng.uniform(0, 2),
+            rng.uniform(1_000, 10_000),
+            "Allies" if index % 2 else "Enemies",
+        ]
+    missiles = {}  # id:[launch time, lat, long, alt, coalition]
+    missile_counter = 0x100000
+    time_stamp = 0
+    while missile_counter - 0x100000 < launch_count or missiles:
+        yield f"#{time_stamp}\n"
+        for id, (lat, long, alt, coalition) in aircraft.items():
+            lat += 0.002
+            aircraft[id][0] = lat
+            new = time_stamp == 0
+            yield f"{id},T={long:.7f}|{lat:.7f}|{alt:.1f}" + (
+                f",Type=Air+FixedWing,Name=F-16C_50,Coalition={coalition}\n"
+                if new
+                else "\n"
+            )
+        for id, (launch_time, lat, long, alt, coalition) in list(missiles.items()):
+            if time_stamp - launch_time >= 30:
+                missiles.pop(id)
+                yield f"-{id}\n"
+                continue
+            lat += 0.008
+            missiles[id][1] = lat
+            yield f"{id},T={long:.7f}|{lat:.7f}|{alt:.1f}\n"
+        for _ in range(launches_per_second):
+            if missile_counter - 0x100000 >= launch_count:
+                break
+            launcher = rng.choice(list(aircraft))
+            lat, long, alt, coalition = aircraft[launcher]
+            id = f"{missile_counter:x}"
+            missile_counter += 1
+            missiles[id] = [time_stamp, lat + 0.0001, long, alt, coalition]
+            yield f"{id},T={long:.7f}|{lat + 0.0001:.7f}|{alt:.1f},Type=Weapon+Missile,Name=AIM_120C,Coalition={coalition}\n"
+        time_stamp += 1
+
+
+def run_benchmark(aircraft_count: int = 200, launch_count: int = 2_000):
+    """Logs the time to read a recording with launch_count launches (tracking Air and Missile), and to get its munition metrics."""
+    file_data = FileData()
+    file_data.file_name = "MUNITION_BENCHMARK.txt.acmi"
+    file_data.track_store = TrackStore(["Air", "Missile"], 1024)
+    start_time = time.perf_counter()
+    process_file(
+        file_data,
+        get_launch_heavy_lines(aircraft_count, launch_count),
+        AuthorIsUser=True,
+    )
+    read_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    metrics = get_munition_metrics(file_data)
+    metrics_time = time.perf_counter() - start_time
+    logger.info(
+        f"\n\tMunition metrics benchmark ({len(metrics)} munitions, {aircraft_count} aircraft, {file_data.track_store.sample_count:,} track samples)"
+        f"\n\t{'Read file: ':>17}{read_time:.3f}s"
+        f"\n\t{'Munition metrics: ':>17}{metrics_time:.3f}s ({metrics_time / read_time:.1%} of read)"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,111 @@
+"""Benchmarks processing a shell-heavy recording with compact DCSShell records vs full DCSObjects.\n
+Run from the project root: python -m src.benchmarks.shellBenchmark"""
+
+from src.managers.logHandler import logger
+import os
+import time
+import tempfile
+from unittest.mock import patch
+from src.managers import lineHandler
+from src.managers.fileManager import read_files, read_file_lines, is_zip
+
+benchmark_source_file = (
+    "src/tests/test_data/Tacview-20230620-222105-DCS-PG-AA-Trainer-Modern-v2.6.zip.acmi"
+)
+
+
+def get_shell_heavy_lines(
+    source_file: str,
+    duration: float = 120.0,
+    shells_per_second: float = 20.0,
+    shell_life: float = 3.0,
+    kill_interval: float = 10.0,
+):
+    """Yields the first duration seconds of source_file's lines, with shells_per_second gun shells added (each removed after shell_life seconds).\n
+    Every kill_interval seconds a (ground vehicle) victim is spawned, then removed alongside a shell at its position.
+    """
+    shell_counter = 0xF0000000  # ids unused by the source file
+    alive_shells = {}  # id:[spawn time, lat, long]
+    victim = None  # [id, removal time, lat, long]
+    next_victim_time = None
+    first_time_stamp = None
+    # shells to spawn (fractional, as frames are shorter than the interval between shells)
+    shells_due = 0.0
+    for line in read_file_lines(source_file, is_zip(source_file)):
+        if not line.startswith("#"):
+            yield line
+            continue
+        time_stamp = float(line[1:])
+        if first_time_stamp is None:
+            first_time_stamp, last_time_stamp = time_stamp, time_stamp
+            next_victim_time = time_stamp + kill_interval
+        if time_stamp - first_time_stamp > duration:
+            return
+        yield line
+        for id, (spawn_time, lat, long) in list(alive_shells.items()):
+            if time_stamp - spawn_time > shell_life:
+                alive_shells.pop(id)
+                yield f"-{id:x}\n"
+            else:
+                lat += 0.0001
+                alive_shells[id][1] = lat
+                yield f"{id:x},T={long:.7f}|{lat:.7f}|500\n"
+        if victim and time_stamp >= victim[1]:
+            id, _, lat, long = victim
+            yield f"-{id:x}\n"
+            yield f"{shell_counter:x},T={long:.7f}|{lat:.7f}|2,Type=Weapon+Projectile+Shell,Name=M61_20_HE,Coalition=Enemies\n"
+            yield f"-{shell_counter:x}\n"
+            shell_counter += 1
+            victim = None
+        if time_stamp >= next_victim_time:
+            lat, long = 8 + (time_stamp % 1), 6.0
+            victim = [shell_counter, time_stamp + shell_life, lat, long]
+            yield f"{shell_counter:x},T={long:.7f}|{lat:.7f}|0,Type=Ground+Vehicle,Name=M 818,Coalition=Allies\n"
+            shell_counter += 1
+            next_victim_time += kill_interval
+        shells_due += (time_stamp - last_time_stamp) * shells_per_second
+        last_time_stamp = time_stamp
+        while shells_due >= 1:
+            shells_due -= 1
+            lat, long = 7 + (shell_counter % 100) / 1000, 5.0
+            alive_shells[shell_counter] = [time_stamp, lat, long]
+            yield f"{shell_counter:x},T={long:.7f}|{lat:.7f}|500,Type=Weapon+Projectile+Shell,Name=M61_20_HE,Color=Blue,Coalition=Enemies,Country=us\n"
+            shell_counter += 1
+
+
+def time_read_file(file: str) -> tuple[float, int]:
+    """Returns the time taken to read file, and the number of kills attributed to shells."""
+    start_time = time.perf_counter()
+    file_data = read_files([file], AuthorIsUser=True)[0]
+    end_time = time.perf_counter()
+    victims = [
+        obj
+        for obj in file_data.dead_objects.values()
+        if obj.killer_weapon and "Shell" in obj.killer_weapon.type
+    ]
+    return end_time - start_time, len(victims)
+
+
+def run_benchmark(shells_per_second: float = 20.0):
+    """Logs the time to process a shell-heavy recording, with compact shells and with shells as full DCSObjects."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        shell_file = f"{temp_dir}/SHELL_BENCHMARK.txt.acmi"
+        with open(shell_file, "w", encoding="utf-8") as f:
+            f.writelines(
+                get_shell_heavy_lines(
+                    benchmark_source_file, shells_per_second=shells_per_second
+                )
+            )
+        compact_time, compact_kills = time_read_file(shell_file)
+        with patch.object(lineHandler, "compact_types_mask", 0):
+            full_time, full_kills = time_read_file(shell_file)
+        logger.info(
+            f"\n\tShell benchmark ({shells_per_second} shells per second, {os.path.getsize(shell_file) / 1024 / 1024:.1f} MB)"
+            f"\n\t{'DCSObject shells: ':>20}{full_time:.3f}s ({full_kills} shell kills)"
+            f"\n\t{'Compact shells: ':>20}{compact_time:.3f}s ({compact_kills} shell kills)"
+            f"\n\t{'Speed-up: ':>20}{full_time / compact_time:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,48 @@
+"""Microbenchmark of splitting real acmi lines into attributes: tokenUtils.split_attrs vs fileUtils.attr_split.\n
+Run from the project root: python -m src.benchmarks.tokenBenchmark"""
+
+from src.managers.logHandler import logger
+import timeit
+from src.utils.fileUtils import attr_split
+from src.utils.tokenUtils import split_attrs
+from src.managers.fileManager import read_file_lines, is_zip
+
+benchmark_source_file = (
+    "src/tests/test_data/Tacview-20230620-222105-DCS-PG-AA-Trainer-Modern-v2.6.zip.acmi"
+)
+
+
+def get_object_lines(source_file: str) -> list[str]:
+    """Returns all object lines (those split into attributes) of source_file."""
+    return [
+        line.rstrip("\n")
+        for line in read_file_lines(source_file, is_zip(source_file))
+        if not line.startswith(("FileType=", "FileVersion=", "0,", "#", "-"))
+    ]
+
+
+def time_split(split_function, lines: list[str], repeats: int = 5) -> float:
+    """Returns the best time (of repeats) to split all lines with split_function."""
+    return min(
+        timeit.repeat(
+            lambda: [split_function(line) for line in lines], number=1, repeat=repeats
+        )
+    )
+
+
+def run_benchmark(repeats: int = 5):
+    """Logs the time to split the object lines of the benchmark file with each tokenizer."""
+    lines = get_object_lines(benchmark_source_file)
+    escaped_lines = sum("\\," in line for line in lines)
+    reference_time = time_split(attr_split, lines, repeats)
+    split_time = time_split(split_attrs, lines, repeats)
+    logger.info(
+        f"\n\tToken benchmark ({len(lines):,} object lines, {escaped_lines} with escaped commas, best of {repeats})"
+        f"\n\t{'attr_split: ':>14}{reference_time:.4f}s ({reference_time / len(lines) * 1e6:.2f} us/line)"
+        f"\n\t{'split_attrs: ':>14}{split_time:.4f}s ({split_time / len(lines) * 1e6:.2f} us/line)"
+        f"\n\t{'Speed-up: ':>14}{reference_time / split_time:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,86 @@
+"""Benchmarks position at time queries on TrackStore tracks, with bisect / np.interp vs a linear scan of each track.\n
+Run from the project root: python -m src.benchmarks.trackQueryBenchmark"""
+
+from src.managers.logHandler import logger
+import random
+import time
+from array import array
+from math import nan
+from src.classes.TrackStore import TrackStore
+from src.data.coordReferences import track_fields
+
+
+def get_busy_track_store(object_count: int, sample_count: int) -> TrackStore:
+    """Returns TrackStore with object_count tracks of sample_count samples (one per second)."""
+    track_store = TrackStore(["Air"], 1024)
+    rng = random.Random(0)
+    for uid in range(object_count):
+        start = [rng.uniform(0, 4), rng.uniform(0, 4), rng.uniform(0, 10_000)]
+        track_store.tracks[uid] = [array("d", range(sample_count))] + [
+            array("d", (value + second / 1000 for second in range(sample_count)))
+            for value in start
+        ]
+        # u, v, heading are unset
+        track_store.tracks[uid] += [
+            array("d", [nan] * sample_count) for _ in track_fields[4:]
+        ]
+    return track_store
+
+
+def scan_sample_at(track: list, time: float) -> list[float]:
+    """Returns [lat, long, alt] of track at time, found by a linear scan of its times."""
+    times = track[0]
+    for index in range(1, len(times)):
+        if times[index] >= time:
+            ratio = (time - times[index - 1]) / (times[index] - times[index - 1])
+            return [
+                track[column][index - 1]
+                + (track[column][index] - track[column][index - 1]) * ratio
+                for column in (1, 2, 3)
+            ]
+
+
+def run_benchmark(
+    object_count: int = 200, sample_count: int = 3_600, query_count: int = 50
+):
+    """Logs the time of query_count position queries of every track (object_count tracks of sample_count samples).\n
+    Compares a linear scan, bisect (TrackStore.get_sample_at), and the batched np.interp (TrackStore.get_track_at).
+    """
+    track_store = get_busy_track_store(object_count, sample_count)
+    rng = random.Random(1)
+    times = [rng.uniform(1, sample_count - 1) for _ in range(query_count)]
+    start_time = time.perf_counter()
+    scan_results = [
+        [scan_sample_at(track, query_time) for query_time in times]
+        for track in track_store.tracks.values()
+    ]
+    scan_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    bisect_results = [
+        [track_store.get_sample_at(uid, query_time) for query_time in times]
+        for uid in track_store.tracks
+    ]
+    bisect_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    batch_results = [
+        track_store.get_track_at(uid, times).tolist() for uid in track_store.tracks
+    ]
+    batch_time = time.perf_counter() - start_time
+
+    for results in [bisect_results, batch_results]:
+        for scan_track, track in zip(scan_results, results):
+            for scan_sample, sample in zip(scan_track, track):
+                if any(abs(a - b) > 1e-6 for a, b in zip(scan_sample, sample)):
+                    raise ValueError("Track queries differ from linear scan")
+    logger.info(
+        f"\n\tTrack query benchmark ({query_count} queries of {object_count} tracks, {sample_count} samples each)"
+        f"\n\t{'Linear scan: ':>15}{scan_time:.3f}s"
+        f"\n\t{'Bisect: ':>15}{bisect_time:.3f}s ({scan_time / bisect_time:.1f}x)"
+        f"\n\t{'Batched: ':>15}{batch_time:.3f}s ({scan_time / batch_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
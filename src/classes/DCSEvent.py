@@ -1,3 +1,23 @@
 class DCSEvent:
+    """An event (e.g.: Launch, Kill) between DCSObjects, published by FileData to its event listeners."""
+
     def __init__(self, file_obj, time, type, object, coordinates, destination):
-        return
+        self.file_obj = (
+            file_obj  # FileData object of the TacView file this event occurred in
+        )
+        self.time = time  # uses acmi time stamp, not recording/mission time
+        self.type = type  # Launch (object launched destination) / Kill (object killed destination)
+        self.object = object  # DCSObject causing the event (launcher / weapon)
+        self.coordinates = coordinates  # [lat, long, alt] of event (munition at launch / victim at death)
+        self.destination = (
+            destination  # DCSObject the event was applied to (munition / victim)
+        )
+
+    def info(self):
+        """Returns string with event information."""
+        info = f"{self.type} - Time: {self.time} Position: {self.coordinates}"
+        for role, obj in [("Object", self.object), ("Destination", self.destination)]:
+            info += f"\n\t{role}: {obj.id} {obj.type} {obj.name} {obj.pilot}"
+            if obj.launcher:
+                info += f" (Launcher: {obj.launcher.id} {obj.launcher.name} {obj.launcher.pilot})"
+        return info
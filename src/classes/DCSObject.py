@@ -1,15 +1,93 @@
-from src.managers.logHandler import logger
-from src.utils.mathUtils import str_is_float
-from src.data.coordReferences import death_coords
+from src.managers.logHandler import logger, trace_level
+from array import array
+from math import nan
+from sys import intern
+from types import MappingProxyType
+from src.data.coordReferences import death_coords, kinematic_fields, transform_layouts
 from src.data.typeReferences import (
-    skip_dying_types,
-    skip_data_processing_types,
+    skip_dying_types_mask,
+    skip_data_processing_types_mask,
     all_known_types,
+    get_types_mask,
     valid_DCSObject_states,
 )
 
+# kinematics indices of each transform layout's fields
+transform_layout_indices = {
+    field_count: tuple(kinematic_fields.index(field) for field in fields)
+    for field_count, fields in transform_layouts.items()
+}
+# shared launches/kills of objects without any (replaced with a dict on first use)
+empty_mapping = MappingProxyType({})
+# Type= value:(type list (of interned strings), type flags), type lists are shared by all objects of that type - do not modify
+types_cache = {}
+lat_index = kinematic_fields.index("lat")
+long_index = kinematic_fields.index("long")
+position_slice = slice(
+    kinematic_fields.index("long"), kinematic_fields.index("alt") + 1
+)
+old_position_slice = slice(
+    kinematic_fields.index("long_old"), kinematic_fields.index("alt_old") + 1
+)
+
+
+def kinematic_property(field: str) -> property:
+    """Returns a property getting/setting field of DCSObject.kinematics (None if unset)."""
+    index = kinematic_fields.index(field)
+
+    def get_field(self):
+        value = self.kinematics[index]
+        return None if value != value else value  # NaN -> None
+
+    def set_field(self, value):
+        self.kinematics[index] = nan if value is None else value
+
+    return property(get_field, set_field, doc=f"{field} kinematic (None if unset)")
+
+
+def get_types(types: str) -> tuple[list, int]:
+    """Returns (type list, type flags) of a type string as found in .acmi (e.g.: "Air+FixedWing"), cached in types_cache.\n
+    The type list is shared by all objects of the same types, so must not be modified.
+    """
+    cached = types_cache.get(types)
+    if cached is None:
+        type_list = [intern(type) for type in types.split("+")]
+        for type in type_list:
+            if type not in all_known_types:
+                logger.critical(f"Unknown type: {type=}")
+        cached = types_cache[intern(types)] = (type_list, get_types_mask(type_list))
+    return cached
+
 
 class DCSObject:
+    __slots__ = (
+        "file_obj",  # FileData object of the TacView file this object belongs to
+        "id",  # the ID of this object (same as the one used in the TV file)
+        "uid",  # the unique ID of this object (from counter within file_obj)
+        # long, lat, alt, roll, pitch, yaw, u, v, heading, long_old, lat_old, alt_old (see coordReferences.kinematic_fields)
+        # lat/long exclude reference, alt in meters MSL // some naval units are never updated -> 0 is default alt
+        "kinematics",
+        "track",  # TrackStore columns of this object, if tracked (None once dead)
+        "type_list",  # the assigned type(s) of this object (e.g.: fixed-wing / projectile), see type
+        "type_flags",  # ObjectType flags (int) of type_list (see typeReferences.get_types_mask)
+        "coalition",  # coalition this object was assigned to
+        "name",  # name of this object (i.e.: the name set in the mission editor for objects)
+        "pilot",  # the name of the pilot (what about AI, WSO, and RIOs?)
+        "group",  # the name of the group the object was assigned to in the mission editor
+        "color",  # colour used in TacView (using American spelling for consistency)
+        "country",
+        "state",  # None, Alive, Dying (checking for any kill/ers), Dead
+        "launches",  # {id:obj} of all munitions launched by this object (empty_mapping until the first)
+        "kills",  # {weapon:victim} (empty_mapping until the first)
+        "killer",  # which 'launcher' this object was killed by (/collision)
+        "killer_weapon",  # the munition this object was killed by
+        "spawn_time_stamp",  # uses acmi time stamp, not recording/mission time
+        "death_time_stamp",  # uses acmi time stamp, not recording/mission time
+        "death_position",
+        "origin",  # lat, long, alt at spawn
+        "launcher",  # only for munitions
+    )
+
     def __init__(self, file_obj, id: str, uid: int, state: str = "Alive"):
         if not isinstance(id, str):
             raise TypeError(f"DCSObject init id is not string: {id=} {type(id)=}")
@@ -26,52 +104,30 @@ class DCSObject:
             raise TypeError(
                 f"DCSObject init file_obj is not FileData: {type(file_obj)}\n\t{file_obj=}"
             )
-        self.file_obj = (
-            file_obj  # FileData object of the TacView file this object belongs to
-        )
-        self.id = str(id)  # the ID of this object (same as the one used in the TV file)
+        self.file_obj = file_obj
+        self.id = str(id)
         if uid != file_obj.uid_counter:
             raise ValueError(
                 f"DCSObject init uid is not equal to file_obj.uid_counter: {uid=} {file_obj.uid_counter=}"
             )
-        self.uid = uid  # the unique ID of this object (from counter within file_obj)
-        self.lat = (
-            None  # the most recent latitude of this object (doesn't include reference)
-        )
-        self.long = (
-            None  # the most recent latitude of this object (doesn't include reference)
-        )
-        self.alt = 0  # the most recent altitude in meters MSL // some naval units are never updated -> 0 is default
-        self.lat_old = (
-            None  # the latitude value at the previous coordinate update of this object
-        )
-        self.long_old = (
-            None  # the longitude value at the previous coordinate update of this object
-        )
-        self.alt_old = (
-            None  # the altitude value at the previous coordinate update of this object
-        )
-        self.u = None
-        self.v = None
-        self.type = (
-            None  # the assigned type(s) of this object (e.g.: fixed-wing / projectile)
-        )
+        self.uid = uid
+        self.kinematics = array("d", [nan, nan, 0] + [nan] * 9)
+        self.track = None
+        self.type = None
         # self.U = None # native x (2D world - unsure if used in DCS TV)
         # self.V = None # native y (2D world - unsure if used in DCS TV)
-        self.coalition = None  # coalition this object was assigned to
-        self.name = None  # name of this object (i.e.: the name set in the mission editor for objects)
-        self.pilot = None  # the name of the pilot (what about AI, WSO, and RIOs?)
-        self.group = None  # the name of the group the object was assigned to in the mission editor
+        self.coalition = None
+        self.name = None
+        self.pilot = None
+        self.group = None
         # self.group_members = [] # the other members of the group this object was assigned
-        self.color = (
-            None  # colour used in TacView (using American spelling for consistency)
-        )
+        self.color = None
         self.country = None
-        self.state = state  # None, Alive, Dying (checking for any kill/ers), Dead
-        self.launches = {}  # {id:obj} of all munitions launched by this object
-        self.kills = {}  # {weapon:victim}
-        self.killer = None  # which 'launcher' this object was killed by (/collision)
-        self.killer_weapon = None  # the munition this object was killed by
+        self.state = state
+        self.launches = empty_mapping
+        self.kills = empty_mapping
+        self.killer = None
+        self.killer_weapon = None
         # self.landed = None  # boolean
         # self.obj_events = []
         # self.carrier = None  # boolean
@@ -81,37 +137,74 @@ class DCSObject:
         # self.difficulty = (
         #     None  # FUTUREDO will need to get information on a server basis
         # )
-        self.spawn_time_stamp = (
-            file_obj.time_stamp  # FUTUREDO not ideal for testing as requires FileData
-        )  # uses acmi time stamp, not recording/mission time
-        self.death_time_stamp = None  # uses acmi time stamp, not recording/mission time
+        # FUTUREDO not ideal for testing as requires FileData
+        self.spawn_time_stamp = file_obj.time_stamp
+        self.death_time_stamp = None
         self.death_position = None
-        self.origin = []  # lat, long, alt at spawn
-        self.launcher = None  # only for munitions
+        self.origin = []
+        self.launcher = None
+
+    lat = kinematic_property(
+        "lat"
+    )  # the most recent latitude (doesn't include reference)
+    long = kinematic_property(
+        "long"
+    )  # the most recent longitude (doesn't include reference)
+    alt = kinematic_property("alt")  # the most recent altitude in meters MSL
+    roll = kinematic_property("roll")
+    pitch = kinematic_property("pitch")
+    yaw = kinematic_property("yaw")
+    u = kinematic_property("u")  # native x (flat world)
+    v = kinematic_property("v")  # native y (flat world)
+    heading = kinematic_property("heading")
+    lat_old = kinematic_property(
+        "lat_old"
+    )  # latitude at the previous coordinate update
+    long_old = kinematic_property("long_old")
+    alt_old = kinematic_property("alt_old")
+
+    @property
+    def type(self):
+        """The assigned type(s) of this object (e.g.: ["Air", "FixedWing"]), setting also updates type_flags."""
+        return self.type_list
+
+    @type.setter
+    def type(self, types: list):
+        self.type_list = types
+        self.type_flags = 0 if types is None else get_types_mask(types)
 
     def update_transform(self, lat: str, long: str, alt: str):
         """Updates this object's coordinates and altitude (str floats) based on the latest coordinate update from the TacView file."""
-        num_check = [lat, long, alt]
-        check_list = [
-            c for c in num_check if c != ""
-        ]  # often only a single unit is updated
-        for value in check_list:
-            if not str_is_float(value):
-                raise TypeError(f"transform is not numeric: {lat=} {long=} {alt=}")
-        self.lat_old, self.long_old, self.alt_old = self.lat, self.long, self.alt
+        self.update_transform_fields([long, lat, alt])
+
+    def update_transform_fields(self, transformers: list[str]):
+        """Updates kinematics from the '|' separated fields of a T= value (3, 5, 6, or 9 fields) in one pass, after copying position to previous position.\n
+        Blank fields are unchanged (often only a single unit is updated), unknown layouts only update position.\n
+        Raises TypeError if a field is not numeric (all fields are parsed first, so kinematics are then unchanged).
+        """
+        layout_indices = transform_layout_indices.get(
+            len(transformers), transform_layout_indices[3]
+        )
+        try:
+            values = [
+                (index, float(value))
+                for index, value in zip(layout_indices, transformers)
+                if value != ""
+            ]
+        except (ValueError, TypeError):
+            raise TypeError(f"transform is not numeric: {transformers=}")
+        kinematics = self.kinematics
         # do this manually to prevent issues with get_pos with reused ids
-        if lat != "":
-            self.lat = float(lat)
-        if long != "":
-            self.long = float(long)
-        if alt != "":
-            self.alt = float(alt)
-
-    def update_simple_transform(self, u: str, v: str):
-        if u:
-            self.u = float(u)
-        if v:
-            self.v = float(v)
+        kinematics[old_position_slice] = kinematics[position_slice]
+        for index, value in values:
+            kinematics[index] = value
+        self.file_obj.object_grid.update(
+            self, kinematics[lat_index], kinematics[long_index]
+        )
+        if self.track is not None:
+            self.file_obj.track_store.add_sample(
+                self.track, self.file_obj.time_stamp, kinematics
+            )
 
     def get_pos(self, _ignore_state=False):
         """Get relative position of this object as provided by the file (exclude lat/long reference)."""
@@ -134,6 +227,25 @@ class DCSObject:
         """Return coordinates of this object at its previous coordinate update."""
         return [self.lat_old, self.long_old, self.alt_old]
 
+    def get_pos_at(self, time: float):
+        """Get relative position of this object at time (any state), interpolated from its track (see TrackStore.get_sample_at).\n
+        The last position is held until death (or the current time stamp if alive). Returns None if time is outside this.\n
+        Raises ValueError if tracks are not enabled, or this object is not tracked."""
+        track_store = self.file_obj.track_store
+        if track_store is None or self.uid not in track_store.tracks:
+            raise ValueError(
+                f"Trying to get position at time of untracked object: {self.id=} {self.name=} {self.type=}"
+            )
+        return track_store.get_sample_at(
+            self.uid, time, end_time=self.get_end_time_stamp()
+        )
+
+    def get_end_time_stamp(self):
+        """Returns death time stamp, or the current (file) time stamp if alive."""
+        if self.death_time_stamp is not None:
+            return self.death_time_stamp
+        return self.file_obj.time_stamp
+
     def get_death_pos(self):
         """Get relative position of this object at death as provided by the file (exclude lat/long reference)."""
         return self.death_position
@@ -159,7 +271,12 @@ class DCSObject:
             )
         self.check_in_same_file(munition_obj)
         munition_obj.launcher = self
+        if self.launches is empty_mapping:
+            self.launches = {}
         self.launches[munition_obj.id] = munition_obj
+        self.file_obj.publish_event(
+            "Launch", self, munition_obj, munition_obj.get_pos(_ignore_state=True)
+        )
 
     def add_kill(self, victim, dist=None):
         """Adds self and self.launcher to relevant victim attributes.\n
@@ -184,15 +301,21 @@ class DCSObject:
                 raise AttributeError(
                     f"Munition is not in munition launcher: {self.id=} {self.launcher.id=} {self.launcher.launches.keys()=}"
                 )
+            if self.launcher.kills is empty_mapping:
+                self.launcher.kills = {}
             self.launcher.kills[self] = victim
             victim.killer = self.launcher
         victim.killer_weapon = self
+        if self.kills is empty_mapping:
+            self.kills = {}
         self.kills[self] = victim
         self.update_to_dead()
         victim.update_to_dead()
-        logger.trace(
-            f"Added kill: {dist=} {self.file_obj.file_name}\n\t{self.id=} {self.name=} {self.type=} {self.state=} {self.pilot=}\n\t{victim.id=} {victim.name=} {victim.type=} {victim.state=} {self.pilot=}\n\t{f'{self.launcher.id=} {self.launcher.name=} {self.launcher.type=} {self.launcher.pilot=}' if self.launcher else ''}"
-        )
+        self.file_obj.publish_event("Kill", self, victim, victim.get_death_pos())
+        if logger.isEnabledFor(trace_level):
+            logger.trace(
+                f"Added kill: {dist=} {self.file_obj.file_name}\n\t{self.id=} {self.name=} {self.type=} {self.state=} {self.pilot=}\n\t{victim.id=} {victim.name=} {victim.type=} {victim.state=} {self.pilot=}\n\t{f'{self.launcher.id=} {self.launcher.name=} {self.launcher.type=} {self.launcher.pilot=}' if self.launcher else ''}"
+            )
 
     def update_to_dying(self):
         """Update self to dying state (includes moving to appropriate dictionary)."""
@@ -214,11 +337,12 @@ class DCSObject:
         self.state = "Dying"
         self.file_obj.dying_objects[self.id] = self
         self.death_time_stamp = self.file_obj.time_stamp
+        self.file_obj.add_dying(self, self.file_obj.dying_objects)
 
     def update_to_dead(self):
         """Update self to dead state (includes moving to appropriate dictionary)."""
-        # ensure id or obj not already found in dead_objects
-        if self in self.file_obj.dead_objects.values():
+        # ensure obj not already found in dead_objects (dead objects are only stored under their own uid)
+        if self.file_obj.dead_objects.get(self.uid) is self:
             raise ValueError(
                 f"New dead object is already in dead_objects: {self.info(all=True)}"
             )
@@ -244,6 +368,7 @@ class DCSObject:
                     f"Old dying/new dead object has no death position: {self.id=} {self.death_time_stamp=}"
                 )
             self.file_obj.dying_objects.pop(self.id)
+            self.file_obj.dying_changed = True
         else:
             raise ValueError(f"Object is not alive or dying: {self.id=} {self.state=}")
         # update to correct object dictionary
@@ -258,7 +383,9 @@ class DCSObject:
                 f"Death coords already set: {self.id=} {self.death_position=} {self.death_time_stamp=}"
             )
         self.death_position = self.get_pos()
+        self.track = None  # death_coords are not part of the track
         self.update_transform(death_coords[0], death_coords[1], death_coords[2])
+        self.file_obj.object_grid.remove(self)
 
     def set_death_time_stamp(self):
         if self.death_time_stamp != None:
@@ -295,21 +422,13 @@ class DCSObject:
         return False
 
     def check_skip_dying_type(self):
-        """Returns True if an object type is within skip_dying_type list."""
-        for skip_type in skip_dying_types:
-            if skip_type in self.type:
-                # if self.state == "Alive":
-                #     self.update_to_dead()
-                # FUTUREDO later may wish to change this to allow detecting missiles being trashed by decoys
-                return True
-        return False
+        """Returns True if an object type is within skip_dying_types (skip_dying_types_mask)."""
+        # FUTUREDO later may wish to change this to allow detecting missiles being trashed by decoys
+        return bool(self.type_flags & skip_dying_types_mask)
 
     def check_skip_data_processing_type(self):
-        """Returns True if an object type is within skip_data_processing_type list."""
-        for skip_type in skip_data_processing_types:
-            if skip_type in self.type:
-                return True
-        return False
+        """Returns True if an object type is within skip_data_processing_types (skip_data_processing_types_mask)."""
+        return bool(self.type_flags & skip_data_processing_types_mask)
 
     def check_in_same_file(self, other):
         """Raises TypeError if objects are from different files"""
@@ -323,12 +442,10 @@ class DCSObject:
             )
 
     def set_types(self, types: str):
-        """Set object types. Pass in type string as found in .acmi"""
-        type_list = types.split("+")
-        for type in type_list:
-            if type not in all_known_types:
-                logger.critical(f"Unknown type: {type=}")
-        self.type = type_list
+        """Set object types. Pass in type string as found in .acmi\n
+        Type lists (and flags) are shared by all objects of the same types (see get_types).
+        """
+        self.type_list, self.type_flags = get_types(types)
 
     def get_in_dicts(self):
         """Returns a list of 3 bools indicating which object dictionaries this object is in [Alive, Dying, Dead]"""
@@ -0,0 +1,111 @@
+from src.managers.logHandler import logger, trace_level
+from src.data.typeReferences import get_types_mask
+
+
+class DCSShell:
+    """Compact record of a high volume projectile (e.g.: gun shell), used in place of a full DCSObject.\n
+    Only tracks what is needed to attribute kills: position, state, and identity.\n
+    Shells use a uid from the FileData UID counter, but are not added to all_objects (only shells that killed are in the objects outputs, see FileSummary.add_shell).
+    """
+
+    __slots__ = (
+        "file_obj",  # FileData object of the TacView file this shell belongs to
+        "id",  # the ID of this shell (same as the one used in the TV file)
+        "uid",  # the unique ID of this shell (from counter within file_obj)
+        "type",  # the assigned type(s) of this shell (e.g.: Projectile, Shell)
+        "type_flags",  # ObjectType flags (int) of type (see typeReferences.get_types_mask)
+        "name",  # name of the shell (e.g.: M61_20_HE)
+        "coalition",  # coalition of the shell's launcher
+        "lat",  # the most recent latitude of this shell (doesn't include reference)
+        "long",  # the most recent longitude of this shell (doesn't include reference)
+        "alt",  # the most recent altitude in meters MSL
+        "state",  # Alive, Dying, Dead
+        "spawn_time_stamp",  # uses acmi time stamp, not recording/mission time
+        "death_time_stamp",  # uses acmi time stamp, not recording/mission time
+        "victim",  # the DCSObject this shell killed
+    )
+    # DCSObject attributes that are always None for shells (class level, so no per-shell memory)
+    pilot = None
+    launcher = None
+    killer = None
+
+    def __init__(self, file_obj, id: str, uid: int, types: list):
+        if not isinstance(id, str):
+            raise TypeError(f"DCSShell init id is not string: {id=} {type(id)=}")
+        self.file_obj = file_obj
+        self.id = id
+        self.uid = uid
+        self.type = types
+        self.type_flags = get_types_mask(types)
+        self.name = None
+        self.coalition = None
+        self.lat = None
+        self.long = None
+        self.alt = 0
+        self.state = "Alive"
+        self.spawn_time_stamp = file_obj.time_stamp
+        self.death_time_stamp = None
+        self.victim = None
+
+    def update_transform(self, lat: str, long: str, alt: str):
+        """Updates this shell's coordinates and altitude (str floats), blank values are unchanged."""
+        if lat:
+            self.lat = float(lat)
+        if long:
+            self.long = float(long)
+        if alt:
+            self.alt = float(alt)
+
+    def get_pos(self):
+        """Get relative position of this shell as provided by the file (exclude lat/long reference)."""
+        return [self.lat, self.long, self.alt]
+
+    def get_death_pos(self):
+        """Get relative position of this shell at death (last position, shells are not updated once dying)."""
+        if self.state == "Alive":
+            raise ValueError(f"Trying to get death position of alive shell: {self.id=}")
+        return self.get_pos()
+
+    def update_to_dying(self):
+        """Update self to dying state (moving from FileData.shells to FileData.dying_shells)."""
+        if self.state != "Alive":
+            raise ValueError(f"New dying shell is not alive: {self.id=} {self.state=}")
+        self.file_obj.shells.pop(self.id)
+        self.state = "Dying"
+        self.file_obj.dying_shells[self.id] = self
+        self.death_time_stamp = self.file_obj.time_stamp
+        self.file_obj.add_dying(self, self.file_obj.dying_shells)
+
+    def update_to_dead(self):
+        """Update self to dead state (removed from FileData, only kept if it killed a victim)."""
+        if self.state != "Dying":
+            raise ValueError(f"New dead shell is not dying: {self.id=} {self.state=}")
+        self.file_obj.dying_shells.pop(self.id)
+        self.file_obj.dying_changed = True
+        self.state = "Dead"
+
+    def add_kill(self, victim, dist=None):
+        """Sets self as victim.killer_weapon (shells have no launcher, so victim.killer is not set).\n
+        Updates both victim and self to dead, and adds self to FileData.shell_kills."""
+        if not victim.check_is_dying():
+            raise AttributeError(
+                f"Victim is not in dying objects:\n\t\t{self.info()}\n\t\t{victim.info(all=True)}"
+            )
+        if victim.killer != None or victim.killer_weapon != None:
+            raise AttributeError(
+                f"Victim already has killer/weapon: {self.id=} {victim.id=} {victim.killer=} {victim.killer_weapon=}"
+            )
+        victim.killer_weapon = self
+        self.victim = victim
+        self.update_to_dead()
+        victim.update_to_dead()
+        self.file_obj.shell_kills.append(self)
+        self.file_obj.publish_event("Kill", self, victim, victim.get_death_pos())
+        if logger.isEnabledFor(trace_level):
+            logger.trace(
+                f"Added shell kill: {dist=} {self.file_obj.file_name}\n\t{self.info()}\n\t{victim.id=} {victim.name=} {victim.type=} {victim.state=}"
+            )
+
+    def info(self):
+        """Returns string with shell information."""
+        return f"ID: {self.id} UID: {self.uid} Type: {self.type} Name: {self.name} State: {self.state} Position: {self.get_pos()}"
@@ -1,8 +1,16 @@
 """Module DocString"""  # TODO add module docstrings
 
+from heapq import heappush
 from src.classes.DCSObject import DCSObject
+from src.classes.DCSEvent import DCSEvent
+from src.classes.DCSShell import DCSShell
+from src.classes.ObjectGrid import ObjectGrid
+from src.classes.TrackStore import get_track_store
+from src.classes.Telemetry import get_telemetry
+from src.data.valueReferences import object_grid_cell_size
 from src.data.typeReferences import valid_DCSObject_states
 from src.managers.logHandler import logger
+from src.utils.configUtils import config
 
 
 class FileData:
@@ -11,7 +19,9 @@ class FileData:
         self.file_name = None  # what is the name of the file itself
         self.file_type = None  # ACMI file type recorded by TacView
         self.file_version = None  # ACMI version recorded by TacView
-        self.file_length = None  # Number of lines in the file
+        self.file_length = (
+            0  # Number of lines in the file (counted as lines are processed)
+        )
         self.file_size = None  # size of the file in KB
         self.recorder = (
             None  # what application and version was used to record the data?
@@ -43,6 +53,30 @@ class FileData:
         )  # id:obj all objects currently currently in death processing
         self.dead_objects = {}  # uid:obj all objects that have died
         self.all_objects = {}  # uid:obj all objects in file (all states)
+        self.object_grid = ObjectGrid(
+            object_grid_cell_size
+        )  # lat/long index of alive objects (e.g.: finding missile launchers)
+        self.track_store = (
+            get_track_store()
+        )  # per-object trajectories of opted-in types (None if config TRACKS not enabled)
+        self.telemetry = (
+            get_telemetry()
+        )  # parsing counters/timings (None if config TELEMETRY not enabled)
+        self.shells = {}  # id:DCSShell all (compact type) shells currently alive
+        self.dying_shells = {}  # id:DCSShell all shells currently in death processing
+        self.shell_kills = (
+            []
+        )  # DCSShells that killed a victim (other dead shells are discarded)
+        self.dying_changed = (
+            False  # have dying objects/shells changed since the last process_file_tick
+        )
+        self.dying_deadlines = (
+            []
+        )  # heap of (death_time_stamp, uid, obj, dying dict) - see dataProcessor.check_tick_due
+        self.sweep_attribution = False  # are kills attributed after reading, rather than per tick (see dataProcessor.sweep_kill_attribution)
+        self.death_events = (
+            []
+        )  # (obj, dying dict) of each object/shell that started dying (only if sweep_attribution)
         self.first_time_stamp = None
         self.time_stamp = (
             0  # the most recent timestamp processed whilst reading the file
@@ -51,6 +85,11 @@ class FileData:
         # self.server_events = []
         self.category = None  # unsure what this is, needs testing/researching
         self.uid_counter = 0
+        self.last_file_tick_processed = 0  # time stamp of last process_file_tick
+        self.line_continued = False  # was the last line processed continued (ends '\\')
+        self.event_listeners = []  # functions called with each DCSEvent as it happens
+        self.header_only = False  # were only the header (global) lines processed (see fileManager.scan_file)
+        self.pruned_summary = None  # FileSummary of pruned objects, merged into this file's FileSummary (see prune_dead_objects)
 
     def set_time(self, time: float):
         """Updates current time stamp to input.\n\nCannot input an earlier timestamp than what is currently set."""
@@ -77,6 +116,86 @@ class FileData:
         self.all_objects[new_object.uid] = new_object.id
         return new_object
 
+    def new_shell(self, id: str, types: list):
+        """Returns a new (compact) DCSShell with given id and types; sets shell.uid from internal FileData UID counter.\n\nShell placed in shells dictionary (not all_objects)"""
+        if id in self.shells or id in self.objects:
+            raise ValueError(f"Object already exists in alive dictionaries: {id=}")
+        new_shell = DCSShell(self, id, self.uid_counter, types)
+        self.shells[id] = new_shell
+        self.uid_counter += 1
+        return new_shell
+
+    def add_dying(self, obj, dying_dict: dict):
+        """Marks dying objects as changed, and schedules obj (newly added to dying_dict) to be checked for expiry at its death time stamp.\n
+        Deadlines are only kept if idle ticks are skipped (config PROCESSING.skip_idle_ticks), as only check_tick_due reads them.\n
+        If sweep_attribution, obj is instead recorded in death_events (there are no ticks while reading).
+        """
+        if self.sweep_attribution:
+            self.death_events.append((obj, dying_dict))
+            return
+        self.dying_changed = True
+        if config.PROCESSING.skip_idle_ticks:
+            heappush(
+                self.dying_deadlines, (obj.death_time_stamp, obj.uid, obj, dying_dict)
+            )
+
+    def add_event_listener(self, listener):
+        """Adds a function to be called with each DCSEvent (e.g.: Launch, Kill) as it happens."""
+        if not callable(listener):
+            raise TypeError(f"Event listener is not callable: {listener=}")
+        self.event_listeners.append(listener)
+
+    def publish_event(self, type: str, object, destination, coordinates):
+        """Calls all event listeners with a new DCSEvent (event only created if there are listeners)."""
+        if not self.event_listeners:
+            return
+        event = DCSEvent(self, self.time_stamp, type, object, coordinates, destination)
+        for listener in self.event_listeners:
+            listener(event)
+
+    def prune_dead_objects(self, max_dead_time: float, summarise=None):
+        """Removes objects that have been dead for longer than max_dead_time (file time) from dead_objects and all_objects, returning the number pruned.\n
+        Objects with launched munitions that are not yet dead are kept, as their kills can still change.\n
+        Used to bound memory when following a live file; pruned objects are no longer found by get_obj_by_id/uid.\n
+        summarise (if given) is called with the objects to prune before they are removed (e.g.: FileSummary.add_pruned_summary, keeping their rows).
+        """
+        prune_objs = [
+            obj
+            for obj in self.dead_objects.values()
+            if obj.death_time_stamp is not None
+            and self.time_stamp - obj.death_time_stamp > max_dead_time
+            # munitions may have been pruned already (so check state, not check_is_dead)
+            and all(munition.state == "Dead" for munition in obj.launches.values())
+        ]
+        if prune_objs and summarise is not None:
+            summarise(prune_objs)
+        for obj in prune_objs:
+            self.dead_objects.pop(obj.uid)
+            self.all_objects.pop(obj.uid, None)
+        return len(prune_objs)
+
+    def get_positions_at(self, objs: list, time: float):
+        """Returns an array (len(objs) x 3) of each object's relative position [lat, long, alt] at time, interpolated from tracks (NaN if unknown).\n
+        Raises ValueError if an object is not tracked (as get_positions_over_time / DCSObject.get_pos_at).
+        """
+        return self.get_track_store().get_samples_at(
+            [obj.uid for obj in objs],
+            time,
+            end_times=[obj.get_end_time_stamp() for obj in objs],
+        )
+
+    def get_positions_over_time(self, obj, times: list[float]):
+        """Returns an array (len(times) x 3) of obj's relative position [lat, long, alt] at each time, interpolated from its track (NaN outside its track)."""
+        return self.get_track_store().get_track_at(
+            obj.uid, times, end_time=obj.get_end_time_stamp()
+        )
+
+    def get_track_store(self):
+        """Returns track_store. Raises ValueError if tracks are not enabled (config TRACKS)."""
+        if self.track_store is None:
+            raise ValueError(f"Tracks are not enabled: {self.file_name=}")
+        return self.track_store
+
     def get_coord_reference(self):
         """Returns lat/long references. Raises ValueError/TypeError if not set."""
         if self.latitude_reference == None or self.longitude_reference == None:
@@ -203,6 +322,10 @@ class FileData:
             o += f"Alive Objects: ({len(self.objects.keys())}){f' - {list(self.objects.keys())}' if detailed_dicts else ''}\n\t"
             o += f"Dying Objects: ({len(self.dying_objects.keys())}){f' - {list(self.dying_objects.keys())}' if detailed_dicts else ''}\n\t"
             o += f"Dead Objects: ({len(self.dead_objects.keys())}){f' - {[obj.id for obj in self.dead_objects.values()]}' if detailed_dicts else ''}\n\t"
+            o += f"Object Grid: {self.object_grid.info()}\n\t"
+            if self.track_store:
+                o += f"Tracks: {self.track_store.info()}\n\t"
+            o += f"Alive/Dying Shells: ({len(self.shells)}/{len(self.dying_shells)}) Shell Kills: {len(self.shell_kills)}\n\t"
         if extras:
             e += f"Category: {self.category}\n\t"
             e += f"UID Counter: {self.uid_counter} "
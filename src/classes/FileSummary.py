@@ -0,0 +1,188 @@
+import re
+from src.classes.FileData import FileData
+from src.utils.analyticsUtils import get_munition_metrics
+from src.utils.outputUtils import munition_metrics_header, output_exclude_types_mask
+
+
+class FileSummary:
+    """Picklable summary of a processed FileData, holding only what outcomeWriter.write_outcome needs.\n
+    Rows do not include FileID (or the object counter), as these are only known when writing.\n
+    If objs is given, only those objects are summarised (e.g.: objects about to be pruned, see add_pruned_summary),
+    otherwise all objects, shells that killed, and the rows of pruned objects (FileData.pruned_summary) are.
+    """
+
+    def __init__(self, file_data, objs: list = None):
+        if not isinstance(file_data, FileData):
+            raise TypeError(f"FileSummary file_data is not FileData: {type(file_data)}")
+        self.file_name = file_data.file_name
+        self.file_size = file_data.file_size  # size of the file in KB
+        # number of lines in the file (unknown if only the header was read)
+        self.file_length = None if file_data.header_only else file_data.file_length
+        self.mission_title = file_data.mission_title
+        self.info = file_data.info(all=True)  # FileData.info() at time of summary
+        self.file_row = [
+            file_data.file_name,
+            file_data.author,
+            file_data.mission_title,
+            file_data.file_type,
+            file_data.file_version,
+            self.file_length,
+            file_data.file_size,
+            file_data.recorder,
+            file_data.source,
+            file_data.mission_date,
+            file_data.record_date,
+            file_data.latitude_reference,
+            file_data.longitude_reference,
+            file_data.uid_counter,  # all objects created (all_objects may be pruned)
+            file_data.first_time_stamp,
+            file_data.time_stamp,  # is not 'reset' on file end, so acts as 'final' time stamp
+        ]
+        if file_data.header_only:
+            # object quantity and time stamps are unknown from the header alone
+            self.file_row[-3:] = [None, None, None]
+        self.object_rows = []  # objects_csv_header rows (excluding FileID and counter)
+        self.output_rows = []  # output_csv_header rows (excluding FileID)
+        self.launches = []  # [launcher uid, munition uid]
+        self.kills = []  # [weapon (/shell) uid, victim uid, killer (launcher) uid]
+        self.track_store = (
+            file_data.track_store
+        )  # TrackStore (None if tracks not enabled), exported by write_outcome
+        # Telemetry.get_record() of reading this file (None if telemetry not enabled, or loaded from the cache)
+        self.telemetry = (
+            file_data.telemetry.get_record() if file_data.telemetry else None
+        )
+        # uid:[munition_metrics_header values] (see analyticsUtils.get_munition_metrics)
+        self.munition_metrics = (
+            {} if file_data.header_only else get_munition_metrics(file_data, objs)
+        )
+        if objs is not None:
+            for obj in objs:
+                self.add_obj(obj)
+            return
+        for obj in file_data.get_all_objs(dead=False):
+            self.add_obj(obj)
+        # pruned objects died before the remaining dead objects
+        if file_data.pruned_summary is not None:
+            self.merge(file_data.pruned_summary)
+        for obj in file_data.dead_objects.values():
+            self.add_obj(obj)
+        for shell in file_data.shell_kills:
+            self.add_shell(shell)
+
+    def set_file_name(self, file_name: str, file_size: int):
+        """Updates file name and size (KB), including within rows (e.g.: if loaded from cache for a renamed file)."""
+        self.file_name = file_name
+        self.file_size = file_size
+        self.file_row[0] = file_name
+        self.file_row[6] = file_size
+        for output_row in self.output_rows:
+            output_row[-1] = re.split(r"[\\ | /]", file_name)[-1]
+
+    def merge(self, file_summary):
+        """Appends the rows, launches, kills, and munition metrics of another FileSummary of the same file (e.g.: of pruned objects)."""
+        if not isinstance(file_summary, FileSummary):
+            raise TypeError(
+                f"Summary to merge is not FileSummary: {type(file_summary)=}"
+            )
+        self.object_rows += file_summary.object_rows
+        self.output_rows += file_summary.output_rows
+        self.launches += file_summary.launches
+        self.kills += file_summary.kills
+        self.munition_metrics.update(file_summary.munition_metrics)
+
+    def add_obj(self, obj):
+        """Adds the csv rows, launches, and kills of a DCSObject to this summary."""
+        final_time_stamp = (
+            obj.death_time_stamp if obj.death_time_stamp else obj.file_obj.time_stamp
+        )
+        self.object_rows.append(
+            [
+                obj.uid,
+                obj.id,
+                obj.pilot,
+                obj.name,
+                obj.coalition,
+                obj.type,
+                obj.country,
+                len(obj.launches),
+                len(obj.kills),
+                obj.killer.uid if obj.killer else None,
+                obj.killer_weapon.uid if obj.killer_weapon else None,
+                obj.spawn_time_stamp,
+                final_time_stamp,
+                obj.origin,
+                obj.launcher.uid if obj.launcher else None,
+            ]
+            + self.munition_metrics.get(obj.uid, [None] * len(munition_metrics_header))
+        )
+        if not obj.type_flags & output_exclude_types_mask:
+            self.output_rows.append(
+                [
+                    obj.uid,
+                    obj.pilot,
+                    obj.name,
+                    obj.coalition,
+                    obj.type,
+                    len(obj.launches),
+                    len(obj.kills),
+                    obj.killer.name if obj.killer else None,
+                    obj.killer_weapon.name if obj.killer_weapon else None,
+                    obj.spawn_time_stamp,
+                    final_time_stamp,
+                    obj.file_obj.mission_title,
+                    re.split(r"[\\ | /]", obj.file_obj.file_name)[-1],
+                ]
+            )
+        for munition in obj.launches.values():
+            self.launches.append([obj.uid, munition.uid])
+        for weapon, victim in obj.kills.items():
+            # launcher.kills duplicates its munitions' kills, only record from the munition
+            if weapon is obj:
+                self.kills.append(
+                    [weapon.uid, victim.uid, obj.launcher.uid if obj.launcher else None]
+                )
+
+    def add_shell(self, shell):
+        """Adds the objects csv row and kill of a DCSShell that killed a victim (other shells are discarded, so have no rows).\n
+        Shells have no pilot, country, origin, or launcher, and are excluded from user outputs (Projectile/Shell types).
+        """
+        self.object_rows.append(
+            [
+                shell.uid,
+                shell.id,
+                None,
+                shell.name,
+                shell.coalition,
+                shell.type,
+                None,
+                0,
+                1,
+                None,
+                None,
+                shell.spawn_time_stamp,
+                shell.death_time_stamp,
+                None,
+                None,
+            ]
+            + [None] * len(munition_metrics_header)
+        )
+        self.kills.append([shell.uid, shell.victim.uid, None])
+
+
+def add_pruned_summary(file_data, objs: list):
+    """Adds the rows of objs (about to be pruned, see FileData.prune_dead_objects) to file_data.pruned_summary, so they are still written.\n
+    Munition metrics of objs are calculated now, so only consider targets that have not been pruned.
+    """
+    pruned_summary = FileSummary(file_data, objs)
+    if file_data.pruned_summary is None:
+        file_data.pruned_summary = pruned_summary
+    else:
+        file_data.pruned_summary.merge(pruned_summary)
+
+
+def get_file_summary(file_data) -> FileSummary:
+    """Returns FileSummary of file_data (returns file_data if already a FileSummary)."""
+    if isinstance(file_data, FileSummary):
+        return file_data
+    return FileSummary(file_data)
@@ -0,0 +1,62 @@
+from math import floor
+
+
+class ObjectGrid:
+    """Uniform lat/long grid index of alive DCSObjects, so nearby objects can be found without scanning every object.\n
+    Objects are moved between cells as their transform is updated (DCSObject.update_transform_fields), and removed on death.
+    """
+
+    def __init__(self, cell_size: float):
+        if not cell_size > 0:
+            raise ValueError(f"ObjectGrid cell_size is not positive: {cell_size=}")
+        self.cell_size = (
+            cell_size  # lat/long (degrees, excluding reference) covered by each cell
+        )
+        self.cells = {}  # (lat cell, long cell):{uid:obj} all objects within each cell
+        self.obj_cells = {}  # uid:(lat cell, long cell) the cell of each indexed object
+
+    def update(self, obj, lat: float, long: float):
+        """Moves obj to the cell containing lat/long (objects without a position, i.e.: NaN, are not indexed)."""
+        if lat != lat or long != long:
+            return
+        cell = (floor(lat / self.cell_size), floor(long / self.cell_size))
+        old_cell = self.obj_cells.get(obj.uid)
+        if cell == old_cell:
+            return
+        if old_cell is not None:
+            self.remove(obj)
+        self.cells.setdefault(cell, {})[obj.uid] = obj
+        self.obj_cells[obj.uid] = cell
+
+    def remove(self, obj):
+        """Removes obj from the grid (if indexed)."""
+        cell = self.obj_cells.pop(obj.uid, None)
+        if cell is None:
+            return
+        cell_objs = self.cells[cell]
+        cell_objs.pop(obj.uid)
+        if not cell_objs:
+            self.cells.pop(cell)
+
+    def get_nearby(self, lat: float, long: float, distance: float) -> list:
+        """Returns all objects in cells overlapping lat/long +/- distance, ordered by uid.\n
+        Includes every object within distance in both lat and long, but may include objects further away.
+        """
+        cell_size = self.cell_size
+        nearby = []
+        for lat_cell in range(
+            floor((lat - distance) / cell_size), floor((lat + distance) / cell_size) + 1
+        ):
+            for long_cell in range(
+                floor((long - distance) / cell_size),
+                floor((long + distance) / cell_size) + 1,
+            ):
+                cell_objs = self.cells.get((lat_cell, long_cell))
+                if cell_objs:
+                    nearby.extend(cell_objs.values())
+        nearby.sort(key=lambda obj: obj.uid)
+        return nearby
+
+    def info(self):
+        """Returns string with grid information."""
+        return f"Cell Size: {self.cell_size} Cells: {len(self.cells)} Objects: {len(self.obj_cells)}"
@@ -0,0 +1,80 @@
+from time import perf_counter
+from src.utils.configUtils import config
+
+# process_file line categories (header: file header, version, and comment lines)
+line_categories = ["object", "timestamp", "removal", "global", "header"]
+# timed parsing stages (object_line is the object line category's time)
+telemetry_stages = ["attr_split", "object_line", "process_file_tick", "get_closest_obj"]
+
+
+class Telemetry:
+    """Per-file parsing performance counters and timings (seconds, perf_counter), written as a JSON line alongside the outputs.\n
+    Stage times are inclusive (e.g.: object_line includes attr_split and launcher get_closest_obj calls).
+    """
+
+    def __init__(self):
+        self.processing_time = 0.0  # time spent in process_file (all calls)
+        self.line_counts = dict.fromkeys(line_categories, 0)  # category:lines
+        self.line_times = dict.fromkeys(line_categories, 0.0)  # category:seconds
+        self.stage_calls = dict.fromkeys(telemetry_stages, 0)  # stage:calls
+        self.stage_times = dict.fromkeys(telemetry_stages, 0.0)  # stage:seconds
+        self.objects_created = (
+            {}
+        )  # type (e.g.: Air+FixedWing):objects (and shells) created
+
+    def add_line(self, category: str, seconds: float):
+        """Counts a processed line of category (see line_categories), taking seconds."""
+        self.line_counts[category] += 1
+        self.line_times[category] += seconds
+
+    def add_time(self, stage: str, seconds: float):
+        """Counts a call of stage (see telemetry_stages), taking seconds."""
+        self.stage_calls[stage] += 1
+        self.stage_times[stage] += seconds
+
+    def add_object(self, types: list):
+        """Counts a created object (or shell) of types (None if the object has no Type)."""
+        type = "+".join(types) if types else None
+        self.objects_created[type] = self.objects_created.get(type, 0) + 1
+
+    def get_record(self) -> dict:
+        """Returns a (JSON serialisable) dict of all counters and timings."""
+        lines = sum(self.line_counts.values())
+        stage_calls = dict(self.stage_calls)
+        stage_times = dict(self.stage_times)
+        stage_calls["object_line"] = self.line_counts["object"]
+        stage_times["object_line"] = self.line_times["object"]
+        return {
+            "lines": lines,
+            "processing_time": self.processing_time,
+            "lines_per_second": (
+                lines / self.processing_time if self.processing_time else None
+            ),
+            "line_counts": dict(self.line_counts),
+            "line_times": dict(self.line_times),
+            "stage_calls": stage_calls,
+            "stage_times": stage_times,
+            "objects_created": {
+                str(type): count
+                for type, count in sorted(
+                    self.objects_created.items(), key=lambda item: -item[1]
+                )
+            },
+        }
+
+
+def time_call(telemetry: Telemetry, stage: str, func, *args, **kwargs):
+    """Returns func(*args, **kwargs), adding its time to telemetry's stage (untimed if telemetry is None)."""
+    if telemetry is None:
+        return func(*args, **kwargs)
+    start_time = perf_counter()
+    result = func(*args, **kwargs)
+    telemetry.add_time(stage, perf_counter() - start_time)
+    return result
+
+
+def get_telemetry() -> Telemetry:
+    """Returns a Telemetry, or None if telemetry is not enabled (config TELEMETRY)."""
+    if not config.TELEMETRY.enabled:
+        return None
+    return Telemetry()
@@ -0,0 +1,241 @@
+from src.managers.logHandler import logger
+from array import array
+from bisect import bisect_right
+import numpy as np
+from src.data.coordReferences import kinematic_fields, track_fields, position_fields
+from src.utils.configUtils import config
+
+# kinematics indices of each track field (excluding time)
+track_kinematic_indices = tuple(
+    kinematic_fields.index(field) for field in track_fields[1:]
+)
+
+
+class TrackStore:
+    """Columnar per-object trajectories: a sample of track_fields (time, lat, long, alt, u, v, heading) per transform update.\n
+    Each track is a list of growable array('d') columns (one per track field), so samples are stored as raw doubles rather than Python objects.\n
+    Only objects sharing a type with types are tracked, and samples stop being stored once max_size_mb is reached (8 bytes per field per sample).
+    """
+
+    def __init__(self, types: list[str], max_size_mb: float):
+        if not types:
+            raise ValueError(f"TrackStore has no types to track: {types=}")
+        self.types = set(
+            types
+        )  # objects sharing any of these types are tracked (e.g.: Air, Missile)
+        self.max_samples = int(
+            max_size_mb * 1024 * 1024 / (8 * len(track_fields))
+        )  # memory budget in samples (all tracks)
+        self.sample_count = 0  # samples stored across all tracks
+        self.budget_exceeded = False  # have samples been dropped (max_samples reached)
+        self.tracks = {}  # uid:[array('d') per track field] all tracked objects
+
+    def start_track(self, obj):
+        """Starts tracking obj (from its current kinematics) if it shares a type with self.types.\n
+        Later samples are added by DCSObject.update_transform_fields (using obj.track), until obj dies.
+        """
+        if obj.type is None or self.types.isdisjoint(obj.type):
+            return
+        if obj.uid in self.tracks:
+            raise ValueError(f"Object is already tracked: {obj.id=} {obj.uid=}")
+        obj.track = [array("d") for _ in track_fields]
+        self.tracks[obj.uid] = obj.track
+        self.add_sample(obj.track, obj.file_obj.time_stamp, obj.kinematics)
+
+    def add_sample(self, track: list, time_stamp: float, kinematics: array):
+        """Appends time_stamp and the track fields of kinematics to track (dropped if the memory budget is reached)."""
+        if self.sample_count >= self.max_samples:
+            if not self.budget_exceeded:
+                logger.warning(
+                    f"Track memory budget reached, further samples are dropped: {self.max_samples=} {time_stamp=}"
+                )
+                self.budget_exceeded = True
+            return
+        track[0].append(time_stamp)
+        for column, index in zip(track[1:], track_kinematic_indices):
+            column.append(kinematics[index])
+        self.sample_count += 1
+
+    def get_track(self, uid: int) -> dict:
+        """Returns {field: array('d')} of the object with uid (None if not tracked)."""
+        track = self.tracks.get(uid)
+        if track is None:
+            return None
+        return dict(zip(track_fields, track))
+
+    def get_sample_at(
+        self,
+        uid: int,
+        time: float,
+        fields: tuple = position_fields,
+        end_time: float = None,
+    ) -> list[float]:
+        """Returns [field values] of the object with uid at time, linearly interpolated between the two track samples around time (found by bisect).\n
+        The last sample is held until end_time (e.g.: the object's death time stamp), as objects keep their values until updated.\n
+        Returns None if the object is not tracked, or time is outside its track. Heading is interpolated linearly (not across 0/360).
+        """
+        columns = self.get_columns(fields)
+        track = self.tracks.get(uid)
+        if track is None:
+            return None
+        times = track[0]
+        index = bisect_right(times, time)  # number of samples at or before time
+        if index == 0:
+            return None
+        before = index - 1
+        if index == len(times):
+            if time != times[-1] and (end_time is None or time > end_time):
+                return None
+            return [track[column][before] for column in columns]
+        if times[before] == time:
+            return [track[column][before] for column in columns]
+        ratio = (time - times[before]) / (times[index] - times[before])
+        return [
+            track[column][before]
+            + (track[column][index] - track[column][before]) * ratio
+            for column in columns
+        ]
+
+    def get_samples_at(
+        self,
+        uids: list[int],
+        time: float,
+        fields: tuple = position_fields,
+        end_times: list[float] = None,
+    ) -> np.ndarray:
+        """Returns an array (len(uids) x len(fields)) of each object's fields at time (see get_sample_at), NaN if unknown.\n
+        end_times (if given) holds the end time of each object. Raises ValueError if an object is not tracked (see get_track_at).\n
+        The tracks are stacked into one sorted key array (each track's times offset by its row * span), so every object's sample is found with one searchsorted.
+        """
+        columns = self.get_columns(fields)
+        tracks = []
+        for uid in uids:
+            track = self.tracks.get(uid)
+            if track is None:
+                raise ValueError(f"Object is not tracked: {uid=}")
+            tracks.append(track)
+        samples = np.full((len(uids), len(fields)), np.nan)
+        lengths = np.array([len(track[0]) for track in tracks], dtype=np.int64)
+        if not lengths.sum():
+            return samples
+        track_times = np.concatenate([np.frombuffer(track[0]) for track in tracks])
+        start_time = min(track_times.min(), time)
+        span = max(track_times.max(), time) - start_time + 1
+        offsets = np.arange(len(tracks)) * span
+        keys = np.repeat(offsets, lengths) + (track_times - start_time)
+        last = np.cumsum(lengths) - 1  # index of each track's last sample
+        # index of each track's last sample at or before time
+        before = np.searchsorted(keys, offsets + (time - start_time), side="right") - 1
+        if end_times is None:
+            end_times = [None] * len(uids)
+        known = (before >= last - lengths + 1) & (
+            (before < last)
+            | (track_times[before] == time)
+            | (time <= np.array(end_times, dtype=np.float64))
+        )
+        rows = np.flatnonzero(known)
+        before = before[rows]
+        after = np.minimum(before + 1, last[rows])
+        durations = track_times[after] - track_times[before]
+        ratios = np.divide(
+            time - track_times[before],
+            durations,
+            out=np.zeros(durations.shape),
+            where=durations > 0,
+        )
+        for index, column in enumerate(columns):
+            values = np.concatenate([np.frombuffer(track[column]) for track in tracks])
+            samples[rows, index] = (
+                values[before] + (values[after] - values[before]) * ratios
+            )
+        return samples
+
+    def get_track_at(
+        self,
+        uid: int,
+        times: list[float],
+        fields: tuple = position_fields,
+        end_time: float = None,
+    ) -> np.ndarray:
+        """Returns an array (len(times) x len(fields)) of the object's fields at each time, linearly interpolated with np.interp (NaN outside its track).\n
+        The last sample is held until end_time (see get_sample_at). Raises ValueError if the object is not tracked.
+        """
+        columns = self.get_columns(fields)
+        track = self.tracks.get(uid)
+        if track is None:
+            raise ValueError(f"Object is not tracked: {uid=}")
+        times = np.asarray(times, dtype=np.float64)
+        track_times = np.frombuffer(track[0])
+        hold = end_time is not None and len(track_times) and end_time > track_times[-1]
+        if hold:
+            track_times = np.append(track_times, end_time)
+        columns = [np.frombuffer(track[column]) for column in columns]
+        return np.column_stack(
+            [
+                np.interp(
+                    times,
+                    track_times,
+                    np.append(column, column[-1]) if hold else column,
+                    left=np.nan,
+                    right=np.nan,
+                )
+                for column in columns
+            ]
+        ).reshape(len(times), len(fields))
+
+    def get_columns(self, fields: tuple) -> list[int]:
+        """Returns the track column index of each field (time cannot be queried)."""
+        if "time" in fields or not set(fields).issubset(track_fields):
+            raise ValueError(f"Track fields must be from {track_fields[1:]}: {fields=}")
+        return [track_fields.index(field) for field in fields]
+
+    def export(self, file: str):
+        """Writes all tracks to a compressed NumPy .npz file (see load_tracks).\n
+        Each track field is one float64 array of all tracks' samples (concatenated in uid order), with the uid and sample offset of each track.
+        """
+        uids = sorted(self.tracks)
+        offsets = [0]
+        for uid in uids:
+            offsets.append(offsets[-1] + len(self.tracks[uid][0]))
+        columns = {
+            field: np.concatenate(
+                [np.frombuffer(self.tracks[uid][index]) for uid in uids]
+                or [np.empty(0)]
+            )
+            for index, field in enumerate(track_fields)
+        }
+        np.savez_compressed(
+            file,
+            uid=np.array(uids, dtype=np.int64),
+            offset=np.array(offsets, dtype=np.int64),
+            **columns,
+        )
+        logger.debug(
+            f"Exported {len(uids)} tracks ({self.sample_count} samples): {file}"
+        )
+
+    def info(self):
+        """Returns string with track store information."""
+        return f"Types: {sorted(self.types)} Tracks: {len(self.tracks)} Samples: {self.sample_count}/{self.max_samples} Budget Exceeded: {self.budget_exceeded}"
+
+
+def get_track_store() -> TrackStore:
+    """Returns a TrackStore using config TRACKS (types, max_size_mb), or None if tracks are not enabled."""
+    if not config.TRACKS.enabled:
+        return None
+    types = [type.strip() for type in config.TRACKS.types.split(",") if type.strip()]
+    return TrackStore(types, float(config.TRACKS.max_size_mb))
+
+
+def load_tracks(file: str) -> dict:
+    """Returns {uid: {field: np.ndarray}} of all tracks in a TrackStore.export .npz file."""
+    with np.load(file) as data:
+        offsets = data["offset"]
+        columns = {field: data[field] for field in track_fields}
+        return {
+            int(uid): {
+                field: column[offsets[index] : offsets[index + 1]]
+                for field, column in columns.items()
+            }
+            for index, uid in enumerate(data["uid"])
+        }
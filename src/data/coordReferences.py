@@ -1 +1,30 @@
 death_coords = [100, 100, -1]
+
+# DCSObject.kinematics array fields (in order) - unset values are stored as NaN (returned as None)
+# position fields first, in acmi transform order (see transform_layouts)
+kinematic_fields = [
+    "long",
+    "lat",
+    "alt",
+    "roll",
+    "pitch",
+    "yaw",
+    "u",
+    "v",
+    "heading",
+    "long_old",  # position at the previous coordinate update
+    "lat_old",
+    "alt_old",
+]
+# acmi T= field order of each transform layout (by number of fields) - blank fields are unchanged
+# https://www.tacview.net/documentation/acmi/en/
+transform_layouts = {
+    3: ["long", "lat", "alt"],
+    5: ["long", "lat", "alt", "u", "v"],
+    6: ["long", "lat", "alt", "roll", "pitch", "yaw"],
+    9: ["long", "lat", "alt", "roll", "pitch", "yaw", "u", "v", "heading"],
+}
+# TrackStore columns (in order) - time is the acmi time stamp, the rest are kinematic_fields at that time
+track_fields = ["time", "lat", "long", "alt", "u", "v", "heading"]
+# default TrackStore query fields (same order as DCSObject.get_pos)
+position_fields = ("lat", "long", "alt")
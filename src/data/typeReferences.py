@@ -1,3 +1,5 @@
+from enum import IntFlag
+
 valid_DCSObject_states = ["Alive", "Dying", "Dead"]
 
 skip_dying_types = [
@@ -18,6 +20,18 @@ killer_types = [
 
 skip_data_processing_types = skip_dying_types
 
+# new objects of these types have their launcher found (closest object at spawn)
+launched_types = ["Missile"]
+
+# objects with munition metrics (see analyticsUtils.get_munition_metrics)
+munition_types = ["Weapon"]
+
+# high volume types tracked as compact DCSShell records, rather than DCSObjects
+compact_types = [
+    "Projectile",
+    "Shell",
+]
+
 all_known_types = [
     "Misc",
     "Shrapnel",
@@ -54,3 +68,26 @@ all_known_types = [
     "Bomb",
     "Rocket",
 ]
+
+# one flag per known type (e.g.: ObjectType.Missile), see get_types_mask
+ObjectType = IntFlag("ObjectType", all_known_types)
+
+
+def get_types_mask(types: list) -> int:
+    """Returns the ObjectType flags (as int, so checks are plain int operations) of a list of type names.\n
+    Names that are not a single known type add no flags (e.g.: "Misc+Container" never matches, as object types are split on "+").
+    """
+    mask = 0
+    for type in types:
+        if type in ObjectType.__members__:
+            mask |= ObjectType[type].value
+    return mask
+
+
+# type lists compiled to masks (check with obj.type_flags & mask)
+skip_dying_types_mask = get_types_mask(skip_dying_types)
+killer_types_mask = get_types_mask(killer_types)
+skip_data_processing_types_mask = get_types_mask(skip_data_processing_types)
+launched_types_mask = get_types_mask(launched_types)
+munition_types_mask = get_types_mask(munition_types)
+compact_types_mask = get_types_mask(compact_types)
@@ -1,2 +1,15 @@
 closest_obj_alt_division = 100_000
 max_kill_distance = 0.005
+max_launch_distance = (
+    0.01  # max get_closest_obj distance between a missile and its launcher at launch
+)
+# FileData.object_grid cell size (lat/long) - launcher queries search the cells within max_launch_distance
+object_grid_cell_size = max_launch_distance
+# munition closest approaches (meters) - see analyticsUtils.get_munition_metrics
+hit_distance = 20  # closest approach counted as a hit (if not a kill)
+near_miss_distance = 300  # closest approach counted as a near miss
+max_approach_distance = (
+    20_000  # targets further than this from a munition's track are not candidates
+)
+max_dying_time = 10  # seconds (file time) an object can be dying before updated to dead
+follow_read_size = 1024 * 1024  # characters read per batch when following a live file
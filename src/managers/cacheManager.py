@@ -0,0 +1,163 @@
+from src.managers.logHandler import logger
+import os
+import glob
+import json
+import pickle
+import hashlib
+from src.classes.FileSummary import FileSummary
+from src.utils.configUtils import config
+
+# source directories whose code affects parsed outputs - any change invalidates cached summaries
+parser_source_dirs = ["classes", "data", "managers", "utils"]
+# config sections whose values affect parsed outputs - any change keeps summaries apart
+parser_config_sections = ["PROCESSING", "TRACKS", "TELEMETRY"]
+cache_file_extension = ".tvscache"
+hash_index_file_name = "file_hashes.json"
+parser_version_cache = {}  # src dir:parser version (calculated once)
+hash_index_cache = {}  # cache dir:{path|size|mtime: hash} (loaded once)
+
+
+def get_cache_dir() -> str:
+    """Returns the cache directory from config (either from root or project), creating it if needed."""
+    cache_dir = config.CACHE.cache_dir
+    if not cache_dir:
+        cache_dir = f"{os.getcwd()}/outputs/cache/"
+    elif os.path.isdir(f"{os.getcwd()}{cache_dir}"):
+        # if config path is from project dir
+        cache_dir = f"{os.getcwd()}{cache_dir}"
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def get_parser_version() -> str:
+    """Returns a hash of the parser's source code (calculated once) - used to invalidate cached summaries when the parser changes."""
+    src_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    if src_dir not in parser_version_cache:
+        source_hash = hashlib.sha256()
+        for source_dir in parser_source_dirs:
+            for source_file in sorted(glob.glob(f"{src_dir}/{source_dir}/*.py")):
+                with open(source_file, "rb") as f:
+                    source_hash.update(f.read())
+        parser_version_cache[src_dir] = source_hash.hexdigest()[:16]
+    return parser_version_cache[src_dir]
+
+
+def get_config_hash() -> str:
+    """Returns a hash of the current config values affecting parsed outputs (parser_config_sections, e.g.: seconds_per_process, tracked types).\n
+    Calculated on every call, as config may be changed at runtime."""
+    config_values = {
+        section: vars(getattr(config, section)) for section in parser_config_sections
+    }
+    config_json = json.dumps(config_values, sort_keys=True, default=str)
+    return hashlib.sha256(config_json.encode()).hexdigest()[:16]
+
+
+def get_file_hash(file: str, cache_dir: str = None) -> str:
+    """Returns sha256 hash of file contents.\n
+    Hashes are indexed by path, size and modified time, so unchanged files are not re-read.
+    """
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    stat = os.stat(file)
+    index_key = f"{os.path.realpath(file)}|{stat.st_size}|{stat.st_mtime_ns}"
+    hash_index = load_hash_index(cache_dir)
+    if index_key in hash_index:
+        return hash_index[index_key]
+
+    file_hash = hashlib.sha256()
+    with open(file, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            file_hash.update(block)
+    hash_index[index_key] = file_hash.hexdigest()  # saved by save_hash_index()
+    return hash_index[index_key]
+
+
+def load_hash_index(cache_dir: str) -> dict:
+    """Returns {path|size|mtime: hash} dict of previously hashed files (loaded once per cache_dir)."""
+    if cache_dir not in hash_index_cache:
+        index_path = f"{cache_dir}/{hash_index_file_name}"
+        hash_index_cache[cache_dir] = {}
+        if os.path.isfile(index_path):
+            try:
+                with open(index_path, "r", encoding="utf-8") as f:
+                    hash_index_cache[cache_dir] = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Unable to read cache hash index: {index_path=} {e=}")
+    return hash_index_cache[cache_dir]
+
+
+def save_hash_index(cache_dir: str = None):
+    """Saves the (in memory) hash index of cache_dir, so files are not re-hashed on the next run."""
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    hash_index = load_hash_index(cache_dir)
+    index_path = f"{cache_dir}/{hash_index_file_name}"
+    with open(f"{index_path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(hash_index, f)
+    os.replace(f"{index_path}.tmp", index_path)
+
+
+def get_cache_path(file_hash: str, cache_dir: str) -> str:
+    """Returns the cache file path for a file hash, the current parser version and config values (see get_config_hash)."""
+    return f"{cache_dir}/{file_hash}-{get_parser_version()}-{get_config_hash()}{cache_file_extension}"
+
+
+def load_cached_summary(file: str, file_hash: str, cache_dir: str = None):
+    """Returns cached FileSummary for file contents (None if not cached).\n
+    Updates the cache file's modified time, marking it as recently used."""
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    cache_path = get_cache_path(file_hash, cache_dir)
+    if not os.path.isfile(cache_path):
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            file_summary = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+        logger.warning(f"Unable to load cached summary, removing: {cache_path=} {e=}")
+        os.remove(cache_path)
+        return None
+    if not isinstance(file_summary, FileSummary):
+        raise TypeError(f"Cached summary is not FileSummary: {type(file_summary)=}")
+    os.utime(cache_path)  # LRU - most recently used
+    file_summary.telemetry = None  # the file was not read (timed) this run
+    # same contents may have been cached under another file name
+    file_summary.set_file_name(file.split("\\")[-1], int(os.path.getsize(file) / 1024))
+    logger.debug(f"Loaded cached summary: {file=} {cache_path=}")
+    return file_summary
+
+
+def store_cached_summary(
+    file_summary: FileSummary, file_hash: str, cache_dir: str = None
+):
+    """Stores FileSummary in the cache (see evict_cache to limit cache size)."""
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    if not isinstance(file_summary, FileSummary):
+        raise TypeError(f"Summary to cache is not FileSummary: {type(file_summary)=}")
+    cache_path = get_cache_path(file_hash, cache_dir)
+    with open(f"{cache_path}.tmp", "wb") as f:
+        pickle.dump(file_summary, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f"{cache_path}.tmp", cache_path)
+    logger.debug(f"Stored cached summary: {file_summary.file_name=} {cache_path=}")
+
+
+def evict_cache(cache_dir: str = None, max_size=None):
+    """Deletes least recently used (modified) cache files until total size is within max_size (MB)."""
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    if max_size is None:
+        max_size = config.CACHE.max_size_mb
+    max_bytes = float(max_size) * 1024 * 1024
+    cache_files = glob.glob(f"{cache_dir}/*{cache_file_extension}")
+    cache_sizes = {file: os.path.getsize(file) for file in cache_files}
+    total_bytes = sum(cache_sizes.values())
+    if total_bytes <= max_bytes:
+        return
+    sorted_cache_files = sorted(cache_files, key=lambda file: os.path.getmtime(file))
+    for cache_file in sorted_cache_files:
+        if total_bytes <= max_bytes:
+            break
+        os.remove(cache_file)
+        total_bytes -= cache_sizes[cache_file]
+        logger.debug(f"Evicted cached summary: {cache_file}")
@@ -1,12 +1,15 @@
-from src.managers.logHandler import logger
+from src.managers.logHandler import logger, trace_level, detail_level
+from heapq import heappop
+from time import perf_counter
 from src.classes.FileData import FileData
-from src.utils.coordUtils import get_closest_obj
-from src.data.typeReferences import killer_types
-from src.utils.processingUtils import check_is_type, check_lists_share_element
-from src.data.valueReferences import max_kill_distance
+from src.classes.ObjectGrid import ObjectGrid
+from src.classes.Telemetry import time_call
+from src.utils.coordUtils import get_closest_dying_obj_in_grid
+from src.data.typeReferences import killer_types_mask
+from src.utils.processingUtils import check_is_type
+from src.data.valueReferences import max_kill_distance, max_dying_time
 
 
-# TODO MASSIVE TIME SINK
 def process_file_tick(file: FileData):
     """Processes all data within the associated FileData.\n\n
     Should not be run every file update - intended to be run/updated every second of file-update-time at most.\n\n
@@ -14,59 +17,238 @@ def process_file_tick(file: FileData):
     """
     if not isinstance(file, FileData):
         raise TypeError(f"FileData is not FileData: {type(file)=}")
+    start_time = perf_counter()
+    # set again by any kill/expiry below, so the next tick re-checks the remaining dying objects
+    file.dying_changed = False
+    process_dying_objects(file)
+    process_dying_shells(file)
+    discard_stale_deadlines(file)
+    if file.telemetry is not None:
+        file.telemetry.add_time("process_file_tick", perf_counter() - start_time)
+
+
+def sweep_kill_attribution(file: FileData):
+    """Attributes kills in one pass over all deaths, after a file has been read with sweep_attribution (no ticks while reading).\n
+    Deaths are sorted by death_time_stamp, and each dying weapon (or shell) is compared with the deaths within max_dying_time of its own (a sliding window),
+    indexed by death position in a grid, so only nearby deaths are compared.\n
+    As per tick, a weapon kills the closest death within max_kill_distance, unless that is a weapon, and kills are added with add_kill.
+    Unlike ticks, each weapon is compared once, with every death in its window (including later deaths), so a few kills can differ from ticks.\n
+    Deaths over max_dying_time before the final time stamp are updated to dead, the rest are left dying.
+    """
+    if not file.sweep_attribution:
+        raise ValueError(
+            f"File was not read with sweep attribution (kills were attributed per tick): {file.file_name=}"
+        )
+    # stable, so ties stay in the order objects started dying (as in dying_objects)
+    death_events = sorted(
+        file.death_events, key=lambda event: event[0].death_time_stamp
+    )
+    file.sweep_attribution = False
+    file.death_events = []
+    dying_dicts = {obj.uid: dying_dict for obj, dying_dict in death_events}
+    death_order = {obj.uid: index for index, (obj, _) in enumerate(death_events)}
+    # deaths within max_dying_time of the current death (killed deaths are removed)
+    window_grid = ObjectGrid(max_kill_distance)
+    window_start = window_end = 0
+    for obj, _ in death_events:
+        while (
+            window_end < len(death_events)
+            and death_events[window_end][0].death_time_stamp - obj.death_time_stamp
+            <= max_dying_time
+        ):
+            add_death_pos(window_grid, death_events[window_end][0])
+            window_end += 1
+        while (
+            obj.death_time_stamp - death_events[window_start][0].death_time_stamp
+            > max_dying_time
+        ):
+            window_grid.remove(death_events[window_start][0])
+            window_start += 1
+        if obj.state != "Dying" or not check_is_type(obj, killer_types_mask):
+            continue
+        closest_obj, dist = time_call(
+            file.telemetry,
+            "get_closest_obj",
+            get_closest_dying_obj_in_grid,
+            obj.get_death_pos(),
+            window_grid,
+            max_kill_distance,
+            exclude=obj,
+            order=death_order,
+        )
+        if closest_obj is None or check_is_type(closest_obj, killer_types_mask):
+            continue
+        # a reused id cannot be dying twice (as per tick, where the later death replaces the earlier in its dying dict)
+        if closest_obj.id == obj.id and type(closest_obj) == type(obj):
+            continue
+        if dist < max_kill_distance:
+            # ids can be reused by later deaths, so each is set in its dying dict before it is killed
+            for dying_obj in [obj, closest_obj]:
+                dying_dicts[dying_obj.uid][dying_obj.id] = dying_obj
+            obj.add_kill(closest_obj, dist=dist)
+            window_grid.remove(obj)
+            window_grid.remove(closest_obj)
+    file.dying_objects.clear()
+    file.dying_shells.clear()
+    for obj, dying_dict in death_events:
+        if obj.state != "Dying":
+            continue
+        dying_dict[obj.id] = obj
+        if (file.time_stamp - obj.death_time_stamp) > max_dying_time:
+            obj.update_to_dead()
+        else:
+            file.add_dying(obj, dying_dict)
+    if logger.isEnabledFor(detail_level):
+        logger.detail(
+            f"Sweep kill attribution: {len(death_events)} deaths - {file.file_name}"
+        )
+
+
+def check_tick_due(file: FileData) -> bool:
+    """Returns True if process_file_tick could change anything: dying objects/shells have changed since the last tick, or one's dying time is over.\n
+    Otherwise a tick would repeat the last (unchanged) tick, so it can be skipped.\n
+    Only checks the earliest deadline (FileData.dying_deadlines), rather than every dying object.
+    """
+    if file.dying_changed:
+        return True
+    discard_stale_deadlines(file)
+    if not file.dying_deadlines:
+        return False
+    return (file.time_stamp - file.dying_deadlines[0][0]) > max_dying_time
+
+
+def discard_stale_deadlines(file: FileData):
+    """Pops the earliest deadlines (FileData.dying_deadlines) of objects that are no longer dying (e.g.: killed, expired), or no longer processed (e.g.: id reused).\n
+    Run after every tick, which expires every object whose dying time is over, so the heap only holds objects that started dying within the last max_dying_time (and later entries).
+    """
+    deadlines = file.dying_deadlines
+    while deadlines:
+        death_time_stamp, _, obj, dying_dict = deadlines[0]
+        if dying_dict.get(obj.id) is obj and obj.death_time_stamp == death_time_stamp:
+            return
+        heappop(deadlines)
+
+
+def get_death_pos_grid(objs: list) -> ObjectGrid:
+    """Returns an ObjectGrid of objs by death position, with max_kill_distance cells (so kill searches only check neighbouring cells)."""
+    death_pos_grid = ObjectGrid(max_kill_distance)
+    for obj in objs:
+        add_death_pos(death_pos_grid, obj)
+    return death_pos_grid
+
+
+def add_death_pos(death_pos_grid: ObjectGrid, obj):
+    """Adds obj to death_pos_grid at its death position (objects without a death position are not added)."""
+    lat, long, _ = obj.get_death_pos()
+    if lat is not None and long is not None:
+        death_pos_grid.update(obj, lat, long)
+
+
+def process_dying_objects(file: FileData):
+    """Updates dying objects to dead once their dying time is over, and attributes kills from dying weapons to the closest dying object.\n
+    Death positions are indexed in a grid built once per tick, so each weapon only compares against nearby dying objects.
+    """
     dying_ref_list = [
         obj
         for obj in list(file.dying_objects.values())
         if not obj.check_skip_data_processing_type()
     ]
+    # objects are removed from the grid as they die during this tick
+    dying_grid = get_death_pos_grid(dying_ref_list)
+    # ties go to the earliest in dying_ref_list (as when scanning the list)
+    dying_order = {obj.uid: index for index, obj in enumerate(dying_ref_list)}
     for ref_obj in dying_ref_list:
+        # ensure ref_obj is dying (i.e.: hasn't died since dying_ref_list was created, e.g.: killed earlier in this tick)
+        if not ref_obj.check_is_dying():
+            continue
         # if dying grace period is over, update to dead
-        if (file.time_stamp - ref_obj.death_time_stamp) > 10:
+        if (file.time_stamp - ref_obj.death_time_stamp) > max_dying_time:
             ref_obj.update_to_dead()
-            logger.trace(f"Dying process delay expired: {ref_obj.info()}")
-            continue
-        # ensure ref_obj is dying (i.e.: hasn't died since dying_ref_list was created)
-        if not ref_obj.check_is_dying():
+            dying_grid.remove(ref_obj)
+            if logger.isEnabledFor(trace_level):
+                logger.trace(f"Dying process delay expired: {ref_obj.info()}")
             continue
 
-        # if there is more than 1 object, find closest object and distance
-        if len(dying_ref_list) > 1:
-            closest_list = [o for o in dying_ref_list if o.check_is_dying()]
-            closest_obj, dist = get_closest_obj(ref_obj, closest_list)
         # if len == 1 only the current object remains, can skip rest of processing
-        elif len(dying_ref_list) == 1:
+        if len(dying_ref_list) == 1:
             logger.detail(f"ref_list len == 1: {len(dying_ref_list)=}")
             return
-        # if len == 0, something has gone wrong, as if no Dying objects remain, this point shouldn't be reached
-        elif len(dying_ref_list) == 0:
-            raise ValueError(
-                f"ref_list len == 0: {[[o.id, o.uid, o.state] for o in dying_ref_list]=}"
-            )
-            return
-        else:
-            return
 
-        if not check_lists_share_element(ref_obj.type, killer_types):
+        if not check_is_type(ref_obj, killer_types_mask):
             continue
 
         if ref_obj.check_skip_data_processing_type() or ref_obj.check_is_dead():
             continue
             # both above and below unfortunately (potentially?) necessary, as objects in ref_list change during this loop
 
-        if closest_obj == None:
-            logger.trace(f"closest_obj is None - {file.dying_objects.keys()=}")
+        # only ref_obj remains dying
+        if len(dying_grid.obj_cells) <= 1:
+            if logger.isEnabledFor(trace_level):
+                logger.trace(f"closest_obj is None - {file.dying_objects.keys()=}")
             return
 
+        closest_obj, dist = time_call(
+            file.telemetry,
+            "get_closest_obj",
+            get_closest_dying_obj_in_grid,
+            ref_obj.get_death_pos(),
+            dying_grid,
+            max_kill_distance,
+            exclude=ref_obj,
+            order=dying_order,
+        )
+        # no dying object within max_kill_distance
+        if closest_obj == None:
+            continue
+
         if not closest_obj.check_is_dying():
             raise ValueError(
                 f"Closest object is not dying:\n\t{closest_obj.id=} {closest_obj.type=}\n\t{ref_obj.id=} {ref_obj.type=}"
             )
-        # TODO: currently only checks for kills, NOT HITS
+        # hits without kills (and near misses) are found after reading, see analyticsUtils.get_munition_metrics
         # TODO: get closest objects within range/radius
         # TODO: get working coordinates to distance function
         if dist < max_kill_distance:
-            if check_is_type(ref_obj, killer_types) and not check_is_type(
-                closest_obj, killer_types
+            if check_is_type(ref_obj, killer_types_mask) and not check_is_type(
+                closest_obj, killer_types_mask
             ):
                 ref_obj.add_kill(closest_obj, dist=dist)
+                dying_grid.remove(ref_obj)
+                dying_grid.remove(closest_obj)
     # TODO add more checks here, NEEDS testing
+
+
+def process_dying_shells(file: FileData):
+    """Attributes kills from dying (compact) shells, after process_dying_objects, as for dying weapons:
+    a shell kills the closest dying object or shell, unless that is a weapon (e.g.: another shell of the same burst).\n
+    Shells are updated to dead (discarded) once their dying time is over."""
+    for shell in list(file.dying_shells.values()):
+        if (file.time_stamp - shell.death_time_stamp) > max_dying_time:
+            shell.update_to_dead()
+    if not file.dying_shells:
+        return
+    dying_ref_list = [
+        obj
+        for obj in file.dying_objects.values()
+        if not obj.check_skip_data_processing_type()
+    ] + list(file.dying_shells.values())
+    # shells and victims are removed from the grid as they die during this tick
+    dying_grid = get_death_pos_grid(dying_ref_list)
+    dying_order = {obj.uid: index for index, obj in enumerate(dying_ref_list)}
+    for shell in list(file.dying_shells.values()):
+        closest_obj, dist = time_call(
+            file.telemetry,
+            "get_closest_obj",
+            get_closest_dying_obj_in_grid,
+            shell.get_death_pos(),
+            dying_grid,
+            max_kill_distance,
+            exclude=shell,
+            order=dying_order,
+        )
+        if closest_obj is None or check_is_type(closest_obj, killer_types_mask):
+            continue
+        if dist < max_kill_distance:
+            shell.add_kill(closest_obj, dist=dist)
+            dying_grid.remove(shell)
+            dying_grid.remove(closest_obj)
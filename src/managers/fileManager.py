@@ -1,13 +1,33 @@
 from src.managers.logHandler import logger
 import zipfile
 import os
+import io
+import time
+from typing import Iterable
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
 from src.utils.fileUtils import FileData
+from src.data.valueReferences import follow_read_size
+from src.classes.FileSummary import (
+    FileSummary,
+    add_pruned_summary,
+    get_file_summary,
+)
+from src.managers.cacheManager import (
+    get_file_hash,
+    save_hash_index,
+    load_cached_summary,
+    store_cached_summary,
+    evict_cache,
+)
+from src.utils.configUtils import config
 from src.managers.lineHandler import (
     global_line,
     object_line,
     time_stamp_line,
     obj_removed_line,
 )
+from src.managers.dataProcessor import sweep_kill_attribution
 from src.utils.timeUtils import get_timer
 
 
@@ -29,56 +49,253 @@ def is_zip(file: str) -> bool:
     return False
 
 
-def read_files(files: list[str], AuthorIsUser: bool):
-    """Takes a list[str] of file paths and returns a dict of index:FileData objects, having passed each file to process_file()."""
+def read_files(files: list[str], AuthorIsUser: bool, workers: int = 1):
+    """Takes a list[str] of file paths and returns a dict of index:FileData objects, having passed each file to process_file().\n
+    If workers > 1, files are spread across a process pool and index:FileSummary objects are returned instead (in the same order as files).\n
+    If the cache is enabled (config.ini), files with a cached FileSummary are not processed, their FileSummary is returned instead.
+    """
+    all_files_data = {}
+    file_hashes = {}
+    if config.CACHE.enabled:
+        for index, file in enumerate(files):
+            file_hashes[index] = get_file_hash(file)
+            file_summary = load_cached_summary(file, file_hashes[index])
+            if file_summary:
+                all_files_data[index] = file_summary
+        save_hash_index()
+        logger.info(f"Cached files: {len(all_files_data)} of {len(files)}")
+    uncached_indexes = [
+        index for index in range(len(files)) if index not in all_files_data
+    ]
+    uncached_files = [files[index] for index in uncached_indexes]
+
+    if workers > 1:
+        uncached_data = read_files_parallel(uncached_files, AuthorIsUser, workers)
+    else:
+        uncached_data = read_files_serial(uncached_files, AuthorIsUser)
+
+    for uncached_index, file_data in uncached_data.items():
+        index = uncached_indexes[uncached_index]
+        if config.CACHE.enabled:
+            file_data = get_file_summary(file_data)
+            store_cached_summary(file_data, file_hashes[index])
+        all_files_data[index] = file_data
+    if config.CACHE.enabled:
+        evict_cache()
+    return dict(sorted(all_files_data.items()))
+
+
+def read_files_serial(files: list[str], AuthorIsUser: bool):
+    """Reads files one after another, returns a dict of index:FileData objects."""
     all_files_data = {}
     logger.info(f"Total files: {len(files)}   -   {get_timer()}")
     for index, file in enumerate(files):
         logger.info(f"Reading file {index} Time: {get_timer():.2f}  -   {file}")
-        all_files_data[index] = FileData()
-        file_data = all_files_data[index]
-        file_data.file_size = int(os.path.getsize(file) / 1024)  # get size in KB
-        file_data.file_name = file.split("\\")[-1]
-        # files_data[index] = file_data = FileData()     # TODO will this work?
-        # TODO check each file is actually a TacView File (both zip and non-zip)
-        if is_zip(file):
-            file_data.is_zip = True
-            with zipfile.ZipFile(
-                file, mode="r"
-            ) as zipped_file:  # FUTUREDO better/shorter way to read zips?
-                contents = zipped_file.namelist()
-                if len(contents) != 1:  # FUTUREDO assert -> continue
-                    # all acmi zips should only have 1 .txt.acmi (or .mod) file
-                    # TODO: but assert will stop entire program, rather than just skipping (but good for testing)
-                    # continue
-                    raise ValueError(
-                        f"ZIP has multiple compressed files\n{file=}\n{contents=}"
-                    )
-                with zipped_file.open(contents[0]) as unzipped:
-                    file_text = unzipped.read()
-                    file_decoded = file_text.decode("utf-8-sig")  # default ZIP encoding
-                    file_formatted = file_decoded.splitlines()
-        else:
-            file_data.is_zip = False
-            with open(file, "r", encoding="utf-8-sig") as open_file:
-                file_formatted = [line for line in open_file]
-        process_file(file_data, file_formatted, AuthorIsUser)
+        all_files_data[index] = read_file(file, AuthorIsUser)
     return all_files_data
 
 
-def process_file(file_data: FileData, file: list[str], AuthorIsUser: bool):
-    """Parses a list of lines from a file and updates the FileData object."""
-    file_data.file_length = len(file)
+def read_files_parallel(files: list[str], AuthorIsUser: bool, workers: int):
+    """Reads files across a pool of worker processes, each returning a (picklable) FileSummary.\n
+    Returns a dict of index:FileSummary objects, in the same order as files."""
+    all_files_data = {}
+    workers = min(workers, len(files)) if files else 1
+    logger.info(f"Total files: {len(files)}   Workers: {workers}   -   {get_timer()}")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(logger.get_log_file_path(), logger.get_worker_queue()),
+    ) as executor:
+        # map returns results in the order files were submitted, not completed
+        file_summaries = executor.map(read_file_summary, files, repeat(AuthorIsUser))
+        for index, (file, file_summary) in enumerate(zip(files, file_summaries)):
+            logger.info(f"Read file {index} Time: {get_timer():.2f}  -   {file}")
+            all_files_data[index] = file_summary
+    return all_files_data
+
+
+def init_worker(log_file_path: str, log_queue=None):
+    """Process pool initializer - sets up the worker's logger to append to the parent process' log file.\n
+    If log_queue (queue logging), the worker's logs are sent to the parent process instead (see Logger.get_worker_queue).
+    """
+    logger.setup_worker(log_file_path, log_queue)
+    logger.debug(f"Worker process initialised: {os.getpid()}")
+
+
+def read_file_summary(file: str, AuthorIsUser: bool) -> FileSummary:
+    """Reads and processes a single file, returning a FileSummary (used by worker processes)."""
+    return get_file_summary(read_file(file, AuthorIsUser))
+
+
+def read_file(file: str, AuthorIsUser: bool) -> FileData:
+    """Reads and processes a single file, returning its FileData.\n
+    Kills are attributed per tick while reading, or in one pass after reading if config PROCESSING.kill_attribution is sweep (see dataProcessor.sweep_kill_attribution).
+    """
+    file_data = FileData()
+    file_data.file_size = int(os.path.getsize(file) / 1024)  # get size in KB
+    file_data.file_name = file.split("\\")[-1]
+    # TODO check each file is actually a TacView File (both zip and non-zip)
+    file_data.is_zip = is_zip(file)
+    file_data.sweep_attribution = get_sweep_attribution()
+    file_lines = read_file_lines(file, file_data.is_zip)
+    process_file(file_data, file_lines, AuthorIsUser)
+    if file_data.sweep_attribution:
+        sweep_kill_attribution(file_data)
+    return file_data
+
+
+def get_sweep_attribution() -> bool:
+    """Returns True if config PROCESSING.kill_attribution is sweep (after reading), False if tick (while reading)."""
+    kill_attribution = config.PROCESSING.kill_attribution
+    if kill_attribution not in ["tick", "sweep"]:
+        raise ValueError(
+            f"config PROCESSING.kill_attribution is not tick or sweep: {kill_attribution=}"
+        )
+    return kill_attribution == "sweep"
+
+
+def follow_file(
+    file: str,
+    AuthorIsUser: bool,
+    event_listener=None,
+    poll_interval: float = 1.0,
+    idle_timeout: float = None,
+    max_dead_time: float = 60,
+    stop_event=None,
+) -> FileData:
+    """Processes a (non-zip) file that is still being written, reading new lines as they are appended.\n
+    event_listener is called with each DCSEvent (e.g.: Launch, Kill) as it happens.\n
+    Objects dead for longer than max_dead_time (file time) are pruned, keeping memory bounded - their rows are kept (FileData.pruned_summary), so outputs match reading the whole file.\n
+    Returns FileData once no new lines have been written for idle_timeout seconds (None: follow indefinitely), or once stop_event (e.g.: threading.Event, set by the writer once done) is set and all lines written before it was set have been read.
+    """
+    if is_zip(file):
+        raise ValueError(f"Cannot follow a zip file: {file=}")
+    file_data = FileData()
+    file_data.file_name = file.split("\\")[-1]
+    file_data.is_zip = False
+    if event_listener:
+        file_data.add_event_listener(event_listener)
+    logger.info(f"Following file: {file}")
+
+    partial_line = ""  # line still being written (no line ending yet)
+    last_read_time = time.monotonic()
+    with open(file, "r", encoding="utf-8-sig") as open_file:
+        while True:
+            # checked before reading, so lines written before the stop are still read
+            stopping = stop_event is not None and stop_event.is_set()
+            # size hint bounds the lines held in memory if the file is already large
+            lines = open_file.readlines(follow_read_size)
+            if not lines:
+                if stopping:
+                    break
+                if (
+                    idle_timeout is not None
+                    and time.monotonic() - last_read_time > idle_timeout
+                ):
+                    break
+                time.sleep(poll_interval)
+                continue
+            last_read_time = time.monotonic()
+            lines[0] = partial_line + lines[0]
+            partial_line = "" if lines[-1].endswith("\n") else lines.pop()
+            process_file(file_data, lines, AuthorIsUser)
+            pruned = file_data.prune_dead_objects(
+                max_dead_time,
+                summarise=lambda objs: add_pruned_summary(file_data, objs),
+            )
+            if pruned:
+                logger.trace(f"Pruned {pruned} dead objects: {file_data.time_stamp=}")
+    if partial_line:
+        process_file(file_data, [partial_line], AuthorIsUser)
+    file_data.file_size = int(os.path.getsize(file) / 1024)  # get size in KB
+    return file_data
+
+
+def scan_files(files: list[str]) -> dict:
+    """Takes a list[str] of file paths and returns a dict of index:FileData objects, with only each file's header read (see scan_file)."""
+    return {index: scan_file(file) for index, file in enumerate(files)}
+
+
+def scan_file(file: str) -> FileData:
+    """Reads only the header of a file (FileType, FileVersion and global '0,' lines), stopping at the first time frame ('#') line.\n
+    Lines are streamed, so only the first blocks of a zip are decompressed.\n
+    Returns FileData with header_only set (no objects, file length or time stamps).
+    """
+    file_data = FileData()
+    file_data.file_size = int(os.path.getsize(file) / 1024)  # get size in KB
+    file_data.file_name = file.split("\\")[-1]
+    file_data.is_zip = is_zip(file)
+    file_data.header_only = True
+    file_lines = read_file_lines(file, file_data.is_zip)
+    try:
+        process_file(file_data, header_lines(file_lines), AuthorIsUser=True)
+    finally:
+        file_lines.close()  # closes the file, without reading the remaining lines
+    return file_data
+
+
+def header_lines(file: Iterable[str]):
+    """Yields the header lines of file (FileType, FileVersion and global '0,' lines, including continued lines).\n
+    Stops at the first time frame ('#') line that is not within a continued line, other (e.g.: object) lines are skipped.
+    """
+    line_continued = False
+    for line_number, line in enumerate(file):
+        if line_continued or line_number == 0:
+            yield line
+        elif line.startswith("#"):
+            return
+        elif line.startswith(("FileVersion=", "0,")):
+            yield line
+        line_continued = line.rstrip("\n").endswith("\\")
+
+
+def read_file_lines(file: str, zipped: bool):
+    """Yields decoded lines from a (zipped) file one at a time, without reading the whole file into memory.\n
+    The file is closed once all lines have been consumed."""
+    if zipped:
+        with zipfile.ZipFile(
+            file, mode="r"
+        ) as zipped_file:  # FUTUREDO better/shorter way to read zips?
+            contents = zipped_file.namelist()
+            if len(contents) != 1:  # FUTUREDO assert -> continue
+                # all acmi zips should only have 1 .txt.acmi (or .mod) file
+                # TODO: but assert will stop entire program, rather than just skipping (but good for testing)
+                # continue
+                raise ValueError(
+                    f"ZIP has multiple compressed files\n{file=}\n{contents=}"
+                )
+            with zipped_file.open(contents[0]) as unzipped, io.TextIOWrapper(
+                unzipped, encoding="utf-8-sig"  # default ZIP encoding
+            ) as unzipped_text:
+                yield from unzipped_text
+    else:
+        with open(file, "r", encoding="utf-8-sig") as open_file:
+            yield from open_file
+
+
+def process_file(file_data: FileData, file: Iterable[str], AuthorIsUser: bool):
+    """Parses an iterable of lines from a file and updates the FileData object.\n
+    Lines are consumed one at a time (file_length is counted as they are read), so a generator can be passed to avoid holding the whole file in memory.\n
+    Parsing state is kept in file_data, so consecutive parts of a file can be passed in separate calls.\n
+    If file_data.telemetry, each line's category and time are recorded (see Telemetry.add_line).
+    """
     if file_data.is_zip:
         file_start = "∩╗┐FileType="
     else:
         file_start = "ï»¿FileType="  # I have no idea what these characters are, I assume same as the .zip just extracted
-    last_file_tick_processed = 0
-    line_continued = False  # FUTUREDO distinguish between comments/briefing/debriefing
+    last_file_tick_processed = file_data.last_file_tick_processed
+    # FUTUREDO distinguish between comments/briefing/debriefing
+    line_continued = file_data.line_continued
+    telemetry = file_data.telemetry
+    start_time = time.perf_counter()
 
-    for index, line in enumerate(file):
+    for line in file:
+        if telemetry is not None:
+            line_start_time = time.perf_counter()
+        category = "header"
+        file_data.file_length += 1
         line = line.rstrip("\n")
-        if index == 0:
+        if file_data.file_length == 1:
             if not line.startswith(file_start):
                 if line.startswith("FileType="):
                     # logger.debug(
@@ -111,14 +328,24 @@ def process_file(file_data: FileData, file: list[str], AuthorIsUser: bool):
             file_data.file_version = line[len("FileVersion=") :]
         elif line.startswith("0,"):
             global_line(line, file_data)
+            category = "global"
         elif line.startswith("#"):
             last_file_tick_processed = time_stamp_line(
                 line, file_data, last_file_tick_processed
             )
+            category = "timestamp"
         elif line.startswith("-"):
             obj_removed_line(line, file_data)
+            category = "removal"
         else:
             object_line(line, file_data)
+            category = "object"
+        if telemetry is not None:
+            telemetry.add_line(category, time.perf_counter() - line_start_time)
+    if telemetry is not None:
+        telemetry.processing_time += time.perf_counter() - start_time
+    file_data.last_file_tick_processed = last_file_tick_processed
+    file_data.line_continued = line_continued
     return
 
 
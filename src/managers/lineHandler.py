@@ -1,16 +1,18 @@
-from src.managers.logHandler import logger
-from src.utils.fileUtils import (
-    FileData,
-    attr_split,
-)
+from src.managers.logHandler import logger, trace_level, detail_level
+from sys import intern
+from src.utils.fileUtils import FileData
+from src.utils.tokenUtils import split_attrs
 from src.data.acmiAttrDicts import (
-    acmi_old_obj_to_attr,
-    acmi_new_obj_to_attr,
     acmi_obj_to_attr_all,
     acmi_global_to_attr,
 )
-from src.managers.dataProcessor import process_file_tick
-from src.utils.coordUtils import get_closest_obj
+from src.classes.DCSObject import get_types
+from src.classes.Telemetry import time_call
+from src.data.typeReferences import compact_types_mask, launched_types_mask
+from src.data.valueReferences import max_launch_distance
+from src.managers.dataProcessor import process_file_tick, check_tick_due
+from src.utils.configUtils import config
+from src.utils.coordUtils import get_closest_obj_in_grid
 
 # https://www.tacview.net/documentation/acmi/en/
 # T = Longitude | Latitude | Altitude
@@ -19,6 +21,64 @@ from src.utils.coordUtils import get_closest_obj
 # T = Longitude | Latitude | Altitude | Roll | Pitch | Yaw | U | V | Heading
 
 
+def transform_attr(obj_data, transform_line: str):
+    """Updates object kinematics (coordinates, and orientation/U,V if provided) from a T= attribute value."""
+    if obj_data.check_is_dead():
+        logger.critical(
+            f"Updating object attributes with check_state(Dead):\n\t{obj_data.info(all=True)}"
+        )
+    obj_data.update_transform_fields(transform_line.split("|"))
+
+
+def type_attr(obj_data, types: str):
+    """Sets object types from a Type= attribute value."""
+    obj_data.set_types(types)
+
+
+def get_set_attr_handler(obj_attr_name: str):
+    """Returns an attribute handler setting obj_attr_name to the (interned) attribute value.\n
+    Values (e.g.: name, pilot, coalition) repeat across many objects, so interning keeps one copy of each.
+    """
+
+    def set_attr(obj_data, value: str):
+        setattr(obj_data, obj_attr_name, intern(value))
+
+    return set_attr
+
+
+def get_obj_attr_handlers(acmi_obj_to_attr: dict) -> dict:
+    """Returns {acmi key: handler(obj_data, value)} built from an acmiAttrDicts {acmi pointer: attribute name} dict.\n
+    Keys exclude '=' (object line attributes are split at the first '='), pointers mapped to None are skipped.\n
+    Attributes that are not simply set (T=, Type=) use special handlers.
+    """
+    special_handlers = {"T": transform_attr, "Type": type_attr}
+    obj_attr_handlers = {}
+    for acmi_pointer, obj_attr_name in acmi_obj_to_attr.items():
+        acmi_key = acmi_pointer.rstrip("=")
+        if acmi_key in special_handlers:
+            obj_attr_handlers[acmi_key] = special_handlers[acmi_key]
+        elif obj_attr_name is not None:
+            obj_attr_handlers[acmi_key] = get_set_attr_handler(obj_attr_name)
+    return obj_attr_handlers
+
+
+obj_attr_handlers = get_obj_attr_handlers(acmi_obj_to_attr_all)
+
+
+def shell_transform_attr(shell, transform_line: str):
+    """Updates (compact) shell coordinates from a T= attribute value (orientation/U,V are not kept)."""
+    transformers = transform_line.split("|")
+    shell.update_transform(transformers[1], transformers[0], transformers[2])
+
+
+# DCSShell only keeps position, name, and coalition (keys exclude '=', as obj_attr_handlers)
+shell_attr_handlers = {
+    "T": shell_transform_attr,
+    "Name": get_set_attr_handler("name"),
+    "Coalition": get_set_attr_handler("coalition"),
+}
+
+
 def global_line(line: list, file_data: FileData):
     """Takes a global line and updates the FileData object."""
     for attr_pointer, attr_var_name in acmi_global_to_attr.items():
@@ -28,8 +88,19 @@ def global_line(line: list, file_data: FileData):
 
 def object_line(line: list, file_data: FileData):
     """Parses an object update line and updates the relevant attributes in the FileData object."""
-    attrs = attr_split(line)
+    # ids never contain (escaped) commas, so known shells can skip split_attrs
+    id_end = line.find(",")
+    shell = file_data.shells.get(line[:id_end]) if id_end != -1 else None
+    if shell:
+        return shell_line(line.split(","), shell)
+    if file_data.telemetry is None:
+        attrs = split_attrs(line)
+    else:
+        attrs = time_call(file_data.telemetry, "attr_split", split_attrs, line)
     id = str(attrs[0])
+    shell = file_data.shells.get(id)
+    if shell:
+        return shell_line(attrs, shell)
     new = False
     obj_by_id = file_data.get_obj_by_id(id, "Alive")
     if obj_by_id:
@@ -39,79 +110,93 @@ def object_line(line: list, file_data: FileData):
         ):  # TODO update this to something more relevant
             return
         new = False
-        acmi_obj_attr_list = acmi_old_obj_to_attr
     else:
+        types = get_compact_types(attrs)
+        if types:
+            if file_data.telemetry is not None:
+                file_data.telemetry.add_object(types)
+            return shell_line(attrs, file_data.new_shell(id, types))
         new = True
         obj_data = file_data.new_obj(id, init_state="Alive")
-        acmi_obj_attr_list = acmi_new_obj_to_attr
-    acmi_obj_attr_list = acmi_obj_to_attr_all  # FUTUREDO could use shorter dictionary to reduce time/memory? Unsure if it would have any effect
-    for attr_line in attrs:
-        if attr_line.startswith("Type="):
-            obj_data.set_types(attr_line[len("Type=") :])
-            continue
-        for acmi_pointer, obj_attr_name in acmi_obj_attr_list.items():
-            if attr_line.startswith(
-                acmi_pointer
-            ):  # TODO how to make this more efficient?
-                if acmi_pointer == "T=":
-                    if obj_data.check_is_dead():
-                        logger.critical(
-                            f"Updating object attributes with check_state(Dead):\n\t{obj_data.__dict__}"
-                        )
-                    transform_line = attr_line[2:]
-                    transformers = transform_line.split("|")
-                    obj_data.update_transform(
-                        transformers[1], transformers[0], transformers[2]
-                    )
-                    if len(transformers) == 5:
-                        obj_data.update_simple_transform(
-                            transformers[3], transformers[4]
-                        )
-                    elif len(transformers) == 9:
-                        obj_data.update_simple_transform(
-                            transformers[6], transformers[7]
-                        )
-                elif obj_attr_name == None:
-                    continue  # dict.value==None -> skip this attr
-                else:
-                    setattr(obj_data, obj_attr_name, attr_line[len(acmi_pointer) :])
+    for attr_line in attrs[1:]:
+        acmi_key, _, value = attr_line.partition("=")
+        attr_handler = obj_attr_handlers.get(acmi_key)
+        if attr_handler:
+            attr_handler(obj_data, value)
     if new:
         if obj_data.file_obj != file_data:
             raise ValueError(
                 f"New object FileDate != file_data passed to object_line {obj_data.file_obj=} {file_data=}"
             )
-        if "Missile" in obj_data.type:
-            max_avg_dist = 0.01
-            max_alt = 100
-            launcher_obj, avg_unit_dist = get_closest_obj(
-                obj_data, list(file_data.objects.values())
+        if file_data.telemetry is not None:
+            file_data.telemetry.add_object(obj_data.type)
+        if obj_data.type_flags & launched_types_mask:
+            launcher_obj, avg_unit_dist = time_call(
+                file_data.telemetry,
+                "get_closest_obj",
+                get_closest_obj_in_grid,
+                obj_data,
+                file_data.object_grid,
+                max_launch_distance,
             )  # FUTUREDO update get_launcher logic
 
-            if launcher_obj == None:
+            if launcher_obj == None and len(file_data.objects) <= 1:
                 logger.warning(
                     f"Missile launch, no other unit: {obj_data.id=} {obj_data.name} {obj_data.spawn_time_stamp=} {obj_data.death_time_stamp=}"
                 )
-            elif max_avg_dist < avg_unit_dist:
+            elif launcher_obj == None:
                 logger.debug(
-                    f"Missile launch, no unit within range - {max_avg_dist=} {avg_unit_dist=}\n\tMissile: {obj_data.id} {obj_data.type} {obj_data.name} {obj_data.pilot}\n\tLauncher: {launcher_obj.id} {launcher_obj.type} {launcher_obj.name} {launcher_obj.pilot}"
+                    f"Missile launch, no unit within range - {max_launch_distance=}\n\tMissile: {obj_data.id} {obj_data.type} {obj_data.name} {obj_data.pilot}"
                 )
             else:
                 launcher_obj.add_launch(obj_data)
-                logger.trace(
-                    f"Missile launch success - {max_avg_dist=} {avg_unit_dist=}\n\tMissile: {obj_data.id} {obj_data.type} {obj_data.name} {obj_data.pilot}\n\tLauncher: {launcher_obj.id} {launcher_obj.type} {launcher_obj.name} {launcher_obj.pilot}"
-                )
-        logger.detail(f"NEW OBJECT: {obj_data.info()}")
+                if logger.isEnabledFor(trace_level):
+                    logger.trace(
+                        f"Missile launch success - {max_launch_distance=} {avg_unit_dist=}\n\tMissile: {obj_data.id} {obj_data.type} {obj_data.name} {obj_data.pilot}\n\tLauncher: {launcher_obj.id} {launcher_obj.type} {launcher_obj.name} {launcher_obj.pilot}"
+                    )
+        if file_data.track_store is not None:
+            # started once types are set (T= is usually before Type=)
+            file_data.track_store.start_track(obj_data)
+        if logger.isEnabledFor(detail_level):
+            logger.detail(f"NEW OBJECT: {obj_data.info()}")
+
+
+def get_compact_types(attrs: list):
+    """Returns the type list of a new object line if it is a compact (DCSShell) type, else None."""
+    for attr in attrs:
+        if attr.startswith("Type="):
+            types, type_flags = get_types(attr[len("Type=") :])
+            if not type_flags & compact_types_mask:
+                return None
+            return types
+    return None
+
+
+def shell_line(attrs: list, shell):
+    """Updates a (compact) DCSShell from an object line's attributes (see shell_attr_handlers) - only position, name, and coalition are kept."""
+    for attr_line in attrs[1:]:
+        acmi_key, _, value = attr_line.partition("=")
+        attr_handler = shell_attr_handlers.get(acmi_key)
+        if attr_handler:
+            attr_handler(shell, value)
 
 
 def time_stamp_line(line: list, file_data: FileData, last_file_tick_processed: int):
-    """Takes a time stamp line and updates the FileData object.\n\nCalls process_file_tick if set amount of time in recording has passed."""
-    seconds_per_process = 1
+    """Takes a time stamp line and updates the FileData object.\n\nCalls process_file_tick if set amount of time in recording has passed (config PROCESSING.seconds_per_process).\n
+    If PROCESSING.skip_idle_ticks, ticks are skipped when they would not change anything (see dataProcessor.check_tick_due).\n
+    If file_data.sweep_attribution, there are no ticks, kills are attributed after reading (see dataProcessor.sweep_kill_attribution).
+    """
+    seconds_per_process = float(config.PROCESSING.seconds_per_process)
     new_time = float(line[1:])
     file_data.set_time(new_time)
     if (file_data.time_stamp == 0) or (
         file_data.time_stamp > last_file_tick_processed + seconds_per_process
     ):
-        process_file_tick(file_data)
+        # with sweep_attribution, kills are attributed after reading
+        if not file_data.sweep_attribution and (
+            not config.PROCESSING.skip_idle_ticks or check_tick_due(file_data)
+        ):
+            process_file_tick(file_data)
         last_file_tick_processed += seconds_per_process
     return last_file_tick_processed
 
@@ -119,6 +204,9 @@ def time_stamp_line(line: list, file_data: FileData, last_file_tick_processed: i
 def obj_removed_line(line: list, file_data: FileData):
     """Parses an object removal line and updates the FileData and DCSObject objects."""
     obj_id = line[1:]
+    if obj_id in file_data.shells:
+        file_data.shells[obj_id].update_to_dying()
+        return
     obj = file_data.get_obj_by_id(obj_id, "Alive")
     if obj:
         if obj.check_skip_dying_type():
@@ -129,7 +217,8 @@ def obj_removed_line(line: list, file_data: FileData):
             raise ValueError(
                 f"Attempting to remove object that is not alive and not skip dying:\n\t{obj.id=} {obj.type=} {obj.name=} {obj.death_time_stamp=}\n\t{line=}"
             )
-        logger.detail(f"REMOVE LINE OBJECT: {obj.info(times=True)}")
+        if logger.isEnabledFor(detail_level):
+            logger.detail(f"REMOVE LINE OBJECT: {obj.info(times=True)}")
 
     else:
         raise ValueError(
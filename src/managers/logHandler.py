@@ -1,4 +1,8 @@
+import atexit
 import logging
+import multiprocessing
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
 from src.utils.configUtils import config
 from src.utils.timeUtils import get_timer
 from src.utils.logUtils import (
@@ -9,6 +13,38 @@ from src.utils.logUtils import (
     prepare_output_directory,
 )
 
+# custom levels below DEBUG, check with logger.isEnabledFor before building expensive (hot path) messages
+trace_level = 5
+detail_level = 1
+# QUEUE_LOGGING.when_full policies
+queue_full_policies = ["block", "drop"]
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler which waits for space (block) or drops logs (drop) when its bounded queue is full."""
+
+    def __init__(self, queue, when_full: str = "block"):
+        if when_full not in queue_full_policies:
+            raise ValueError(
+                f"Queue logging when_full is not one of {queue_full_policies}: {when_full=}"
+            )
+        super().__init__(queue)
+        self.block = when_full == "block"  # wait for space in the queue, else drop
+        self.dropped = 0  # logs dropped as the queue was full
+
+    def enqueue(self, record):
+        try:
+            self.queue.put(record, block=self.block)
+        except Full:
+            self.dropped += 1
+
+
+class BoundedQueueListener(QueueListener):
+    """QueueListener which waits for space in its bounded queue to stop (rather than failing if the queue is full)."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
 
 class Logger(logging.Logger):
     # https://stackoverflow.com/a/76268417 This saved me.....
@@ -17,10 +53,18 @@ class Logger(logging.Logger):
         super().__init__(name, 0)
         # setup custom levels - MUST COME FIRST to allow colour changes
         if setup_trace:
-            add_logging_level("TRACE", 5)
-            add_logging_level("DETAIL", 1)
+            add_logging_level("TRACE", trace_level)
+            add_logging_level("DETAIL", detail_level)
 
         debug_log1, debug_log2 = [], []
+        self._queue_handler = (
+            None  # BoundedQueueHandler, if queue logging (see start_queue)
+        )
+        self._queue_handlers = []  # handlers written to by the queue listeners
+        self._queue_listeners = (
+            []
+        )  # QueueListener threads (this process' queue, worker queue)
+        self._worker_queue = None  # multiprocessing queue worker processes log to
 
         # setup console logging (allows for logging whilst setting up fileHandler)
         if config.LOGGING.to_console:
@@ -30,7 +74,11 @@ class Logger(logging.Logger):
             self._console_handler.setFormatter(formatter)
             self.addHandler(self._console_handler)
         # setup file logging
-        if config.LOGGING.to_file:
+        # worker processes (spawned) log to the parent's file, set by setup_worker() - don't create a new one
+        if (
+            config.LOGGING.to_file
+            and multiprocessing.current_process().name == "MainProcess"
+        ):
             output_dir, debug_log1 = setup_config_output_dir()
             output_file_path, debug_log2 = prepare_output_directory(output_dir)
             self._file_handler = logging.FileHandler(
@@ -41,9 +89,144 @@ class Logger(logging.Logger):
             self._file_handler.setFormatter(formatter)
             self.addHandler(self._file_handler)
 
+        if (
+            config.QUEUE_LOGGING.enabled
+            and multiprocessing.current_process().name == "MainProcess"
+        ):
+            self.start_queue()
+        self.update_level()
         # Now logger is initialised, we can log saved logs from above
         for log in debug_log1 + debug_log2:
             logging.Logger.debug(self, log)
 
+    def setLevel(self, level):
+        """Sets the logging level of this logger, clearing its isEnabledFor cache.\n
+        logging only clears the caches of loggers registered with its manager (getLogger), which this logger is not.
+        """
+        super().setLevel(level)
+        self._cache.clear()
+
+    def update_level(self):
+        """Sets this logger's level to its lowest handler level (WARNING without handlers, as logging.lastResort).\n
+        Messages below every handler level are then discarded before a record is made, and isEnabledFor guards skip building them.
+        """
+        if self.handlers:
+            self.setLevel(min(handler.level for handler in self.handlers))
+        else:
+            self.setLevel(logging.WARNING)
+
+    def start_queue(self):
+        """Moves this logger's handlers behind a bounded queue (config QUEUE_LOGGING), so logging only prepares and queues records.\n
+        Records are formatted and written by the handlers on a background thread (QueueListener), until stop_queue (called at exit).
+        """
+        if self._queue_handler is not None or not self.handlers:
+            return
+        self._queue_handlers = list(self.handlers)
+        for handler in self._queue_handlers:
+            self.removeHandler(handler)
+        log_queue = Queue(config.QUEUE_LOGGING.max_size)
+        self._queue_handler = BoundedQueueHandler(
+            log_queue, config.QUEUE_LOGGING.when_full
+        )
+        self._queue_handler.setLevel(
+            min(handler.level for handler in self._queue_handlers)
+        )
+        self.addHandler(self._queue_handler)
+        self.start_queue_listener(log_queue)
+        self.update_level()
+        atexit.register(self.stop_queue)
+
+    def start_queue_listener(self, log_queue):
+        """Starts a QueueListener thread writing records from log_queue to this logger's (queued) handlers."""
+        listener = BoundedQueueListener(
+            log_queue, *self._queue_handlers, respect_handler_level=True
+        )
+        listener.start()
+        self._queue_listeners.append(listener)
+
+    def get_worker_queue(self):
+        """Returns the (multiprocessing) queue worker processes log to (see setup_worker), written to this logger's handlers by a listener in this process.\n
+        Returns None if not queue logging."""
+        if self._queue_handler is None:
+            return None
+        if self._worker_queue is None:
+            self._worker_queue = multiprocessing.Queue(config.QUEUE_LOGGING.max_size)
+            self.start_queue_listener(self._worker_queue)
+        return self._worker_queue
+
+    def stop_queue(self):
+        """Writes any queued records and stops the queue listeners, restoring this logger's handlers.\n
+        Logs a warning if any records were dropped (QUEUE_LOGGING.when_full = drop)."""
+        if self._queue_handler is None:
+            return
+        for listener in self._queue_listeners:
+            listener.stop()
+        self.removeHandler(self._queue_handler)
+        for handler in self._queue_handlers:
+            self.addHandler(handler)
+        dropped = self._queue_handler.dropped
+        self._queue_handler = None
+        self._queue_handlers = []
+        self._queue_listeners = []
+        self._worker_queue = None
+        self.update_level()
+        if dropped:
+            self.warning(
+                f"Queue logging dropped {dropped} logs (queue full): {config.QUEUE_LOGGING.max_size=}"
+            )
+
+    def get_log_file_path(self):
+        """Returns the path of the file being logged to (None if not logging to file)."""
+        if hasattr(self, "_file_handler"):
+            return self._file_handler.baseFilename
+        return None
+
+    def setup_worker(self, log_file_path: str = None, log_queue=None):
+        """Replaces handlers inherited/created in a worker process, appending file logs to the parent's log file.\n
+        If log_queue (the parent's get_worker_queue), logs are instead sent to the parent, to be written by its queue listener.
+        """
+        for handler in list(self.handlers):
+            self.removeHandler(handler)
+            handler.close()
+        # queue listeners (threads) inherited from the parent do not run in this process
+        self._queue_handler = None
+        self._queue_handlers = []
+        self._queue_listeners = []
+        self._worker_queue = None
+        if log_queue is not None:
+            levels = []
+            if config.LOGGING.to_console:
+                levels.append(get_console_logger_config()[0])
+            if config.LOGGING.to_file:
+                levels.append(get_file_logger_config()[0])
+            queue_handler = BoundedQueueHandler(
+                log_queue, config.QUEUE_LOGGING.when_full
+            )
+            queue_handler.setLevel(min(logging.getLevelName(level) for level in levels))
+            self.addHandler(queue_handler)
+            if log_file_path:
+                config.FILE_LOGGING.file_output_dir = log_file_path
+        else:
+            self.setup_worker_handlers(log_file_path)
+        self.update_level()
+
+    def setup_worker_handlers(self, log_file_path: str = None):
+        """Adds console/file handlers to a worker process' logger, appending file logs to log_file_path."""
+        if config.LOGGING.to_console:
+            self._console_handler = logging.StreamHandler()
+            level, formatter = get_console_logger_config()
+            self._console_handler.setLevel(level)
+            self._console_handler.setFormatter(formatter)
+            self.addHandler(self._console_handler)
+        if config.LOGGING.to_file and log_file_path:
+            self._file_handler = logging.FileHandler(
+                filename=log_file_path, mode="a", encoding="utf-8"
+            )
+            level, formatter = get_file_logger_config()
+            self._file_handler.setLevel(level)
+            self._file_handler.setFormatter(formatter)
+            self.addHandler(self._file_handler)
+            config.FILE_LOGGING.file_output_dir = log_file_path
+
 
 logger = Logger(__name__)
@@ -1,14 +1,15 @@
 import os
+import json
 from src.managers.logHandler import logger
 from src.utils.timeUtils import get_date_time
 from src.utils.outputUtils import (
     files_csv_header,
     objects_csv_header,
     output_csv_header,
-    output_exclude_object_types,
 )
+from src.classes.FileSummary import get_file_summary
+from src.managers.cacheManager import get_parser_version
 import csv
-import re
 from src.utils.configUtils import config
 
 
@@ -74,6 +75,9 @@ def get_data_file_names():
 
 
 def write_outcome(files_data: dict, outcome_dirs: tuple[str, str, str]):
+    """Writes each file's rows to the output csv files, in files_data order.\n
+    files_data values can be FileData or FileSummary (e.g.: returned from worker processes).
+    """
     output_dir, files_dir, objects_dir = outcome_dirs
 
     logger.debug(f"{output_dir=}\n{files_dir=}\n{objects_dir=}")
@@ -86,100 +90,51 @@ def write_outcome(files_data: dict, outcome_dirs: tuple[str, str, str]):
     object_counter = 0
 
     for file_data in files_data.values():
+        file_summary = get_file_summary(file_data)
+        file_length = (
+            "header only"
+            if file_summary.file_length is None
+            else f"{file_summary.file_length:,}"
+        )
         logger.info(
-            f"\n\n\tFile Name: {file_data.file_name}\n\tFile Size:   {file_data.file_size:,} KB\n\tFile Length: {file_data.file_length:,}\n"
+            f"\n\n\tFile Name: {file_summary.file_name}\n\tFile Size:   {file_summary.file_size:,} KB\n\tFile Length: {file_length}\n"
         )
-        logger.info(file_data.info(all=True))
-
-        file_csv_data_row = [
-            file_counter,
-            file_data.file_name,
-            file_data.author,
-            file_data.mission_title,
-            file_data.file_type,
-            file_data.file_version,
-            file_data.file_length,
-            file_data.file_size,
-            file_data.recorder,
-            file_data.source,
-            file_data.mission_date,
-            file_data.record_date,
-            file_data.latitude_reference,
-            file_data.longitude_reference,
-            len(file_data.all_objects),
-            file_data.first_time_stamp,
-            file_data.time_stamp,  # is not 'reset' on file end, so acts as 'final' time stamp
-        ]
+        logger.info(file_summary.info)
+
         with open(files_dir, "a", encoding="utf-8-sig", newline="") as file_f:
             file_csv_writer = csv.writer(file_f)
-            file_csv_writer.writerow(file_csv_data_row)
+            file_csv_writer.writerow([file_counter] + file_summary.file_row)
 
         with open(objects_dir, "a", encoding="utf-8-sig", newline="") as obj_f, open(
             output_dir, "a", encoding="utf-8-sig", newline=""
         ) as outcome_f:
-            for obj in (
-                list(file_data.objects.values())
-                + list(file_data.dying_objects.values())
-                + list(file_data.dead_objects.values())
-            ):
-                # if len(obj.launches) > 0:
-                #     logger.info((f"{obj.id} - {obj.type} - {obj.name} - {obj.pilot}"))
-                #     for launch in obj.launches.values():
-                #         if len(launch.kills.values()) == 0:
-                #             logger.info(
-                #                 f"\t{launch.name}\t{launch.type}\t{len(launch.kills.values())} {launch.spawn_time_stamp=}"
-                #             )
-                #         elif len(launch.kills.values()) == 1:
-                #             logger.info(
-                #                 f"\t{launch.name}\t{launch.type}\t{len(launch.kills.values())} - {list(launch.kills.values())[0].name}\t{list(launch.kills.values())[0].pilot}\t{list(launch.kills.values())[0].type} {launch.spawn_time_stamp=}"
-                #             )
-                #         else:
-                #             logger.critical(f"Multiple kills: {launch.kills.values()=}")
-                object_csv_data_row = [
-                    file_counter,
-                    obj.uid,
-                    obj.id,
-                    obj.pilot,
-                    obj.name,
-                    obj.coalition,
-                    obj.type,
-                    obj.country,
-                    len(obj.launches),
-                    len(obj.kills),
-                    obj.killer.uid if obj.killer else None,
-                    obj.killer_weapon.uid if obj.killer else None,
-                    obj.spawn_time_stamp,
-                    obj.death_time_stamp
-                    if obj.death_time_stamp
-                    else obj.file_obj.time_stamp,
-                    obj.origin,
-                    obj.launcher.uid if obj.launcher else None,
-                    object_counter,
-                ]
-                obj_csv_writer = csv.writer(obj_f)
-                obj_csv_writer.writerow(object_csv_data_row)
-
-                if set(output_exclude_object_types).isdisjoint(obj.type):
-                    output_csv_data_row = [
-                        file_counter,
-                        obj.uid,
-                        obj.pilot,
-                        obj.name,
-                        obj.coalition,
-                        obj.type,
-                        len(obj.launches),
-                        len(obj.kills),
-                        obj.killer.name if obj.killer else None,
-                        obj.killer_weapon.name if obj.killer else None,
-                        obj.spawn_time_stamp,
-                        obj.death_time_stamp
-                        if obj.death_time_stamp
-                        else obj.file_obj.time_stamp,
-                        file_data.mission_title,
-                        re.split(r"[\\ | /]", file_data.file_name)[-1],
-                    ]
-                    output_csv_writer = csv.writer(outcome_f)
-                    output_csv_writer.writerow(output_csv_data_row)
+            obj_csv_writer = csv.writer(obj_f)
+            for object_row in file_summary.object_rows:
+                obj_csv_writer.writerow([file_counter] + object_row + [object_counter])
+            output_csv_writer = csv.writer(outcome_f)
+            for output_row in file_summary.output_rows:
+                output_csv_writer.writerow([file_counter] + output_row)
+        if file_summary.track_store is not None:
+            # alongside the objects data, FileID matches the file/objects csv rows
+            tracks_file = objects_dir.replace(
+                "_objects_data.csv", f"_tracks_{file_counter}.npz"
+            )
+            file_summary.track_store.export(tracks_file)
+        if file_summary.telemetry is not None:
+            # one JSON line per file (FileID matches the file/objects csv rows)
+            telemetry_file = objects_dir.replace(
+                "_objects_data.csv", "_telemetry.jsonl"
+            )
+            with open(telemetry_file, "a", encoding="utf-8") as telemetry_f:
+                telemetry_record = {
+                    "FileID": file_counter,
+                    "file_name": file_summary.file_name,
+                    "file_size": file_summary.file_size,
+                    "parser_version": get_parser_version(),
+                }
+                telemetry_f.write(
+                    json.dumps(telemetry_record | file_summary.telemetry) + "\n"
+                )
         file_counter += 1
 
 
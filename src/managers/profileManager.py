@@ -0,0 +1,78 @@
+from src.managers.logHandler import logger
+import cProfile
+import io
+import linecache
+import os
+import pstats
+import re
+import tracemalloc
+from src.managers.fileManager import read_files
+from src.utils.logUtils import setup_config_output_dir
+from src.utils.timeUtils import get_date_time
+
+profile_modes = ["cpu", "mem"]
+profile_top_lines = 25  # functions/allocation sites logged per profile/snapshot
+tracemalloc_frames = 1  # frames stored per allocation (1: group by allocation site)
+
+
+def get_profile_dir() -> str:
+    """Returns the directory profiles are written to: the log file's directory (outputs/), or the configured logging output directory if not logging to file."""
+    log_file_path = logger.get_log_file_path()
+    if log_file_path:
+        return os.path.dirname(log_file_path)
+    return setup_config_output_dir()[0]
+
+
+def get_profile_path(name: str, extension: str) -> str:
+    """Returns a (dated) profile file path for name within get_profile_dir()."""
+    date, time = get_date_time()
+    name = re.sub(r"[^\w.-]", "_", name)
+    return os.path.join(get_profile_dir(), f"profile_{date}_{time}_{name}{extension}")
+
+
+def profile_read_files(files: list[str], AuthorIsUser: bool):
+    """Reads each file (read_files) under cProfile, returning a dict of index:FileData as read_files.\n
+    Each file's stats are dumped to a .pstats file (open with pstats / snakeviz), and the top functions by cumulative time are logged.\n
+    Files are profiled in this process, so are always read serially (main rejects --workers with --profile).
+    """
+    all_files_data = {}
+    for index, file in enumerate(files):
+        profiler = cProfile.Profile()
+        all_files_data[index] = profiler.runcall(read_files, [file], AuthorIsUser)[0]
+        profile_path = get_profile_path(f"{index}_{os.path.basename(file)}", ".pstats")
+        profiler.dump_stats(profile_path)
+        stats_stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stats_stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(profile_top_lines)
+        logger.info(
+            f"CPU profile {index} - {file}\n\t{profile_path}\n{stats_stream.getvalue()}"
+        )
+    return all_files_data
+
+
+def start_memory_profile():
+    """Starts tracing memory allocations (tracemalloc), see log_memory_snapshot."""
+    tracemalloc.start(tracemalloc_frames)
+
+
+def log_memory_snapshot(label: str):
+    """Takes a tracemalloc snapshot (dumped to a .tracemalloc file, load with tracemalloc.Snapshot.load), and logs its top allocation sites.\n
+    Allocation sites are lines (e.g.: within DCSObject.__init__ or tokenUtils.split_attrs), with the memory still held and number of blocks.
+    """
+    if not tracemalloc.is_tracing():
+        raise ValueError(f"Memory is not being traced (start_memory_profile): {label=}")
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    snapshot_path = get_profile_path(label, ".tracemalloc")
+    snapshot.dump(snapshot_path)
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot_info = f"Memory profile - {label}\n\t{snapshot_path}\n\tCurrent: {current / 1024 / 1024:.1f} MB Peak: {peak / 1024 / 1024:.1f} MB"
+    for statistic in snapshot.statistics("lineno")[:profile_top_lines]:
+        frame = statistic.traceback[0]
+        source = linecache.getline(frame.filename, frame.lineno).strip()
+        snapshot_info += f"\n\t{statistic.size / 1024:>10,.1f} KB {statistic.count:>9,} blocks  {frame.filename}:{frame.lineno}  {source}"
+    logger.info(snapshot_info)
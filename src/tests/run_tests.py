@@ -12,13 +12,24 @@
 import unittest
 
 from src.tests import (
+    test_managers_cacheManager,
+    test_managers_dataProcessor,
     test_managers_dirManager,
     test_managers_fileManager,
     test_managers_lineHandler,
+    test_managers_outcomeWriter,
+    test_managers_profileManager,
     test_utils_fileUtils,
+    test_utils_tokenUtils,
     test_classes_FileData,
+    test_classes_FileSummary,
     test_classes_DCSObject,
     test_classes_DCSEvent,
+    test_classes_DCSShell,
+    test_classes_ObjectGrid,
+    test_classes_Telemetry,
+    test_classes_TrackStore,
+    test_utils_analyticsUtils,
     test_utils_coordUtils,
 )
 
@@ -46,14 +57,49 @@ class TestAll(unittest.TestCase):
             test_classes_DCSObject
         )
         unittest.TextTestRunner(verbosity=self.verbosity_all).run(DCSObject_suite)
+        # src/classes/DCSShell.py
+        DCSShell_suite = unittest.TestLoader().loadTestsFromModule(
+            test_classes_DCSShell
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(DCSShell_suite)
         # src/classes/FileData.py
         FileData_suite = unittest.TestLoader().loadTestsFromModule(
             test_classes_FileData
         )
         unittest.TextTestRunner(verbosity=self.verbosity_all).run(FileData_suite)
+        # src/classes/FileSummary.py
+        FileSummary_suite = unittest.TestLoader().loadTestsFromModule(
+            test_classes_FileSummary
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(FileSummary_suite)
+        # src/classes/ObjectGrid.py
+        ObjectGrid_suite = unittest.TestLoader().loadTestsFromModule(
+            test_classes_ObjectGrid
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(ObjectGrid_suite)
+        # src/classes/Telemetry.py
+        Telemetry_suite = unittest.TestLoader().loadTestsFromModule(
+            test_classes_Telemetry
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(Telemetry_suite)
+        # src/classes/TrackStore.py
+        TrackStore_suite = unittest.TestLoader().loadTestsFromModule(
+            test_classes_TrackStore
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(TrackStore_suite)
         ############################# classes #############################
 
         ############################# managers #############################
+        # src/managers/cacheManager.py
+        cacheManager_suite = unittest.TestLoader().loadTestsFromModule(
+            test_managers_cacheManager
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(cacheManager_suite)
+        # src/managers/dataProcessor.py
+        dataProcessor_suite = unittest.TestLoader().loadTestsFromModule(
+            test_managers_dataProcessor
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(dataProcessor_suite)
         # src/managers/dirManager.py
         # FUTUREDO is there an automatic way to test dialog windows?
         dirManager_suite = unittest.TestLoader().loadTestsFromModule(
@@ -70,9 +116,24 @@ class TestAll(unittest.TestCase):
             test_managers_lineHandler
         )
         unittest.TextTestRunner(verbosity=self.verbosity_all).run(lineHandler_suite)
+        # src/managers/outcomeWriter.py
+        outcomeWriter_suite = unittest.TestLoader().loadTestsFromModule(
+            test_managers_outcomeWriter
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(outcomeWriter_suite)
+        # src/managers/profileManager.py
+        profileManager_suite = unittest.TestLoader().loadTestsFromModule(
+            test_managers_profileManager
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(profileManager_suite)
         ############################# managers #############################
 
         ############################# utils #############################
+        # src/utils/analyticsUtils.py
+        analyticsUtils_suite = unittest.TestLoader().loadTestsFromModule(
+            test_utils_analyticsUtils
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(analyticsUtils_suite)
         # src/utils/coordUtils.py
         coordUtils_suite = unittest.TestLoader().loadTestsFromModule(
             test_utils_coordUtils
@@ -83,6 +144,11 @@ class TestAll(unittest.TestCase):
             test_utils_fileUtils
         )
         unittest.TextTestRunner(verbosity=self.verbosity_all).run(fileUtils_suite)
+        # src/utils/tokenUtils.py
+        tokenUtils_suite = unittest.TestLoader().loadTestsFromModule(
+            test_utils_tokenUtils
+        )
+        unittest.TextTestRunner(verbosity=self.verbosity_all).run(tokenUtils_suite)
         # src/utils/mathUtils.py
         # src/utils/performance.py
         ############################# utils #############################
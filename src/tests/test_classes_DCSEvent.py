@@ -9,4 +9,49 @@ class TestClassesDCSEvent(unittest.TestCase):
         pass
 
     def test_DCSEvent(self):
-        pass
+        file_obj = FileData()
+        file_obj.set_time(1)
+        events = []
+        # FileData event listeners must be callable
+        with self.assertRaises(TypeError):
+            file_obj.add_event_listener("not callable")
+        file_obj.add_event_listener(events.append)
+
+        launcher = file_obj.new_obj("101")
+        munition = file_obj.new_obj("102")
+        victim = file_obj.new_obj("103")
+        for obj, types in [
+            [launcher, "Air+FixedWing"],
+            [munition, "Weapon+Missile"],
+            [victim, "Air+Rotorcraft"],
+        ]:
+            obj.set_types(types)
+            obj.update_transform(1, 2, 3)
+        # launch event published
+        launcher.add_launch(munition)
+        self.assertEqual(len(events), 1)
+        self.assertTrue(isinstance(events[0], DCSEvent))
+        self.assertEqual(
+            [events[0].type, events[0].object, events[0].destination],
+            ["Launch", launcher, munition],
+        )
+        self.assertEqual(events[0].coordinates, [1, 2, 3])
+        # kill event published
+        file_obj.set_time(2)
+        munition.update_to_dying()
+        victim.update_to_dying()
+        munition.add_kill(victim)
+        self.assertEqual(len(events), 2)
+        self.assertEqual(
+            [events[1].type, events[1].object, events[1].destination, events[1].time],
+            ["Kill", munition, victim, 2],
+        )
+        self.assertIn("Launcher: 101", events[1].info())
+
+        # dead objects pruned after max_dead_time
+        file_obj.set_time(10)
+        self.assertEqual(file_obj.prune_dead_objects(10), 0)
+        file_obj.set_time(20)
+        self.assertEqual(file_obj.prune_dead_objects(10), 2)
+        self.assertEqual(file_obj.dead_objects, {})
+        self.assertEqual(list(file_obj.all_objects.keys()), [launcher.uid])
@@ -1,7 +1,10 @@
 import unittest
-from src.classes.DCSObject import DCSObject
+from src.classes.DCSObject import DCSObject, empty_mapping
 from src.classes.FileData import FileData
 from src.data.coordReferences import death_coords
+from src.data.typeReferences import ObjectType, killer_types_mask
+from src.managers.fileManager import process_file
+from src.utils.processingUtils import check_is_type
 
 
 class TestClasses(unittest.TestCase):
@@ -60,6 +63,28 @@ class TestClasses(unittest.TestCase):
                     [test_unit.lat_old, test_unit.long_old, test_unit.alt_old],
                     updates_pos_list[index - 1][1],
                 )
+        # DCSObject transform fields - all acmi layouts (long|lat|alt...), blank fields unchanged
+        transform_layouts = [
+            ["1|2|3", [2, 1, 3], [None] * 3, [None] * 3],
+            ["4|5|6|-7|8.5", [5, 4, 6], [None] * 3, [-7, 8.5, None]],
+            ["|6|7|10|-20|30", [6, 4, 7], [10, -20, 30], [-7, 8.5, None]],
+            ["7|8|9|11|21|31|70|80|90", [8, 7, 9], [11, 21, 31], [70, 80, 90]],
+            ["||||22||||", [8, 7, 9], [11, 22, 31], [70, 80, 90]],
+        ]
+        for transform, pos, orientation, flat in transform_layouts:
+            prev_pos = test_unit.get_pos()
+            test_unit.update_transform_fields(transform.split("|"))
+            self.assertEqual(test_unit.get_pos(), pos)
+            self.assertEqual(test_unit.get_prev_pos(), prev_pos)
+            self.assertEqual(
+                [test_unit.roll, test_unit.pitch, test_unit.yaw], orientation
+            )
+            self.assertEqual([test_unit.u, test_unit.v, test_unit.heading], flat)
+        with self.assertRaises(TypeError):
+            test_unit.update_transform_fields(["1", "a", "3"])
+        with self.assertRaises(TypeError):
+            test_unit.update_transform("x", "", "")
+        test_unit.update_transform(3, 4, 40)
         # DCSObject real pos -> requires FileData set
         with self.assertRaises(ValueError):
             test_unit.get_real_pos()
@@ -111,3 +136,75 @@ class TestClasses(unittest.TestCase):
         with self.assertRaises(ValueError):
             test_unit.get_pos()
         self.assertEqual([test_unit.lat, test_unit.long, test_unit.alt], death_coords)
+
+    def test_compact_DCSObject(self):
+        file_obj = FileData()
+        file_obj.file_name = "TEST_COMPACT.txt.acmi"
+        lines = [
+            "FileType=text/acmi/tacview\n",
+            "FileVersion=2.1\n",
+            "0,ReferenceLongitude=34\n",
+            "0,ReferenceLatitude=40\n",
+            "#0\n",
+            "101,T=5|7|1000,Type=Air+FixedWing,Name=F-16C_50,Coalition=Enemies\n",
+            "102,T=5|7.5|1000,Type=Air+FixedWing,Name=F-16C_50,Coalition=Enemies\n",
+            "#1\n",
+            "103,T=5|7|1000,Type=Weapon+Missile,Name=AIM_120C,Coalition=Enemies\n",
+        ]
+        process_file(file_obj, iter(lines), AuthorIsUser=True)
+        launcher, other, munition = [
+            file_obj.get_obj_by_id(id) for id in ["101", "102", "103"]
+        ]
+        # slots, no per-object __dict__
+        self.assertFalse(hasattr(launcher, "__dict__"))
+        with self.assertRaises(AttributeError):
+            launcher.unknown_attribute = None
+        # launches/kills are only allocated when first used
+        self.assertEqual(list(launcher.launches.values()), [munition])
+        self.assertIs(other.launches, empty_mapping)
+        self.assertIs(launcher.kills, empty_mapping)
+        self.assertEqual(other.kills, {})
+        with self.assertRaises(TypeError):
+            other.kills[munition] = other
+        # repeated strings (and type lists) are shared
+        self.assertIs(launcher.name, other.name)
+        self.assertIs(launcher.coalition, munition.coalition)
+        self.assertIs(launcher.type, other.type)
+        self.assertEqual(launcher.type, ["Air", "FixedWing"])
+
+    def test_type_flags(self):
+        file_obj = FileData()
+        missile, flare, tank, other = [
+            file_obj.new_obj(id) for id in ["101", "102", "103", "104"]
+        ]
+        missile.set_types("Weapon+Missile")
+        flare.set_types("Misc+Decoy+Flare")
+        tank.set_types("Misc+Container")
+        self.assertEqual(missile.type_flags, ObjectType.Weapon | ObjectType.Missile)
+        self.assertEqual(other.type_flags, 0)
+        self.assertTrue(check_is_type(missile, killer_types_mask))
+        self.assertFalse(check_is_type(flare, killer_types_mask))
+        self.assertTrue(flare.check_skip_dying_type())
+        self.assertTrue(flare.check_skip_data_processing_type())
+        # "Misc+Container" in skip_dying_types is never an element of a type list
+        self.assertFalse(tank.check_skip_dying_type())
+        # setting type directly also updates type_flags
+        other.type = ["Ground", "Vehicle"]
+        self.assertEqual(other.type_flags, ObjectType.Ground | ObjectType.Vehicle)
+        other.type = None
+        self.assertEqual(other.type_flags, 0)
+
+    def test_update_transform_fields_malformed(self):
+        file_obj = FileData()
+        test_unit = file_obj.new_obj("101")
+        test_unit.update_transform_fields(
+            ["5", "7", "1000", "", "", "", "10", "20", "90"]
+        )
+        kinematics = str(test_unit.kinematics)  # str, as unset fields are NaN
+        # malformed transform (last field) leaves the object unchanged
+        with self.assertRaises(TypeError):
+            test_unit.update_transform_fields(
+                ["6", "8", "2000", "", "", "", "11", "21", "x"]
+            )
+        self.assertEqual(str(test_unit.kinematics), kinematics)
+        self.assertEqual(test_unit.get_pos(), [7, 5, 1000])
@@ -0,0 +1,129 @@
+import unittest
+from src.classes.DCSShell import DCSShell
+from src.classes.FileData import FileData
+from src.classes.FileSummary import FileSummary
+from src.managers.fileManager import process_file
+
+
+class TestClassesDCSShell(unittest.TestCase):
+    def setUp(self):
+        self.header = [
+            "FileType=text/acmi/tacview\n",
+            "FileVersion=2.1\n",
+            "0,ReferenceLongitude=34\n",
+            "0,ReferenceLatitude=40\n",
+            "#0\n",
+            "101,T=5|7|1000,Type=Air+FixedWing,Name=F-16C_50,Pilot=Gun,Coalition=Enemies\n",
+            "102,T=6|8|0,Type=Ground+Vehicle,Name=M 818,Coalition=Allies\n",
+        ]
+
+    def test_DCSShell(self):
+        file_data = FileData()
+        file_data.is_zip = False
+        file_data.file_name = "TEST_SHELL.txt.acmi"
+        events = []
+        file_data.add_event_listener(events.append)
+        process_file(
+            file_data,
+            self.header
+            + [
+                "#1\n",
+                "a01,T=5|7|900,Type=Weapon+Projectile+Shell,Name=M61_20_HE,Color=Blue,Coalition=Enemies\n",
+                "a02,T=5|7.5|900,Type=Projectile+Shell,Name=M61_20_HE,Coalition=Enemies\n",
+                "#2\n",
+                "a01,T=5.5|7.5|\n",
+                "a02,T=6|8.0001|1\n",
+                "#3\n",
+                "-a01\n",
+                "-a02\n",
+                "-102\n",
+                "#4.5\n",
+            ],
+            AuthorIsUser=True,
+        )
+        # shells are compact records, not DCSObjects (or in all_objects), but use the UID counter
+        self.assertEqual(file_data.uid_counter, 4)
+        self.assertEqual(len(file_data.all_objects), 2)
+        self.assertEqual(file_data.shells, {})
+        self.assertEqual(list(file_data.dying_shells.keys()), ["a01"])
+        shell = file_data.dying_shells["a01"]
+        self.assertIsInstance(shell, DCSShell)
+        self.assertEqual(shell.type, ["Weapon", "Projectile", "Shell"])
+        self.assertEqual(shell.get_death_pos(), [7.5, 5.5, 900])
+        self.assertEqual(
+            [shell.uid, shell.name, shell.spawn_time_stamp], [2, "M61_20_HE", 1]
+        )
+
+        # closest shell at death kills victim
+        victim = file_data.get_obj_by_id("102")
+        self.assertTrue(victim.check_is_dead())
+        self.assertEqual(victim.killer_weapon.id, "a02")
+        self.assertIsNone(victim.killer)
+        self.assertEqual(len(file_data.shell_kills), 1)
+        self.assertEqual(file_data.shell_kills[0].victim, victim)
+        self.assertEqual(FileSummary(file_data).kills, [[3, victim.uid, None]])
+        self.assertEqual(
+            [events[0].type, events[0].object.id, events[0].destination.id],
+            ["Kill", "a02", "102"],
+        )
+
+        # dying shells discarded after dying time
+        process_file(file_data, ["#20\n"], AuthorIsUser=True)
+        self.assertEqual(file_data.dying_shells, {})
+        self.assertEqual(shell.state, "Dead")
+        with self.assertRaises(ValueError):
+            shell.update_to_dead()
+        with self.assertRaises(ValueError):
+            file_data.new_shell("101", ["Shell"])
+
+    def test_shell_burst(self):
+        # as with dying weapons, a shell closest to another (weapon) shell kills nothing, even with a victim in range
+        file_data = FileData()
+        file_data.is_zip = False
+        file_data.file_name = "TEST_SHELL_BURST.txt.acmi"
+        process_file(
+            file_data,
+            self.header
+            + [
+                "#1\n",
+                "b1,T=6|8.002|1,Type=Projectile+Shell,Name=M61_20_HE,Coalition=Enemies\n",
+                "b2,T=6|8.0021|1,Type=Projectile+Shell,Name=M61_20_HE,Coalition=Enemies\n",
+                "#2\n",
+                "-b1\n",
+                "-b2\n",
+                "-102\n",
+                "#3.5\n",
+            ],
+            AuthorIsUser=True,
+        )
+        victim = file_data.get_obj_by_id("102")
+        self.assertTrue(victim.check_is_dying())
+        self.assertIsNone(victim.killer_weapon)
+        self.assertEqual(file_data.shell_kills, [])
+        self.assertEqual(list(file_data.dying_shells.keys()), ["b1", "b2"])
+
+        # once one shell of the burst has killed, the next closest can kill
+        file_data = FileData()
+        file_data.is_zip = False
+        file_data.file_name = "TEST_SHELL_BURST.txt.acmi"
+        process_file(
+            file_data,
+            self.header
+            + [
+                "103,T=6.003|8|0,Type=Ground+Vehicle,Name=M 818,Coalition=Allies\n",
+                "#1\n",
+                "b1,T=6|8.0001|1,Type=Projectile+Shell,Name=M61_20_HE,Coalition=Enemies\n",
+                "b2,T=6.002|8|1,Type=Projectile+Shell,Name=M61_20_HE,Coalition=Enemies\n",
+                "#2\n",
+                "-b1\n",
+                "-b2\n",
+                "-102\n",
+                "-103\n",
+                "#3.5\n",
+            ],
+            AuthorIsUser=True,
+        )
+        self.assertEqual(
+            [[shell.id, shell.victim.id] for shell in file_data.shell_kills],
+            [["b1", "102"], ["b2", "103"]],
+        )
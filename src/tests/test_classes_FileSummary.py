@@ -0,0 +1,59 @@
+import unittest
+import pickle
+from src.classes.FileData import FileData
+from src.classes.FileSummary import FileSummary
+from src.utils.outputUtils import (
+    files_csv_header,
+    objects_csv_header,
+    output_csv_header,
+)
+
+
+class TestClassesFileSummary(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def test_FileSummary(self):
+        # FileSummary requires FileData
+        with self.assertRaises(TypeError):
+            FileSummary("not FileData")
+
+        file_data = FileData()
+        file_data.file_name = "C:/TacView/TEST_DIR.txt.acmi"
+        file_data.file_length = 3
+        file_data.file_size = 1
+        file_data.set_time(1)
+        aircraft = file_data.new_obj("101")
+        aircraft.set_types("Air+FixedWing")
+        missile = file_data.new_obj("102")
+        missile.set_types("Weapon+Missile")
+        victim = file_data.new_obj("103")
+        victim.set_types("Air+Rotorcraft")
+        aircraft.add_launch(missile)
+        for obj in [missile, victim]:
+            obj.update_transform(1, 1, 1)
+            obj.update_to_dying()
+        missile.add_kill(victim)
+
+        file_summary = FileSummary(file_data)
+        # rows exclude FileID (and object counter), which are added when writing
+        self.assertEqual(len(file_summary.file_row), len(files_csv_header) - 1)
+        self.assertEqual(len(file_summary.object_rows), 3)
+        for object_row in file_summary.object_rows:
+            self.assertEqual(len(object_row), len(objects_csv_header) - 2)
+        # weapons are excluded from user outputs
+        self.assertEqual(len(file_summary.output_rows), 2)
+        for output_row in file_summary.output_rows:
+            self.assertEqual(len(output_row), len(output_csv_header) - 1)
+            self.assertEqual(output_row[-1], "TEST_DIR.txt.acmi")
+        # launches and kills recorded by uid, kills recorded once
+        self.assertEqual(file_summary.launches, [[aircraft.uid, missile.uid]])
+        self.assertEqual(file_summary.kills, [[missile.uid, victim.uid, aircraft.uid]])
+
+        # summary must be picklable (returned from worker processes)
+        unpickled = pickle.loads(pickle.dumps(file_summary))
+        self.assertEqual(unpickled.__dict__, file_summary.__dict__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from src.classes.FileData import FileData
+from src.classes.ObjectGrid import ObjectGrid
+
+
+class TestClassesObjectGrid(unittest.TestCase):
+    def setUp(self):
+        self.file_data = FileData()
+
+    def test_ObjectGrid(self):
+        with self.assertRaises(ValueError):
+            ObjectGrid(0)
+        grid = self.file_data.object_grid
+        obj1 = self.file_data.new_obj("101")
+        obj2 = self.file_data.new_obj("102")
+        # objects without a position are not indexed
+        self.assertEqual(grid.obj_cells, {})
+        obj2.update_transform("5.005", "7.005", "100")
+        obj1.update_transform("5.001", "7.001", "100")
+        self.assertEqual(
+            grid.get_nearby(5.003, 7.003, 0.001), [obj1, obj2]
+        )  # uid order
+        self.assertEqual(len(grid.cells), 1)
+        # blank fields keep the object in its cell
+        obj1.update_transform("", "", "200")
+        self.assertEqual(grid.get_nearby(5.003, 7.003, 0.001), [obj1, obj2])
+        # moved to another cell (and the empty cell removed)
+        obj1.update_transform("5.5", "7.001", "")
+        obj2.update_transform("5.5", "7.001", "")
+        self.assertEqual(grid.get_nearby(5.003, 7.003, 0.001), [])
+        self.assertEqual(grid.get_nearby(5.5, 7.001, 0.001), [obj1, obj2])
+        self.assertEqual(len(grid.cells), 1)
+        # neighbouring cells are searched up to distance
+        self.assertEqual(grid.get_nearby(5.489, 7.001, 0.011), [obj1, obj2])
+        self.assertEqual(grid.get_nearby(5.475, 7.001, 0.011), [])
+        self.assertEqual(grid.get_nearby(-5.5, -7.001, 0.011), [])
+        # dying (and dead) objects are removed
+        obj1.update_to_dying()
+        self.assertEqual(grid.get_nearby(5.5, 7.001, 0.001), [obj2])
+        obj2.update_to_dead()
+        self.assertEqual(grid.get_nearby(5.5, 7.001, 0.001), [])
+        self.assertEqual(grid.cells, {})
+        self.assertEqual(grid.obj_cells, {})
+        grid.remove(obj1)  # removing unindexed objects is ignored
+
+
+if __name__ == "__main__":
+    unittest.main()
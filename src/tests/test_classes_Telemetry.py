@@ -0,0 +1,66 @@
+import json
+import unittest
+from src.classes.FileData import FileData
+from src.classes.FileSummary import FileSummary
+from src.classes.Telemetry import Telemetry, get_telemetry, line_categories, time_call
+from src.managers.fileManager import process_file
+from src.utils.configUtils import config
+
+
+class TestClassesTelemetry(unittest.TestCase):
+    def setUp(self):
+        self.lines = [
+            "FileType=text/acmi/tacview\n",
+            "FileVersion=2.1\n",
+            "0,ReferenceLongitude=34\n",
+            "0,ReferenceLatitude=40\n",
+            "#0\n",
+            "101,T=5|7|1000,Type=Air+FixedWing,Name=F-16C_50\n",
+            "102,T=5|7.5|1000,Type=Air+FixedWing,Name=F-16C_50\n",
+            "#1\n",
+            "103,T=5|7|1000,Type=Weapon+Missile,Name=AIM_120C\n",
+            "104,T=5|7|500,Type=Weapon+Projectile+Shell,Name=M61_20_HE\n",
+            "101,T=5.1|7|1000\n",
+            "#2\n",
+            "-103\n",
+            "#3\n",
+        ]
+
+    def test_get_telemetry(self):
+        enabled = config.TELEMETRY.enabled
+        config.TELEMETRY.enabled = False
+        self.assertIsNone(get_telemetry())
+        self.assertIsNone(FileData().telemetry)
+        config.TELEMETRY.enabled = True
+        self.assertIsInstance(get_telemetry(), Telemetry)
+        config.TELEMETRY.enabled = enabled
+        # untimed without telemetry
+        self.assertEqual(time_call(None, "attr_split", max, 1, 2), 2)
+
+    def test_Telemetry(self):
+        file_data = FileData()
+        file_data.file_name = "TEST_TELEMETRY.txt.acmi"
+        file_data.telemetry = Telemetry()
+        process_file(file_data, iter(self.lines), AuthorIsUser=True)
+        record = file_data.telemetry.get_record()
+        self.assertEqual(
+            record["line_counts"],
+            {"object": 5, "timestamp": 4, "removal": 1, "global": 2, "header": 2},
+        )
+        self.assertEqual(record["lines"], len(self.lines))
+        self.assertEqual(list(record["line_times"]), line_categories)
+        self.assertGreater(record["processing_time"], 0)
+        self.assertGreater(record["lines_per_second"], 0)
+        # known objects (101 update) are split, known shells are not
+        self.assertEqual(record["stage_calls"]["attr_split"], 5)
+        self.assertEqual(record["stage_calls"]["object_line"], 5)
+        self.assertEqual(record["stage_calls"]["get_closest_obj"], 1)  # launcher
+        # idle ticks are skipped (config PROCESSING.skip_idle_ticks), only #3 has a dying object
+        self.assertEqual(record["stage_calls"]["process_file_tick"], 1)
+        self.assertEqual(
+            record["objects_created"],
+            {"Air+FixedWing": 2, "Weapon+Missile": 1, "Weapon+Projectile+Shell": 1},
+        )
+        # carried by FileSummary (e.g.: from worker processes), JSON serialisable
+        file_summary = FileSummary(file_data)
+        self.assertEqual(json.loads(json.dumps(file_summary.telemetry)), record)
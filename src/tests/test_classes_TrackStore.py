@@ -0,0 +1,168 @@
+import os
+import tempfile
+import unittest
+from math import isnan
+from src.classes.FileData import FileData
+from src.classes.TrackStore import TrackStore, get_track_store, load_tracks
+from src.managers.fileManager import process_file
+from src.utils.configUtils import config
+
+
+class TestClassesTrackStore(unittest.TestCase):
+    def setUp(self):
+        self.lines = [
+            "FileType=text/acmi/tacview\n",
+            "FileVersion=2.1\n",
+            "0,ReferenceLongitude=34\n",
+            "0,ReferenceLatitude=40\n",
+            "#0\n",
+            "101,T=5|7|1000|0|0|0|-100|200|90,Type=Air+FixedWing,Name=F-16C_50\n",
+            "102,T=6|8|0,Type=Ground+Vehicle,Name=M 818\n",
+            "#1\n",
+            "101,T=5.1||1010\n",
+            "103,T=5.1|7.01|1000,Type=Weapon+Missile,Name=AIM_120C\n",
+            "102,T=6.1|8|0\n",
+            "#2\n",
+            "103,T=5.3|7.01|1100\n",
+            "-103\n",
+        ]
+
+    def test_TrackStore(self):
+        with self.assertRaises(ValueError):
+            TrackStore([], 1)
+        file_data = FileData()
+        file_data.file_name = "TEST_TRACKS.txt.acmi"
+        file_data.track_store = TrackStore(["Air", "Missile"], 1)
+        process_file(file_data, iter(self.lines), AuthorIsUser=True)
+        track_store = file_data.track_store
+        # ground vehicle is not tracked
+        self.assertEqual(sorted(track_store.tracks), [0, 2])
+        self.assertIsNone(track_store.get_track(1))
+        track = track_store.get_track(0)
+        self.assertEqual(list(track["time"]), [0, 1])
+        self.assertEqual(list(track["long"]), [5, 5.1])
+        self.assertEqual(list(track["lat"]), [7, 7])
+        self.assertEqual(list(track["alt"]), [1000, 1010])
+        self.assertEqual(list(track["u"]), [-100, -100])
+        self.assertEqual(list(track["heading"]), [90, 90])
+        # missile track ends at death (death coords are not added)
+        track = track_store.get_track(2)
+        self.assertEqual(list(track["time"]), [1, 2])
+        self.assertEqual(list(track["alt"]), [1000, 1100])
+        self.assertTrue(isnan(track["u"][0]))
+        self.assertEqual(track_store.sample_count, 4)
+        self.assertIsNone(file_data.get_obj_by_id("103", "Dying").track)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracks_file = f"{temp_dir}/TEST_TRACKS.npz"
+            track_store.export(tracks_file)
+            self.assertTrue(os.path.isfile(tracks_file))
+            tracks = load_tracks(tracks_file)
+            empty_file = f"{temp_dir}/TEST_EMPTY_TRACKS.npz"
+            TrackStore(["Air"], 1).export(empty_file)
+            self.assertEqual(load_tracks(empty_file), {})
+        self.assertEqual(list(tracks), [0, 2])
+        for uid, track in tracks.items():
+            for field, column in track.items():
+                # NaN (unset) values compared as None
+                self.assertEqual(
+                    [None if isnan(value) else value for value in column],
+                    [
+                        None if isnan(value) else value
+                        for value in track_store.get_track(uid)[field]
+                    ],
+                    f"{uid=} {field=}",
+                )
+
+        # samples are dropped once the memory budget is reached
+        file_data = FileData()
+        file_data.file_name = "TEST_TRACKS.txt.acmi"
+        file_data.track_store = TrackStore(["Air", "Missile"], 3 * 56 / 1024 / 1024)
+        process_file(file_data, iter(self.lines), AuthorIsUser=True)
+        self.assertEqual(file_data.track_store.sample_count, 3)
+        self.assertTrue(file_data.track_store.budget_exceeded)
+        self.assertEqual(len(file_data.track_store.get_track(2)["time"]), 1)
+
+    def test_get_sample_at(self):
+        file_data = FileData()
+        file_data.file_name = "TEST_TRACKS.txt.acmi"
+        with self.assertRaises(ValueError):
+            file_data.get_positions_at([], 0)
+        file_data.track_store = TrackStore(["Air", "Missile"], 1)
+        process_file(file_data, iter(self.lines), AuthorIsUser=True)
+        track_store = file_data.track_store
+        aircraft = file_data.get_obj_by_id("101")
+        vehicle = file_data.get_obj_by_id("102")
+        missile = file_data.get_obj_by_id("103", "Dying")
+        # exact samples, interpolated between samples, outside the track
+        self.assertEqual(aircraft.get_pos_at(1), [7, 5.1, 1010])
+        self.assertEqual(missile.get_pos_at(1.25)[2], 1025)
+        self.assertAlmostEqual(aircraft.get_pos_at(0.5)[1], 5.05)
+        self.assertIsNone(aircraft.get_pos_at(-0.5))
+        self.assertIsNone(missile.get_pos_at(0.5))
+        self.assertIsNone(missile.get_pos_at(2.5))
+        # last position is held until death / the current time stamp
+        self.assertEqual(aircraft.get_pos_at(2), [7, 5.1, 1010])
+        self.assertIsNone(aircraft.get_pos_at(2.5))
+        self.assertIsNone(track_store.get_sample_at(0, 1.5))
+        self.assertEqual(track_store.get_sample_at(0, 0.5, ("alt", "u")), [1005, -100])
+        self.assertIsNone(track_store.get_sample_at(1, 0.5))
+        with self.assertRaises(ValueError):
+            vehicle.get_pos_at(0.5)
+        with self.assertRaises(ValueError):
+            track_store.get_sample_at(0, 0.5, ("time",))
+        with self.assertRaises(ValueError):
+            track_store.get_sample_at(0, 0.5, ("speed",))
+
+        # many objects at one time (matches get_pos_at, NaN where unknown)
+        for time in [-0.5, 0, 0.5, 1, 1.25, 1.5, 2, 2.5]:
+            positions = file_data.get_positions_at([aircraft, missile], time)
+            self.assertEqual(positions.shape, (2, 3))
+            for obj, position in zip([aircraft, missile], positions):
+                expected = obj.get_pos_at(time)
+                if expected is None:
+                    self.assertTrue(all(isnan(value) for value in position))
+                else:
+                    self.assertEqual(list(position), expected)
+        self.assertEqual(file_data.get_positions_at([], 1).shape, (0, 3))
+        with self.assertRaises(ValueError):
+            file_data.get_positions_at([aircraft, vehicle, missile], 1.5)
+        # one object at many times (matches get_pos_at, NaN outside the track)
+        times = [-1, 0, 0.25, 0.5, 1, 1.5, 2, 2.5]
+        positions = file_data.get_positions_over_time(aircraft, times)
+        self.assertEqual(positions.shape, (len(times), 3))
+        self.assertTrue(all(isnan(value) for value in positions[0]))
+        self.assertTrue(all(isnan(value) for value in positions[-1]))
+        for time, position in zip(times[1:-1], positions[1:-1]):
+            for value, expected in zip(position, aircraft.get_pos_at(time)):
+                self.assertAlmostEqual(value, expected)
+        self.assertEqual(track_store.get_track_at(2, [], ("alt",)).shape, (0, 1))
+        with self.assertRaises(ValueError):
+            file_data.get_positions_over_time(vehicle, times)
+
+    def test_get_track_store(self):
+        config_tracks = (
+            config.TRACKS.enabled,
+            config.TRACKS.types,
+            config.TRACKS.max_size_mb,
+        )
+        try:
+            config.TRACKS.enabled = False
+            self.assertIsNone(get_track_store())
+            self.assertIsNone(FileData().track_store)
+            config.TRACKS.enabled = True
+            config.TRACKS.types = "Air, Missile,"
+            config.TRACKS.max_size_mb = "0.5"
+            track_store = get_track_store()
+            self.assertEqual(track_store.types, {"Air", "Missile"})
+            self.assertEqual(track_store.max_samples, 9362)
+        finally:
+            (
+                config.TRACKS.enabled,
+                config.TRACKS.types,
+                config.TRACKS.max_size_mb,
+            ) = config_tracks
+
+
+if __name__ == "__main__":
+    unittest.main()
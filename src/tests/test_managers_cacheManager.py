@@ -0,0 +1,126 @@
+import unittest
+import os
+import time
+import tempfile
+from src.managers.cacheManager import (
+    get_file_hash,
+    get_parser_version,
+    get_config_hash,
+    get_cache_path,
+    load_cached_summary,
+    store_cached_summary,
+    evict_cache,
+)
+from src.managers.fileManager import read_files
+from src.classes.FileSummary import FileSummary
+from src.utils.configUtils import config
+
+
+class TestManagersCacheManager(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.test_data_dir = self.cwd + "/src/tests/test_data"
+        self.unzipped_file_dir = self.test_data_dir + "/TEST_DIR.txt.acmi"
+        self.zip_file_dir = self.test_data_dir + "/TEST_ZIP_TRIMMED.mod.zip.acmi"
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = self.temp_dir.name
+        self.config_cache = (config.CACHE.enabled, config.CACHE.cache_dir)
+
+    def tearDown(self):
+        config.CACHE.enabled, config.CACHE.cache_dir = self.config_cache
+        self.temp_dir.cleanup()
+
+    def test_get_file_hash(self):
+        file_hash = get_file_hash(self.unzipped_file_dir, self.cache_dir)
+        self.assertEqual(len(file_hash), 64)
+        self.assertEqual(
+            file_hash, get_file_hash(self.unzipped_file_dir, self.cache_dir)
+        )
+        self.assertNotEqual(file_hash, get_file_hash(self.zip_file_dir, self.cache_dir))
+        self.assertEqual(get_parser_version(), get_parser_version())
+
+    def test_cached_summary(self):
+        file_summary = read_files([self.unzipped_file_dir], AuthorIsUser=True)[0]
+        file_summary = FileSummary(file_summary)
+        file_hash = get_file_hash(self.unzipped_file_dir, self.cache_dir)
+        # not cached yet
+        self.assertIsNone(
+            load_cached_summary(self.unzipped_file_dir, file_hash, self.cache_dir)
+        )
+        with self.assertRaises(TypeError):
+            store_cached_summary("not FileSummary", file_hash, self.cache_dir)
+        store_cached_summary(file_summary, file_hash, self.cache_dir)
+        cached_summary = load_cached_summary(
+            self.unzipped_file_dir, file_hash, self.cache_dir
+        )
+        self.assertEqual(cached_summary.__dict__, file_summary.__dict__)
+
+    def test_get_cache_path(self):
+        config_values = (
+            config.PROCESSING.seconds_per_process,
+            config.TRACKS.enabled,
+            config.TELEMETRY.enabled,
+        )
+        cache_path = get_cache_path("a", self.cache_dir)
+        config_hash = get_config_hash()
+        self.assertIn(get_parser_version(), cache_path)
+        self.assertIn(config_hash, cache_path)
+        try:
+            # summaries parsed with other settings are not loaded
+            for section, key, value in [
+                ("PROCESSING", "seconds_per_process", 2),
+                ("TRACKS", "enabled", not config.TRACKS.enabled),
+                ("TELEMETRY", "enabled", not config.TELEMETRY.enabled),
+            ]:
+                original = getattr(getattr(config, section), key)
+                setattr(getattr(config, section), key, value)
+                self.assertNotEqual(get_config_hash(), config_hash)
+                self.assertNotEqual(get_cache_path("a", self.cache_dir), cache_path)
+                setattr(getattr(config, section), key, original)
+            self.assertEqual(get_cache_path("a", self.cache_dir), cache_path)
+        finally:
+            (
+                config.PROCESSING.seconds_per_process,
+                config.TRACKS.enabled,
+                config.TELEMETRY.enabled,
+            ) = config_values
+
+    def test_evict_cache(self):
+        file_summary = FileSummary(
+            read_files([self.unzipped_file_dir], AuthorIsUser=True)[0]
+        )
+        for file_hash in ["a", "b", "c"]:
+            store_cached_summary(file_summary, file_hash, self.cache_dir)
+            time.sleep(0.01)
+        # 'a' is used most recently, so 'b' is evicted first
+        load_cached_summary(self.unzipped_file_dir, "a", self.cache_dir)
+        cache_size = sum(
+            os.path.getsize(f"{self.cache_dir}/{file}")
+            for file in os.listdir(self.cache_dir)
+        )
+        evict_cache(self.cache_dir, max_size=(cache_size - 1) / (1024 * 1024))
+        cached = [
+            file_hash
+            for file_hash in ["a", "b", "c"]
+            if load_cached_summary(self.unzipped_file_dir, file_hash, self.cache_dir)
+        ]
+        self.assertEqual(cached, ["a", "c"])
+        evict_cache(self.cache_dir, max_size=0)
+        self.assertIsNone(
+            load_cached_summary(self.unzipped_file_dir, "a", self.cache_dir)
+        )
+
+    def test_read_files_cached(self):
+        config.CACHE.enabled = True
+        config.CACHE.cache_dir = self.cache_dir
+        files = [self.unzipped_file_dir, self.zip_file_dir]
+        first_run = read_files(files, AuthorIsUser=True)
+        second_run = read_files(files, AuthorIsUser=True)
+        self.assertEqual(list(second_run.keys()), [0, 1])
+        for index, file_summary in second_run.items():
+            self.assertTrue(isinstance(file_summary, FileSummary))
+            self.assertEqual(file_summary.__dict__, first_run[index].__dict__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,340 @@
+import random
+import unittest
+from src.classes.FileData import FileData
+from src.data.typeReferences import killer_types_mask
+from src.data.valueReferences import max_kill_distance, max_dying_time
+from src.managers.dataProcessor import (
+    process_file_tick,
+    check_tick_due,
+    sweep_kill_attribution,
+)
+from src.managers.fileManager import process_file
+from src.utils.coordUtils import get_closest_obj, get_closest_obj_to_pos
+from src.utils.processingUtils import check_is_type
+from src.utils.configUtils import config
+
+
+def linear_process_file_tick(file: FileData):
+    """Reference kill attribution, comparing every dying object with every other dying object (each tick)."""
+    dying_ref_list = [
+        obj
+        for obj in list(file.dying_objects.values())
+        if not obj.check_skip_data_processing_type()
+    ]
+    for ref_obj in dying_ref_list:
+        if not ref_obj.check_is_dying():
+            continue
+        if (file.time_stamp - ref_obj.death_time_stamp) > max_dying_time:
+            ref_obj.update_to_dead()
+            continue
+        if len(dying_ref_list) == 1:
+            break
+        closest_list = [o for o in dying_ref_list if o.check_is_dying()]
+        closest_obj, dist = get_closest_obj(ref_obj, closest_list)
+        if not check_is_type(ref_obj, killer_types_mask):
+            continue
+        if closest_obj == None:
+            break
+        if dist < max_kill_distance and not check_is_type(
+            closest_obj, killer_types_mask
+        ):
+            ref_obj.add_kill(closest_obj, dist=dist)
+    for shell in list(file.dying_shells.values()):
+        if (file.time_stamp - shell.death_time_stamp) > max_dying_time:
+            shell.update_to_dead()
+    # shells kill as dying weapons do, comparing against dying objects and shells
+    dying_ref_list = [
+        obj
+        for obj in file.dying_objects.values()
+        if not obj.check_skip_data_processing_type()
+    ] + list(file.dying_shells.values())
+    for shell in list(file.dying_shells.values()):
+        closest_list = [
+            o for o in dying_ref_list if o is not shell and o.state == "Dying"
+        ]
+        if not closest_list:
+            continue
+        closest_obj, dist = get_closest_obj_to_pos(shell.get_death_pos(), closest_list)
+        if closest_obj is None or check_is_type(closest_obj, killer_types_mask):
+            continue
+        if dist < max_kill_distance:
+            shell.add_kill(closest_obj, dist=dist)
+
+
+def get_random_file_data(seed: int) -> FileData:
+    """Returns FileData with clusters of dying weapons, victims, and shells (on a 1/512 degree lattice, so some are exactly equidistant)."""
+    rng = random.Random(seed)
+    file_data = FileData()
+    file_data.file_name = "TEST_DATA_PROCESSOR.txt.acmi"
+    types = [["Ground", "Vehicle"], ["Air", "FixedWing"], ["Weapon", "Missile"]]
+    for time_stamp in [1.0, 5.0, 12.0]:
+        file_data.set_time(time_stamp)
+        dying = []
+        for index in range(rng.randint(1, 40)):
+            lat = rng.randint(0, 10) / 512
+            long = rng.randint(0, 10) / 512
+            alt = str(rng.choice([0, 0, 0, 512]))
+            if rng.random() < 0.3:
+                shell = file_data.new_shell(f"s{time_stamp}_{index}", ["Shell"])
+                shell.update_transform(str(lat), str(long), alt)
+                dying.append(shell)
+                continue
+            obj = file_data.new_obj(f"{time_stamp}_{index}")
+            obj.type = rng.choice(types)
+            obj.update_transform(str(lat), str(long), alt)
+            dying.append(obj)
+        rng.shuffle(dying)
+        for obj in dying:
+            obj.update_to_dying()
+    return file_data
+
+
+def get_random_lines(seed: int) -> list:
+    """Returns acmi lines with objects (and shells) spawning and being removed near each other, reusing ids of removed objects."""
+    rng = random.Random(seed)
+    lines = ["FileType=text/acmi/tacview\n", "FileVersion=2.1\n"]
+    types = ["Ground+Vehicle", "Air+FixedWing", "Weapon+Bomb", "Projectile+Shell"]
+    alive = set()
+    for time_stamp in range(60):
+        lines.append(f"#{time_stamp + rng.choice([0, 0.5])}\n")
+        for _ in range(rng.randint(0, 6)):
+            id = f"{rng.randint(1, 40):x}"
+            if id in alive:
+                lines.append(f"-{id}\n")
+                alive.remove(id)
+            else:
+                long, lat = rng.randint(0, 10) / 512, rng.randint(0, 10) / 512
+                lines.append(f"{id},T={long}|{lat}|0,Type={rng.choice(types)}\n")
+                alive.add(id)
+    return lines
+
+
+def get_engagement_lines(seed: int, engagements: int = 40) -> list:
+    """Returns acmi lines of separate engagements: a bomb or shell dies near a target, which is killed (removed within a few seconds of it), or missed.\n
+    Some targets are removed without a weapon (e.g.: crashed). Targets are spread out, so each engagement only involves its own weapon and target.
+    """
+    rng = random.Random(seed)
+    lines = ["FileType=text/acmi/tacview\n", "FileVersion=2.1\n", "#0\n"]
+    target_ids = list(range(engagements))
+    for target_id in target_ids:
+        lat, long = (target_id % 8) / 10, (target_id // 8) / 10
+        types = rng.choice(["Ground+Vehicle", "Air+FixedWing"])
+        lines.append(f"t{target_id},T={long}|{lat}|0,Type={types}\n")
+    rng.shuffle(target_ids)
+    events = {}  # time stamp (tenths of seconds):lines
+    for weapon_id, target_id in enumerate(target_ids):
+        lat, long = (target_id % 8) / 10, (target_id // 8) / 10
+        time_stamp = rng.randint(10, 1100)
+        outcome = rng.choice(["Kill", "Kill", "Miss", "Crash"])
+        if outcome == "Crash":
+            events.setdefault(time_stamp, []).append(f"-t{target_id}\n")
+            continue
+        offset = rng.uniform(-0.001, 0.001) if outcome == "Kill" else 0.02
+        types = rng.choice(["Weapon+Bomb", "Projectile+Shell"])
+        events.setdefault(time_stamp, []).append(
+            f"w{weapon_id},T={long + offset}|{lat}|0,Type={types}\n"
+        )
+        death_time = time_stamp + rng.randint(0, 20)
+        events.setdefault(death_time, []).append(f"-w{weapon_id}\n")
+        if outcome == "Kill":
+            victim_death_time = death_time + rng.randint(-10, 30)
+            events.setdefault(victim_death_time, []).append(f"-t{target_id}\n")
+    # a time frame every 0.1 seconds
+    for time_stamp in range(1, max(events) + 200):
+        lines.append(f"#{time_stamp / 10}\n")
+        lines += events.get(time_stamp, [])
+    return lines
+
+
+def get_sweep_file_data(lines: list) -> FileData:
+    """Returns FileData of lines read with sweep_attribution, after sweep_kill_attribution."""
+    file_data = FileData()
+    file_data.sweep_attribution = True
+    process_file(file_data, iter(lines), AuthorIsUser=True)
+    sweep_kill_attribution(file_data)
+    return file_data
+
+
+def get_kills(file_data: FileData) -> list:
+    """Returns [weapon uid, victim uid] of all kills, and the states of all objects."""
+    kills = [
+        [obj.killer_weapon.uid, obj.uid]
+        for obj in file_data.get_all_objs()
+        if obj.killer_weapon
+    ]
+    states = [[obj.uid, obj.state] for obj in file_data.get_all_objs()]
+    return sorted(kills), sorted(states)
+
+
+class TestDataProcessor(unittest.TestCase):
+    def test_process_file_tick(self):
+        kill_count = 0
+        for seed in range(40):
+            expected_file_data = get_random_file_data(seed)
+            file_data = get_random_file_data(seed)
+            for time_stamp in [13.0, 16.0, 23.0]:
+                expected_file_data.set_time(time_stamp)
+                file_data.set_time(time_stamp)
+                linear_process_file_tick(expected_file_data)
+                process_file_tick(file_data)
+                self.assertEqual(
+                    get_kills(file_data), get_kills(expected_file_data), f"{seed=}"
+                )
+            kill_count += len(get_kills(file_data)[0])
+        # ensure the random data includes kills
+        self.assertGreater(kill_count, 40)
+
+    def test_process_file_killed_and_expired(self):
+        kill_count = 0
+        for seed in range(20):
+            # objects killed earlier in a tick can also be past their dying time (only updated to dead once)
+            file_data = FileData()
+            process_file(file_data, iter(get_random_lines(seed)), AuthorIsUser=True)
+            kills, states = get_kills(file_data)
+            kill_count += len(kills)
+            states = dict(states)
+            # weapons may be shells (not objects), victims are objects
+            for _, victim_uid in kills:
+                self.assertEqual(states[victim_uid], "Dead")
+        self.assertGreater(kill_count, 20)
+
+    def test_sweep_kill_attribution(self):
+        kill_count = 0
+        for seed in range(20):
+            lines = get_engagement_lines(seed)
+            expected_file_data = FileData()
+            process_file(expected_file_data, iter(lines), AuthorIsUser=True)
+            file_data = FileData()
+            file_data.sweep_attribution = True
+            process_file(file_data, iter(lines), AuthorIsUser=True)
+            # no ticks while reading
+            self.assertEqual(get_kills(file_data)[0], [])
+            self.assertEqual(file_data.dying_deadlines, [])
+            sweep_kill_attribution(file_data)
+            # the same kills, shell kills, and states as ticks
+            self.assertEqual(
+                get_kills(file_data), get_kills(expected_file_data), f"{seed=}"
+            )
+            self.assertEqual(
+                sorted(
+                    [shell.uid, shell.victim.uid] for shell in file_data.shell_kills
+                ),
+                sorted(
+                    [shell.uid, shell.victim.uid]
+                    for shell in expected_file_data.shell_kills
+                ),
+            )
+            self.assertEqual(
+                [list(file_data.dying_objects), list(file_data.dying_shells)],
+                [
+                    list(expected_file_data.dying_objects),
+                    list(expected_file_data.dying_shells),
+                ],
+            )
+            kill_count += len(get_kills(file_data)[0])
+        self.assertGreater(kill_count, 100)
+        with self.assertRaises(ValueError):
+            sweep_kill_attribution(file_data)
+
+    def test_sweep_kill_attribution_bookkeeping(self):
+        kill_count = 0
+        for seed in range(20):
+            # dense deaths (and reused ids), where a few kills can differ from ticks
+            file_data = get_sweep_file_data(get_random_lines(seed))
+            victims = [obj for obj in file_data.get_all_objs() if obj.killer_weapon]
+            for victim in victims:
+                weapon = victim.killer_weapon
+                self.assertEqual(victim.state, "Dead")
+                self.assertEqual(weapon.state, "Dead")
+                self.assertIs(victim.killer, weapon.launcher)
+                self.assertFalse(check_is_type(victim, killer_types_mask))
+                self.assertLessEqual(
+                    abs(weapon.death_time_stamp - victim.death_time_stamp),
+                    max_dying_time,
+                )
+                if weapon in file_data.shell_kills:
+                    self.assertIs(weapon.victim, victim)
+                else:
+                    self.assertEqual(weapon.kills, {weapon: victim})
+            # each weapon kills once
+            self.assertEqual(
+                len({victim.killer_weapon for victim in victims}), len(victims)
+            )
+            # deaths over max_dying_time before the end are dead
+            for obj in file_data.get_all_objs():
+                if obj.state == "Dying":
+                    self.assertLessEqual(
+                        file_data.time_stamp - obj.death_time_stamp, max_dying_time
+                    )
+            kill_count += len(victims)
+        self.assertGreater(kill_count, 100)
+
+    def test_check_tick_due(self):
+        file_data = FileData()
+        self.assertFalse(check_tick_due(file_data))
+        file_data.set_time(1.0)
+        victim = file_data.new_obj("101")
+        victim.type = ["Ground", "Vehicle"]
+        victim.update_transform("6", "8", "0")
+        victim.update_to_dying()
+        shell = file_data.new_shell("a01", ["Shell"])
+        shell.update_transform("0", "0", "0")
+        file_data.set_time(2.0)
+        shell.update_to_dying()
+        # dying objects changed
+        self.assertTrue(check_tick_due(file_data))
+        process_file_tick(file_data)
+        self.assertFalse(check_tick_due(file_data))
+        file_data.set_time(1.0 + max_dying_time)
+        self.assertFalse(check_tick_due(file_data))
+        # victim's dying time is over
+        file_data.set_time(1.1 + max_dying_time)
+        self.assertTrue(check_tick_due(file_data))
+        process_file_tick(file_data)
+        self.assertTrue(victim.check_is_dead())
+        self.assertTrue(check_tick_due(file_data))
+        process_file_tick(file_data)
+        # the dead victim's deadline is discarded, the shell's is next
+        self.assertFalse(check_tick_due(file_data))
+        self.assertEqual(len(file_data.dying_deadlines), 1)
+        file_data.set_time(2.1 + max_dying_time)
+        self.assertTrue(check_tick_due(file_data))
+        process_file_tick(file_data)
+        self.assertEqual(file_data.dying_shells, {})
+
+    def test_dying_deadlines_bounded(self):
+        skip_idle_ticks = config.PROCESSING.skip_idle_ticks
+        try:
+            for config.PROCESSING.skip_idle_ticks in [True, False]:
+                file_data = FileData()
+                max_deadlines = 0
+                # a busy (e.g.: followed) file: every second a missile kills a vehicle, and a shell dies without a victim
+                for second in range(1000):
+                    file_data.set_time(float(second))
+                    for index, types in enumerate(
+                        [["Ground", "Vehicle"], ["Weapon", "Missile"]]
+                    ):
+                        obj = file_data.new_obj(f"{second}_{index}")
+                        obj.type = types
+                        obj.update_transform(str(second / 100), "0", "0")
+                        obj.update_to_dying()
+                    shell = file_data.new_shell(f"s{second}", ["Shell"])
+                    shell.update_transform("0", str(second / 100), "0")
+                    shell.update_to_dying()
+                    if not config.PROCESSING.skip_idle_ticks or check_tick_due(
+                        file_data
+                    ):
+                        process_file_tick(file_data)
+                    max_deadlines = max(max_deadlines, len(file_data.dying_deadlines))
+                self.assertEqual(len(get_kills(file_data)[0]), 1000)
+                if config.PROCESSING.skip_idle_ticks:
+                    # only deaths (3 per second) within about max_dying_time are kept
+                    self.assertLessEqual(max_deadlines, 3 * (max_dying_time + 2))
+                else:
+                    self.assertEqual(max_deadlines, 0)
+        finally:
+            config.PROCESSING.skip_idle_ticks = skip_idle_ticks
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,38 @@
 import unittest
 import os
-from src.managers.fileManager import is_zip, read_files, process_file
+import time
+import tempfile
+import multiprocessing
+from src.managers.fileManager import (
+    is_zip,
+    read_files,
+    read_file_lines,
+    follow_file,
+    scan_files,
+    header_lines,
+    process_file,
+)
+from src.classes.FileData import FileData
+from src.classes.FileSummary import FileSummary
+from src.utils.configUtils import config
+
+
+def write_file_over_time(
+    source_lines: list, file_path: str, batches: int, delay: float, done=None
+):
+    """Appends source_lines to file_path in batches (with a partial line between batches), to be followed.\n
+    done (Event) is set once all lines have been written."""
+    batch_size = len(source_lines) // batches + 1
+    with open(file_path, "a", encoding="utf-8") as f:
+        for start in range(0, len(source_lines), batch_size):
+            batch = "".join(source_lines[start : start + batch_size])
+            f.write(batch[:-10])
+            f.flush()
+            time.sleep(delay)
+            f.write(batch[-10:])
+            f.flush()
+    if done is not None:
+        done.set()
 
 
 class TestFileManager(unittest.TestCase):
@@ -26,11 +58,177 @@ class TestFileManager(unittest.TestCase):
         self.assertTrue(is_zip(self.zip_file_dir))
         self.assertTrue(is_zip(self.zip_test_dir))
 
-    # def test_read_files(self):
-    #     raise NotImplementedError
+    def test_read_file_lines(self):
+        # lines are yielded lazily, not as a list
+        lines = read_file_lines(self.zip_file_dir, True)
+        self.assertFalse(isinstance(lines, list))
+        self.assertTrue(next(lines).startswith("FileType="))
+        lines.close()
+        # zipped and plain files decode to the same lines (BOM removed)
+        for file_dir in [self.zip_file_dir, self.unzipped_file_dir]:
+            first_line = next(read_file_lines(file_dir, is_zip(file_dir)))
+            self.assertTrue(first_line.startswith("FileType="), msg=f"{file_dir=}")
+
+    def test_read_files(self):
+        files_data = read_files(
+            [self.zip_file_dir, self.unzipped_file_dir], AuthorIsUser=True
+        )
+        self.assertEqual(list(files_data.keys()), [0, 1])
+        self.assertTrue(files_data[0].is_zip)
+        self.assertFalse(files_data[1].is_zip)
+        # file_length is counted as lines are consumed
+        with open(self.unzipped_file_dir, "r", encoding="utf-8-sig") as f:
+            self.assertEqual(files_data[1].file_length, len(f.readlines()))
+
+    def test_read_files_parallel(self):
+        files = [self.zip_file_dir, self.unzipped_file_dir, self.zip_test_dir]
+        serial_data = read_files(files, AuthorIsUser=True)
+        parallel_data = read_files(files, AuthorIsUser=True, workers=2)
+        # results are summaries, returned in the original file order
+        self.assertEqual(list(parallel_data.keys()), [0, 1, 2])
+        for index, file_summary in parallel_data.items():
+            self.assertTrue(isinstance(file_summary, FileSummary))
+            self.assertEqual(
+                file_summary.__dict__, FileSummary(serial_data[index]).__dict__
+            )
+
+    def test_read_file_sweep(self):
+        kill_file = (
+            self.test_data_dir
+            + "/Tacview-20230620-222105-DCS-PG-AA-Trainer-Modern-v2.6.zip.acmi"
+        )
+        kill_attribution = config.PROCESSING.kill_attribution
+        try:
+            file_summaries = {}
+            for config.PROCESSING.kill_attribution in ["tick", "sweep"]:
+                file_data = read_files([kill_file], AuthorIsUser=True)[0]
+                self.assertFalse(file_data.sweep_attribution)
+                file_summaries[config.PROCESSING.kill_attribution] = FileSummary(
+                    file_data
+                )
+            # the test data's kills are the same attributed after reading as per tick (objects die in a different order)
+            self.assertGreater(len(file_summaries["tick"].kills), 0)
+            for attr in ["object_rows", "kills", "launches"]:
+                self.assertEqual(
+                    sorted(getattr(file_summaries["sweep"], attr), key=str),
+                    sorted(getattr(file_summaries["tick"], attr), key=str),
+                )
+            config.PROCESSING.kill_attribution = "replay"
+            with self.assertRaises(ValueError):
+                read_files([self.unzipped_file_dir], AuthorIsUser=True)
+        finally:
+            config.PROCESSING.kill_attribution = kill_attribution
+
+    def test_scan_files(self):
+        # header stops at the first time frame (unless within a continued line), skipping objects
+        lines = [
+            "FileType=x\n",
+            "1,T=1\n",
+            "0,Comments=a\\\n",
+            "#b\n",
+            "0,Title=c\n",
+            "#0\n",
+            "1,T=1\n",
+        ]
+        self.assertEqual(list(header_lines(lines)), [lines[0]] + lines[2:5])
+
+        files = [
+            f"{self.test_data_dir}/{file_name}"
+            for file_name in sorted(os.listdir(self.test_data_dir))
+        ]
+        scanned_data = scan_files(files)
+        full_data = read_files(files, AuthorIsUser=True)
+        self.assertEqual(len(scanned_data), len(files))
+        for index, file_data in scanned_data.items():
+            self.assertTrue(file_data.header_only)
+            self.assertEqual(file_data.all_objects, {})
+            self.assertLess(file_data.file_length, 200)
+            scanned_row = FileSummary(file_data).file_row
+            full_row = FileSummary(full_data[index]).file_row
+            # header fields match a full read, length/objects/time stamps are unknown
+            for column in [5, 13, 14, 15]:
+                self.assertIsNone(scanned_row[column])
+                full_row[column] = None
+            self.assertEqual(scanned_row, full_row)
+
+    def test_follow_file(self):
+        recording = (
+            self.test_data_dir
+            + "/Tacview-20230620-222105-DCS-PG-AA-Trainer-Modern-v2.6.zip.acmi"
+        )
+        source_lines = list(read_file_lines(recording, True))
+        full_data = read_files([recording], AuthorIsUser=True)[0]
+        full_summary = FileSummary(full_data)
+        with self.assertRaises(ValueError):
+            follow_file(recording, AuthorIsUser=True)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            live_file = f"{temp_dir}/LIVE.txt.acmi"
+            open(live_file, "w").close()
+            # the writer signals when it is done, so a slow writer start is not taken as idle
+            done = multiprocessing.Event()
+            writer = multiprocessing.Process(
+                target=write_file_over_time,
+                args=(source_lines, live_file, 8, 0.1, done),
+            )
+            events = []
+            writer.start()
+            live_data = follow_file(
+                live_file,
+                AuthorIsUser=True,
+                event_listener=events.append,
+                poll_interval=0.02,
+                idle_timeout=60,
+                max_dead_time=30,
+                stop_event=done,
+            )
+            writer.join()
+
+        self.assertEqual(live_data.file_length, full_data.file_length)
+        self.assertEqual(live_data.time_stamp, full_data.time_stamp)
+        # launches and kills are published as they happen, matching a full read
+        launches = [
+            [event.object.uid, event.destination.uid]
+            for event in events
+            if event.type == "Launch"
+        ]
+        kills = [
+            [event.object.uid, event.destination.uid]
+            for event in events
+            if event.type == "Kill"
+        ]
+        self.assertEqual(sorted(launches), sorted(full_summary.launches))
+        self.assertEqual(sorted(kills), sorted(kill[:2] for kill in full_summary.kills))
+        # long dead objects are pruned
+        self.assertLess(len(live_data.dead_objects), len(full_data.dead_objects))
+        self.assertEqual(live_data.uid_counter, full_data.uid_counter)
+        # pruned objects' rows are kept, so outputs match a full read (other than the file name)
+        live_summary = FileSummary(live_data)
+        for rows in ["object_rows", "launches", "kills"]:
+            self.assertEqual(
+                sorted(getattr(live_summary, rows), key=str),
+                sorted(getattr(full_summary, rows), key=str),
+                rows,
+            )
+        self.assertEqual(
+            sorted((row[:-1] for row in live_summary.output_rows), key=str),
+            sorted((row[:-1] for row in full_summary.output_rows), key=str),
+        )
+        self.assertEqual(live_summary.munition_metrics, full_summary.munition_metrics)
 
-    # def test_process_file(self):
-    #     raise NotImplementedError
+    def test_process_file(self):
+        with open(self.unzipped_file_dir, "r", encoding="utf-8-sig") as f:
+            file_lines = f.readlines()
+        # list input and streamed (generator) input give the same result
+        list_data, stream_data = FileData(), FileData()
+        list_data.is_zip, stream_data.is_zip = False, False
+        process_file(list_data, file_lines, AuthorIsUser=True)
+        process_file(stream_data, (line for line in file_lines), AuthorIsUser=True)
+        self.assertEqual(list_data.file_length, len(file_lines))
+        self.assertEqual(stream_data.file_length, len(file_lines))
+        self.assertEqual(list_data.file_type, stream_data.file_type)
+        self.assertEqual(list_data.time_stamp, stream_data.time_stamp)
+        self.assertEqual(len(list_data.all_objects), len(stream_data.all_objects))
 
 
 if __name__ == "__main__":
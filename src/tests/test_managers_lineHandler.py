@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import patch
+from src.classes.FileData import FileData
+from src.data.acmiAttrDicts import acmi_obj_to_attr_all
+from src.managers import lineHandler
+from src.managers.fileManager import process_file
+from src.utils.configUtils import config
+from src.managers.lineHandler import (
+    object_line,
+    obj_attr_handlers,
+    shell_attr_handlers,
+    shell_transform_attr,
+    get_obj_attr_handlers,
+    transform_attr,
+    type_attr,
+)
+
+
+class TestLineHandler(unittest.TestCase):
+    def setUp(self):
+        self.file_data = FileData()
+        self.file_data.set_time(1)
+
+    def test_get_obj_attr_handlers(self):
+        # keys exclude '=', skipped (None) pointers have no handler
+        handlers = get_obj_attr_handlers({"T=": -1, "Name=": "name", "IAS": None})
+        self.assertEqual(list(handlers.keys()), ["T", "Name"])
+        self.assertEqual(handlers["T"], transform_attr)
+        self.assertEqual(obj_attr_handlers["Type"], type_attr)
+        for acmi_pointer, obj_attr_name in acmi_obj_to_attr_all.items():
+            if obj_attr_name is None:
+                self.assertNotIn(acmi_pointer.rstrip("="), obj_attr_handlers)
+
+    def test_object_line(self):
+        object_line(
+            "1402,T=5.3188736|5.2597919|9.93|-1.2|-1.6|133.2|-92130.2|10611.6|134,Type=Ground+AntiAircraft,Name=S-300PS 54K6 cp,Pilot=Ground-6-3,Group=Ground-6,Color=Red,Coalition=Allies,Country=ru,IAS=1,Unknown=x",
+            self.file_data,
+        )
+        obj = self.file_data.get_obj_by_id("1402")
+        self.assertEqual(obj.get_pos(), [5.2597919, 5.3188736, 9.93])
+        self.assertEqual([obj.u, obj.v], [-92130.2, 10611.6])
+        self.assertEqual(obj.type, ["Ground", "AntiAircraft"])
+        self.assertEqual(
+            [obj.name, obj.pilot, obj.group, obj.color, obj.coalition, obj.country],
+            ["S-300PS 54K6 cp", "Ground-6-3", "Ground-6", "Red", "Allies", "ru"],
+        )
+        # values are split at the first '=' only, blank transform values are unchanged
+        object_line("1402,T=|5.26|,Pilot=A=B \\, C", self.file_data)
+        self.assertEqual(obj.get_pos(), [5.26, 5.3188736, 9.93])
+        self.assertEqual(obj.pilot, "A=B \\, C")
+
+    def test_shell_line(self):
+        self.assertEqual(shell_attr_handlers["T"], shell_transform_attr)
+        object_line(
+            "a0,T=5|7|900|1|2|3,Type=Weapon+Projectile+Shell,Name=M61_20_HE,Coalition=Enemies,Color=Blue",
+            self.file_data,
+        )
+        object_line("a01,T=6|8|100,Type=Projectile+Shell", self.file_data)
+        shell = self.file_data.shells["a0"]
+        self.assertEqual(shell.get_pos(), [7.0, 5.0, 900.0])
+        self.assertEqual([shell.name, shell.coalition], ["M61_20_HE", "Enemies"])
+        # known shells skip split_attrs, blank transform values are unchanged
+        object_line("a0,T=|7.5|,Name=M61_20_API", self.file_data)
+        self.assertEqual(shell.get_pos(), [7.5, 5.0, 900.0])
+        self.assertEqual(shell.name, "M61_20_API")
+        # a line without attributes is not read as the id without its last character
+        with patch.object(lineHandler, "shell_line") as shell_line:
+            object_line("a01", self.file_data)
+        self.assertEqual(shell_line.call_args.args[1], self.file_data.shells["a01"])
+
+    def test_time_stamp_line(self):
+        lines = [
+            "FileType=text/acmi/tacview\n",
+            "FileVersion=2.1\n",
+            "#0\n",
+            "101,T=5|7|1000,Type=Air+FixedWing,Name=F-16C_50,Pilot=Quiet\n",
+            "102,T=6|8|0,Type=Ground+Vehicle,Name=M 818\n",
+            "103,T=6|8.001|50,Type=Weapon+Missile,Name=AGM-65D\n",
+            "104,T=9|9|0,Type=Ground+Vehicle,Name=M 818\n",
+            "#1\n",
+            "#2\n",
+            "-103\n",
+            "-102\n",
+            "#5\n",
+            "-104\n",
+        ]
+        for time_stamp in range(6, 31):
+            lines += [f"#{time_stamp}\n", f"101,T=||{1000 + time_stamp}\n"]
+        config_processing = (
+            config.PROCESSING.seconds_per_process,
+            config.PROCESSING.skip_idle_ticks,
+        )
+        ticks = {}
+        try:
+            config.PROCESSING.seconds_per_process = 1
+            for skip_idle_ticks in [False, True]:
+                config.PROCESSING.skip_idle_ticks = skip_idle_ticks
+                file_data = FileData()
+                file_data.file_name = "TEST_TICKS.txt.acmi"
+                tick_times = []
+
+                def process_file_tick(file_data, tick=lineHandler.process_file_tick):
+                    tick_times.append(file_data.time_stamp)
+                    tick(file_data)
+
+                with patch.object(lineHandler, "process_file_tick", process_file_tick):
+                    process_file(file_data, iter(lines), AuthorIsUser=True)
+                ticks[skip_idle_ticks] = tick_times
+                victim = file_data.get_obj_by_id("102", "Dead")
+                self.assertEqual(victim.killer_weapon.id, "103")
+                # expired 10 seconds after dying (time 5)
+                expired = file_data.get_obj_by_id("104", "Dead")
+                self.assertEqual(expired.death_time_stamp, 5)
+                self.assertEqual(file_data.dying_objects, {})
+        finally:
+            (
+                config.PROCESSING.seconds_per_process,
+                config.PROCESSING.skip_idle_ticks,
+            ) = config_processing
+        self.assertEqual(ticks[False], [0, 5] + list(range(6, 31)))
+        # only after deaths/kills (until a tick changes nothing), and once a dying time is over
+        self.assertEqual(ticks[True], [5, 6, 16, 17])
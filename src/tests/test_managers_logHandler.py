@@ -1,7 +1,14 @@
 import unittest
-from src.managers.logHandler import Logger, logger
+from src.managers.logHandler import (
+    BoundedQueueHandler,
+    Logger,
+    logger,
+    trace_level,
+    detail_level,
+)
 from src.utils.configUtils import config
 import logging
+from queue import Queue
 
 
 class TestManagersLogHandler(unittest.TestCase):
@@ -59,3 +66,57 @@ class TestManagersLogHandler(unittest.TestCase):
                 if isinstance(handler, logging.FileHandler):
                     result_handlers[1] += 1
             self.assertEqual(expected_handlers, result_handlers)
+
+    def test_update_level(self):
+        to_console, to_file = config.LOGGING.to_console, config.LOGGING.to_file
+        config.LOGGING.to_console = False
+        config.LOGGING.to_file = False
+        test_logger = Logger("update_level", setup_trace=False)
+        config.LOGGING.to_console, config.LOGGING.to_file = to_console, to_file
+        # no handlers (logging.lastResort only handles WARNING and above)
+        self.assertEqual(test_logger.level, logging.WARNING)
+        handlers = [logging.NullHandler(), logging.NullHandler()]
+        for handler, level in zip(handlers, [logging.INFO, logging.DEBUG]):
+            handler.setLevel(level)
+            test_logger.addHandler(handler)
+        test_logger.update_level()
+        self.assertEqual(test_logger.level, logging.DEBUG)
+        self.assertFalse(test_logger.isEnabledFor(trace_level))
+        # isEnabledFor cache is cleared when the level changes
+        handlers[1].setLevel(detail_level)
+        test_logger.update_level()
+        self.assertTrue(test_logger.isEnabledFor(trace_level))
+        self.assertTrue(test_logger.isEnabledFor(detail_level))
+
+    def test_queue_logging(self):
+        to_console, to_file = config.LOGGING.to_console, config.LOGGING.to_file
+        config.LOGGING.to_console = False
+        config.LOGGING.to_file = False
+        test_logger = Logger("queue_logging", setup_trace=False)
+        config.LOGGING.to_console, config.LOGGING.to_file = to_console, to_file
+        records = []
+        handler = logging.Handler(logging.DEBUG)
+        handler.emit = records.append
+        test_logger.addHandler(handler)
+        test_logger.start_queue()
+        self.assertEqual(len(test_logger.handlers), 1)
+        self.assertIsInstance(test_logger.handlers[0], BoundedQueueHandler)
+        self.assertEqual(test_logger.level, logging.DEBUG)
+        for index in range(100):
+            test_logger.debug(f"queued {index}")
+        test_logger.trace("below handler level")
+        # stop_queue writes all queued records, and restores the handlers
+        test_logger.stop_queue()
+        self.assertEqual(test_logger.handlers, [handler])
+        self.assertEqual(
+            [record.getMessage() for record in records],
+            [f"queued {index}" for index in range(100)],
+        )
+        # when_full
+        with self.assertRaises(ValueError):
+            BoundedQueueHandler(Queue(1), "wait")
+        drop_handler = BoundedQueueHandler(Queue(1), "drop")
+        for index in range(3):
+            drop_handler.handle(logging.makeLogRecord({"msg": f"log {index}"}))
+        self.assertEqual(drop_handler.dropped, 2)
+        self.assertEqual(drop_handler.queue.get().getMessage(), "log 0")
@@ -0,0 +1,88 @@
+import unittest
+import csv
+import os
+import tempfile
+from src.classes.FileData import FileData
+from src.managers.fileManager import process_file
+from src.managers.outcomeWriter import write_outcome
+from src.utils.outputUtils import objects_csv_header, output_csv_header
+
+
+class TestOutcomeWriter(unittest.TestCase):
+    def setUp(self):
+        self.lines = [
+            "FileType=text/acmi/tacview\n",
+            "FileVersion=2.1\n",
+            "0,ReferenceLongitude=34\n",
+            "0,ReferenceLatitude=40\n",
+            "0,Title=Shell Kill\n",
+            "#0\n",
+            "101,T=5|7|1000,Type=Air+FixedWing,Name=F-16C_50,Pilot=Gun,Coalition=Enemies,Country=us\n",
+            "102,T=6|8|0,Type=Ground+Vehicle,Name=M 818,Coalition=Allies,Country=ru\n",
+            "#1\n",
+            "a01,T=6|8|5,Type=Weapon+Projectile+Shell,Name=M61_20_HE,Coalition=Enemies\n",
+            "#2\n",
+            "a01,T=6|8.0001|1\n",
+            "#3\n",
+            "-a01\n",
+            "-102\n",
+            "#4.5\n",
+        ]
+
+    def read_rows(self, path: str) -> list:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            return list(csv.reader(f))
+
+    def test_write_outcome_shell_kill(self):
+        file_data = FileData()
+        file_data.is_zip = False
+        file_data.file_name = "C:/TacView/TEST_SHELL.txt.acmi"
+        file_data.file_size = 1
+        process_file(file_data, self.lines, AuthorIsUser=True)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            outcome_dirs = tuple(
+                os.path.join(temp_dir, name)
+                for name in ["output.csv", "files_data.csv", "test_objects_data.csv"]
+            )
+            write_outcome({0: file_data}, outcome_dirs)
+            objects_rows = self.read_rows(outcome_dirs[2])
+            output_rows = self.read_rows(outcome_dirs[0])
+        metrics = [""] * 11
+        # the shell that killed has a row (other shells are discarded), and the victim's killer_Weapon is the shell (shells have no launcher, so no killer)
+        self.assertEqual(
+            objects_rows,
+            [
+                ["0", "0", "101", "Gun", "F-16C_50", "Enemies", "['Air', 'FixedWing']"]
+                + ["us", "0", "0", "", "", "0.0", "4.5", "[]", ""]
+                + metrics
+                + ["0"],
+                ["0", "1", "102", "", "M 818", "Allies", "['Ground', 'Vehicle']"]
+                + ["ru", "0", "0", "", "2", "0.0", "3.0", "[]", ""]
+                + metrics
+                + ["0"],
+                ["0", "2", "a01", "", "M61_20_HE", "Enemies"]
+                + ["['Weapon', 'Projectile', 'Shell']"]
+                + ["", "0", "1", "", "", "1.0", "3.0", "", ""]
+                + metrics
+                + ["0"],
+            ],
+        )
+        for object_row in objects_rows:
+            self.assertEqual(len(object_row), len(objects_csv_header))
+        # shells are excluded from user outputs, the victim shows the shell's name
+        self.assertEqual(
+            output_rows,
+            [
+                ["0", "0", "Gun", "F-16C_50", "Enemies", "['Air', 'FixedWing']"]
+                + ["0", "0", "", "", "0.0", "4.5", "Shell Kill", "TEST_SHELL.txt.acmi"],
+                ["0", "1", "", "M 818", "Allies", "['Ground', 'Vehicle']"]
+                + ["0", "0", "", "M61_20_HE", "0.0", "3.0", "Shell Kill"]
+                + ["TEST_SHELL.txt.acmi"],
+            ],
+        )
+        for output_row in output_rows:
+            self.assertEqual(len(output_row), len(output_csv_header))
+
+
+if __name__ == "__main__":
+    unittest.main()
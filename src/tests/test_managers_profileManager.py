@@ -0,0 +1,62 @@
+import os
+import pstats
+import tempfile
+import tracemalloc
+import unittest
+from unittest.mock import patch
+from src.managers import profileManager
+from src.managers.profileManager import (
+    profile_read_files,
+    start_memory_profile,
+    log_memory_snapshot,
+)
+
+
+class TestProfileManager(unittest.TestCase):
+    def setUp(self):
+        self.test_file = (
+            os.getcwd() + "/src/tests/test_data/TEST_ZIP_TRIMMED.mod.zip.acmi"
+        )
+
+    def test_profile_read_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir, patch.object(
+            profileManager, "get_profile_dir", return_value=temp_dir
+        ):
+            files_data = profile_read_files([self.test_file], AuthorIsUser=True)
+            self.assertEqual(list(files_data), [0])
+            self.assertGreater(files_data[0].file_length, 0)
+            profile_files = os.listdir(temp_dir)
+            self.assertEqual(len(profile_files), 1)
+            self.assertTrue(profile_files[0].endswith(".pstats"))
+            stats = pstats.Stats(os.path.join(temp_dir, profile_files[0]))
+            profiled_functions = [function for _, _, function in stats.stats]
+            self.assertIn("process_file", profiled_functions)
+            self.assertIn("object_line", profiled_functions)
+
+    def test_log_memory_snapshot(self):
+        with self.assertRaises(ValueError):
+            log_memory_snapshot("not tracing")
+        with tempfile.TemporaryDirectory() as temp_dir, patch.object(
+            profileManager, "get_profile_dir", return_value=temp_dir
+        ):
+            start_memory_profile()
+            try:
+                files_data = profile_read_files([self.test_file], AuthorIsUser=True)
+                log_memory_snapshot("parsed")
+            finally:
+                tracemalloc.stop()
+            snapshot_files = [
+                file for file in os.listdir(temp_dir) if file.endswith(".tracemalloc")
+            ]
+            self.assertEqual(len(snapshot_files), 1)
+            self.assertIn("parsed", snapshot_files[0])
+            snapshot = tracemalloc.Snapshot.load(
+                os.path.join(temp_dir, snapshot_files[0])
+            )
+            allocation_files = {
+                os.path.basename(statistic.traceback[0].filename)
+                for statistic in snapshot.statistics("filename")
+            }
+            # objects (still held by files_data) are allocated by FileData.new_obj / DCSObject.__init__
+            self.assertIn("DCSObject.py", allocation_files)
+            self.assertGreater(len(files_data[0].all_objects), 0)
@@ -0,0 +1,249 @@
+import random
+from array import array
+import unittest
+from math import isnan
+import numpy as np
+from src.classes.FileData import FileData
+from src.classes.TrackStore import TrackStore
+from src.data.coordReferences import track_fields
+from src.managers.fileManager import process_file
+from src.utils.analyticsUtils import (
+    get_munition_metrics,
+    get_stacked_points_at,
+    stack_tracks,
+)
+from src.utils.coordUtils import coords_to_haversine_distance_updated
+
+
+def get_distance(point1: list, point2: list) -> float:
+    """Returns haversine distance (m) between relative points [lat, long, alt] (references of setUp lines)."""
+    return coords_to_haversine_distance_updated(
+        [point1[0] + 25, point1[1] + 50, point1[2]],
+        [point2[0] + 25, point2[1] + 50, point2[2]],
+        "m",
+    )
+
+
+class TestAnalyticsUtils(unittest.TestCase):
+    def setUp(self):
+        # launcher 101 fires 103 (kills target 102) and 104 (misses)
+        # launcher 201 fires 106 (near miss of 105) and 107 (hits 105, without a kill)
+        self.lines = [
+            "FileType=text/acmi/tacview\n",
+            "FileVersion=2.1\n",
+            "0,ReferenceLongitude=50\n",
+            "0,ReferenceLatitude=25\n",
+            "#0\n",
+            "101,T=0|0|1000,Type=Air+FixedWing,Name=F-16C_50,Coalition=Enemies\n",
+            "102,T=0|0.1|2000,Type=Air+FixedWing,Name=MiG-29A,Coalition=Allies\n",
+            "105,T=0.5|0.5|5000,Type=Air+FixedWing,Name=MiG-29A,Coalition=Allies\n",
+            "201,T=0.5|0.4|5000,Type=Air+FixedWing,Name=F-16C_50,Coalition=Enemies\n",
+            "#1\n",
+            "106,T=0.5|0.4001|5000,Type=Weapon+Missile,Name=AIM_120C,Coalition=Enemies\n",
+            "107,T=0.5|0.4001|5000,Type=Weapon+Missile,Name=AIM_120C,Coalition=Enemies\n",
+            "101,T=0|0.001|1000\n",
+            "103,T=0|0.001|1000,Type=Weapon+Missile,Name=AIM_120C,Coalition=Enemies\n",
+            "104,T=0|0.001|1000,Type=Weapon+Missile,Name=AIM_120C,Coalition=Enemies\n",
+            "#2\n",
+            "101,T=0|0.002|1000\n",
+            "103,T=0|0.05|1500\n",
+            "104,T=0.05|0.01|1000\n",
+            "106,T=0.501|0.5|5000\n",
+            "107,T=0.5001|0.5|5000\n",
+            "#3\n",
+            "101,T=0|0.003|1000\n",
+            "103,T=0|0.1|2000\n",
+            "104,T=0.05|0.02|1000\n",
+            "106,T=0.501|0.6|5000\n",
+            "107,T=0.5001|0.55|5000\n",
+            "-104\n",
+            "-106\n",
+            "-107\n",
+            "#4\n",
+            "-103\n",
+            "-102\n",
+            "#5\n",
+        ]
+
+    def get_file_data(self, track_types: list = None) -> FileData:
+        file_data = FileData()
+        file_data.file_name = "TEST_MUNITIONS.txt.acmi"
+        file_data.track_store = TrackStore(track_types, 1) if track_types else None
+        process_file(file_data, iter(self.lines), AuthorIsUser=True)
+        return file_data
+
+    def test_get_munition_metrics(self):
+        file_data = self.get_file_data(["Air", "Missile"])
+        launcher = file_data.get_obj_by_id("101")
+        target = file_data.get_obj_by_id("102")
+        hit = file_data.get_obj_by_id("103")
+        miss = file_data.get_obj_by_id("104")
+        self.assertIs(hit.launcher, launcher)
+        self.assertIs(target.killer_weapon, hit)
+        self.assertIsNone(miss.kills.get(miss))
+        metrics = get_munition_metrics(file_data)
+        # munitions only
+        near_miss = file_data.get_obj_by_id("106")
+        hit_no_kill = file_data.get_obj_by_id("107")
+        self.assertEqual(
+            sorted(metrics),
+            sorted(obj.uid for obj in [hit, miss, near_miss, hit_no_kill]),
+        )
+        launch_speed = get_distance([0, 0, 1000], [0.001, 0, 1000])
+        segment_speeds = [
+            get_distance([0.001, 0, 1000], [0.05, 0, 1500]),
+            get_distance([0.05, 0, 1500], [0.1, 0, 2000]),
+        ]
+        expected = [
+            3,
+            1000,
+            launch_speed,
+            max(segment_speeds),
+            segment_speeds[-1],
+            get_distance([0.001, 0, 1000], [0.1, 0, 2000]),
+            0,
+            target.uid,
+            0,
+            3,
+            "Kill",
+        ]
+        self.assertEqual(len(metrics[hit.uid]), len(expected))
+        for value, expected_value in zip(metrics[hit.uid], expected):
+            self.assertAlmostEqual(value, expected_value, 6)
+        # missed munition's target is the candidate it came closest to
+        segment_speeds = [
+            get_distance([0.001, 0, 1000], [0.01, 0.05, 1000]),
+            get_distance([0.01, 0.05, 1000], [0.02, 0.05, 1000]),
+        ]
+        approaches = [
+            get_distance(point, [0.1, 0, 2000])
+            for point in [[0.001, 0, 1000], [0.01, 0.05, 1000], [0.02, 0.05, 1000]]
+        ]
+        expected = [
+            2,
+            1000,
+            launch_speed,
+            max(segment_speeds),
+            segment_speeds[-1],
+            get_distance([0.001, 0, 1000], [0.1, 0, 2000]),
+            get_distance([0.02, 0.05, 1000], [0.1, 0, 2000]),
+            target.uid,
+            min(approaches),
+            approaches.index(min(approaches)) + 1,
+            "Miss",
+        ]
+        for value, expected_value in zip(metrics[miss.uid], expected):
+            self.assertAlmostEqual(value, expected_value, 6)
+        # 102 is too far away to be a candidate, 201 is the launcher (and same coalition)
+        intended_target = file_data.get_obj_by_id("105")
+        for munition, long, outcome in [
+            (near_miss, 0.501, "Near Miss"),
+            (hit_no_kill, 0.5001, "Hit"),
+        ]:
+            self.assertEqual(metrics[munition.uid][7], intended_target.uid)
+            # closest just before the sample at 2 (approaching the target from the side)
+            sample_distance = get_distance([0.5, long, 5000], [0.5, 0.5, 5000])
+            self.assertLessEqual(metrics[munition.uid][8], sample_distance)
+            self.assertGreater(metrics[munition.uid][8], sample_distance * 0.99)
+            self.assertAlmostEqual(metrics[munition.uid][9], 2, 3)
+            self.assertLessEqual(metrics[munition.uid][9], 2)
+            self.assertEqual(metrics[munition.uid][10], outcome)
+            self.assertIsNone(intended_target.killer_weapon)
+
+        # untracked target only has a death position (range at launch, closest approach unknown)
+        file_data = self.get_file_data(["Missile"])
+        metrics = get_munition_metrics(file_data)
+        target = file_data.get_obj_by_id("102")
+        hit = file_data.get_obj_by_id("103")
+        miss = file_data.get_obj_by_id("104")
+        self.assertEqual(metrics[hit.uid][2], None)
+        self.assertEqual(
+            metrics[hit.uid][5:], [None, 0, target.uid, None, None, "Kill"]
+        )
+        self.assertEqual(metrics[miss.uid][5:], [None, None, None, None, None, "Miss"])
+        # without tracks, only time of flight, kills and misses are known
+        file_data = self.get_file_data()
+        metrics = get_munition_metrics(file_data)
+        hit = file_data.get_obj_by_id("103")
+        miss = file_data.get_obj_by_id("104")
+        self.assertEqual(
+            metrics[hit.uid], [3] + [None] * 6 + [target.uid, None, None, "Kill"]
+        )
+        self.assertEqual(metrics[miss.uid], [2] + [None] * 9 + ["Miss"])
+
+    def test_get_closest_approaches(self):
+        # 302 flies past 301 between its samples at 1 and 2 (passing 0.0005 degrees of latitude away, at 1.5)
+        self.lines = [
+            "FileType=text/acmi/tacview\n",
+            "FileVersion=2.1\n",
+            "0,ReferenceLongitude=50\n",
+            "0,ReferenceLatitude=25\n",
+            "#0\n",
+            "301,T=0.5|0.5005|5000,Type=Air+FixedWing,Name=MiG-29A,Coalition=Allies\n",
+            "#1\n",
+            "302,T=0.49|0.5|5000,Type=Weapon+Missile,Name=AIM_120C,Coalition=Enemies\n",
+            "#2\n",
+            "302,T=0.51|0.5|5000\n",
+            "#3\n",
+            "302,T=0.53|0.5|5000\n",
+            "-302\n",
+            "#4\n",
+        ]
+        file_data = self.get_file_data(["Air", "Missile"])
+        target = file_data.get_obj_by_id("301")
+        munition = file_data.get_obj_by_id("302", "Dying")
+        metrics = get_munition_metrics(file_data)[munition.uid]
+        sample_distances = [
+            get_distance([0.5, long, 5000], [0.5005, 0.5, 5000])
+            for long in [0.49, 0.51, 0.53]
+        ]
+        closest_approach = get_distance([0.5, 0.5, 5000], [0.5005, 0.5, 5000])
+        self.assertGreater(min(sample_distances), 900)
+        self.assertEqual(metrics[7], target.uid)
+        self.assertAlmostEqual(metrics[8], closest_approach, 3)
+        self.assertAlmostEqual(metrics[9], 1.5, 6)
+        self.assertEqual(metrics[10], "Near Miss")
+
+    def test_get_stacked_points_at(self):
+        file_data = self.get_file_data(["Air", "Missile"])
+        track_store = file_data.track_store
+        rng = random.Random(0)
+        for uid in range(10, 20):
+            # random sample times, some repeated
+            times = sorted(rng.choice([0, 0.5, 1, 2, 2, 3.5, 4]) for _ in range(5))
+            track_store.tracks[uid] = [array("d", times)] + [
+                array("d", [rng.uniform(0, 1) for _ in times]) for _ in track_fields[1:]
+            ]
+        objs = [file_data.get_obj_by_id(id) for id in ["101", "102", "103", "104"]]
+        for uid in range(10, 20):
+            objs.append(file_data.new_obj(f"{uid}"))
+            objs[-1].uid = uid
+        stacked = stack_tracks(track_store, objs, 25, 50)
+        times = [-1, 0, 0.25, 1, 1.5, 2, 3, 3.75, 4, 4.5, 5, 6]
+        # many times at once (of some rows) matches one time at a time
+        rows = np.array([1, 4, 5, 13])
+        all_points = get_stacked_points_at(stacked, times, rows)
+        self.assertEqual(all_points.shape, (len(rows), len(times), 3))
+        for index, time in enumerate(times):
+            np.testing.assert_array_equal(
+                all_points[:, index], get_stacked_points_at(stacked, time)[rows]
+            )
+        for time in times:
+            points = get_stacked_points_at(stacked, time)
+            for obj, point in zip(objs, points):
+                expected = track_store.get_sample_at(
+                    obj.uid, time, end_time=obj.get_end_time_stamp()
+                )
+                if expected is None:
+                    self.assertTrue(all(isnan(value) for value in point))
+                    continue
+                for value, expected_value in zip(
+                    point, [expected[0] + 25, expected[1] + 50, expected[2]]
+                ):
+                    self.assertAlmostEqual(
+                        value, expected_value, 9, f"{obj.uid=} {time=}"
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
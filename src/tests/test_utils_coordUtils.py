@@ -1,7 +1,23 @@
+import random
 import unittest
+from math import isnan
+from src.classes.FileData import FileData
+from src.data.valueReferences import closest_obj_alt_division
 from src.utils.coordUtils import (
+    coords_to_distance,
     coords_to_euclidean_distance,
     coords_to_haversine_distance,
+    coords_to_haversine_distance_matrix,
+    coords_to_haversine_distance_updated,
+    coords_to_haversine_distances,
+    get_closest_index,
+    get_closest_obj,
+    get_closest_obj_distances,
+    get_closest_obj_in_grid,
+    objs_to_distance,
+    objs_to_distances,
+    positions_to_distance_matrix,
+    positions_to_distances,
 )
 
 
@@ -88,6 +104,131 @@ class TestCoordUtils(unittest.TestCase):
                     allowed_TV_nm_delta,
                 )
 
+    def test_get_closest_obj_in_grid(self):
+        rng = random.Random(0)
+        file_data = FileData()
+        max_dist = 0.01
+        for index in range(300):
+            obj = file_data.new_obj(str(index))
+            # rounded, so some objects are equidistant (ties)
+            obj.update_transform(
+                str(round(rng.uniform(0, 0.2), 3)),
+                str(round(rng.uniform(-0.1, 0.1), 3)),
+                str(rng.choice([0, 5_000])),
+            )
+        for obj in list(file_data.objects.values()):
+            closest_obj, dist = get_closest_obj(obj, list(file_data.objects.values()))
+            grid_obj, grid_dist = get_closest_obj_in_grid(
+                obj, file_data.object_grid, max_dist
+            )
+            if dist <= max_dist:
+                self.assertIs(grid_obj, closest_obj)
+                self.assertEqual(grid_dist, dist)
+            else:
+                self.assertEqual([grid_obj, grid_dist], [None, None])
+        obj.update_to_dying()
+        with self.assertRaises(ValueError):
+            get_closest_obj_in_grid(obj, file_data.object_grid, max_dist)
+
+    def test_get_closest_obj(self):
+        rng = random.Random(1)
+        file_data = FileData()
+        for index in range(200):
+            obj = file_data.new_obj(str(index))
+            # rounded, so some objects are equidistant (ties)
+            obj.update_transform(
+                str(round(rng.uniform(0, 0.1), 2)),
+                str(round(rng.uniform(0, 0.1), 2)),
+                str(rng.choice([0, 5_000])),
+            )
+        objs = list(file_data.objects.values())
+        for obj in objs[::3]:
+            obj.update_to_dying()
+        for obj in objs:
+            # reference linear scan (first closest is kept)
+            pos = obj.get_pos() if obj.check_is_alive() else obj.get_death_pos()
+            closest_obj = closest_dist = None
+            for other in objs:
+                if other is obj:
+                    continue
+                other_pos = (
+                    other.get_pos() if other.check_is_alive() else other.get_death_pos()
+                )
+                dist = (
+                    abs(pos[0] - other_pos[0])
+                    + abs(pos[1] - other_pos[1])
+                    + abs(pos[2] - other_pos[2]) / closest_obj_alt_division
+                )
+                if closest_dist is None or dist < closest_dist:
+                    closest_obj, closest_dist = other, dist
+            self.assertEqual(get_closest_obj(obj, objs), (closest_obj, closest_dist))
+
+    def test_get_closest_index(self):
+        nan = float("nan")
+        self.assertIsNone(get_closest_index(get_closest_obj_distances([0, 0, 0], [])))
+        dists = get_closest_obj_distances(
+            [0, 0, 0], [[nan, 0, 0], [0.2, 0, 0], [0.1, 0, 0], [0, 0.1, 0]]
+        )
+        self.assertTrue(isnan(dists[0]))
+        self.assertEqual(list(dists[1:]), [0.2, 0.1, 0.1])
+        self.assertEqual(get_closest_index(dists), 2)
+        self.assertEqual(get_closest_index(dists, ranks=[0, 1, 3, 2]), 3)
+        self.assertEqual(get_closest_index(dists, 0.1), 2)
+        self.assertIsNone(get_closest_index(dists, 0.05))
+        # unset (None) values are NaN, so never closest
+        dists = get_closest_obj_distances([0, 0, None], [[0, 0, 1]])
+        self.assertIsNone(get_closest_index(dists))
+
+    def test_distance_kernels(self):
+        rng = random.Random(2)
+        points = [
+            [rng.uniform(40, 44), rng.uniform(34, 38), rng.uniform(0, 10_000)]
+            for _ in range(20)
+        ]
+        positions = [
+            [rng.uniform(-2e5, 2e5), rng.uniform(-2e5, 2e5), rng.uniform(0, 10_000)]
+            for _ in range(20)
+        ]
+        for unit in ["nm", "km", "mi", "m", "ft"]:
+            for kernel_dist, dist in zip(
+                positions_to_distances(positions[0], positions, unit),
+                [coords_to_distance(positions[0], p, unit) for p in positions],
+            ):
+                self.assertAlmostEqual(kernel_dist, dist, delta=dist * 1e-12)
+            for kernel_dist, dist in zip(
+                coords_to_haversine_distances(points[0], points, unit),
+                [
+                    coords_to_haversine_distance_updated(points[0], p, unit)
+                    for p in points
+                ],
+            ):
+                self.assertAlmostEqual(kernel_dist, dist, delta=dist * 1e-12)
+        matrix = positions_to_distance_matrix(positions[:5], positions, "m")
+        self.assertEqual(matrix.shape, (5, 20))
+        for row, position in enumerate(positions[:5]):
+            self.assertEqual(
+                list(matrix[row]),
+                list(positions_to_distances(position, positions, "m")),
+            )
+        matrix = coords_to_haversine_distance_matrix(points, points[:3], "km")
+        self.assertEqual(matrix.shape, (20, 3))
+        self.assertEqual(list(matrix.diagonal()), [0, 0, 0])
+        self.assertEqual(
+            list(matrix[:, 1]),
+            list(coords_to_haversine_distances(points[1], points, "km")),
+        )
+        with self.assertRaises(ValueError):
+            positions_to_distances(positions[0], positions, "induce_error")
+        file_data = FileData()
+        objs = []
+        for index, (u, v, alt) in enumerate(positions[:4]):
+            objs.append(file_data.new_obj(str(index)))
+            objs[-1].update_transform_fields(["1", "1", str(alt), str(u), str(v)])
+        self.assertEqual(
+            list(objs_to_distances(objs[0], objs, "m")),
+            [objs_to_distance(objs[0], obj, "m") for obj in objs],
+        )
+
     def test_coords_to_haversine_distance(self):
         pass
 
@@ -0,0 +1,52 @@
+import unittest
+import os
+from src.utils.fileUtils import attr_split
+from src.utils.tokenUtils import split_attrs
+from src.managers.fileManager import read_file_lines, is_zip
+
+
+class TestTokenUtils(unittest.TestCase):
+    def setUp(self):
+        self.test_data_dir = os.getcwd() + "/src/tests/test_data"
+
+    def test_split_attrs(self):
+        self.assertEqual(
+            split_attrs(
+                "104,T=5.0748323|3.9184389|9737.43,Type=Air+FixedWing,Pilot=Spirit 1-1 \\, Zen,Group=BVR F-16C"
+            ),
+            [
+                "104",
+                "T=5.0748323|3.9184389|9737.43",
+                "Type=Air+FixedWing",
+                "Pilot=Spirit 1-1 \\, Zen",
+                "Group=BVR F-16C",
+            ],
+        )
+        # matches attr_split, including edge cases
+        for line in [
+            "40000001,T=15.4498618|11.1275818|2000,Color=Grey",
+            "1,Pilot=\\,,Name=\\,\\,",
+            "1,Name=a\\\\,b",
+            "1,,Name=",
+            "1,Name=a,",
+            "\\,1,Name=a",
+            ",1,Name=a",
+            ",",
+        ]:
+            self.assertEqual(split_attrs(line), attr_split(line), msg=line)
+        with self.assertRaises(IndexError):
+            split_attrs("")
+
+    def test_split_attrs_corpus(self):
+        # every line of every test file is split the same as attr_split
+        escaped_lines = 0
+        for file_name in sorted(os.listdir(self.test_data_dir)):
+            file = f"{self.test_data_dir}/{file_name}"
+            for line in read_file_lines(file, is_zip(file)):
+                line = line.rstrip("\n")
+                if not line:
+                    continue
+                escaped_lines += "\\," in line
+                self.assertEqual(split_attrs(line), attr_split(line), msg=line)
+        # corpus includes lines with escaped commas
+        self.assertGreater(escaped_lines, 0)
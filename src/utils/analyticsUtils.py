@@ -0,0 +1,436 @@
+from src.managers.logHandler import logger
+import numpy as np
+from src.data.typeReferences import munition_types_mask
+from src.data.valueReferences import (
+    hit_distance,
+    max_approach_distance,
+    near_miss_distance,
+)
+from src.utils.coordUtils import haversine_distances
+from src.utils.outputUtils import munition_metrics_header
+from src.utils.processingUtils import check_is_type
+
+
+def get_munition_metrics(file_data, objs: list = None) -> dict:
+    """Returns {uid: [munition_metrics_header values]} of each munition (munition_types) in objs (default: all objects of file_data).\n
+    Time of flight, a kill's target and the outcome (Kill or Miss) only need spawn/death time stamps, the rest need tracks (config TRACKS) of the munition (and its launcher/target), otherwise are None.\n
+    Target is the victim, or the likely intended target (closest approach of the candidates of get_closest_approaches). Outcome is Kill, or for a munition that died without a kill, Hit (closest approach within hit_distance), Near Miss (within near_miss_distance), or Miss (always Miss without tracks).\n
+    Distances are meters (haversine, including altitude), speeds are meters per second between track samples.\n
+    Tracked munitions (and launchers) are stacked (see stack_tracks), so launch/end points, segment speeds and launch ranges are found for all munitions at once.
+    """
+    track_store = file_data.track_store
+    munitions = [
+        obj
+        for obj in (file_data.get_all_objs() if objs is None else objs)
+        if check_is_type(obj, munition_types_mask)
+    ]
+    # munition_metrics_header field:[value of each munition]
+    metrics = {field: [None] * len(munitions) for field in munition_metrics_header}
+    for index, munition in enumerate(munitions):
+        if munition.death_time_stamp is not None:
+            metrics["timeOfFlight"][index] = (
+                munition.death_time_stamp - munition.spawn_time_stamp
+            )
+        victim = munition.kills.get(munition)
+        if victim is not None:
+            metrics["target"][index] = victim.uid
+            metrics["outcome"][index] = "Kill"
+        elif munition.death_time_stamp is not None:
+            # refined to Hit / Near Miss from the closest approach if tracked
+            metrics["outcome"][index] = "Miss"
+    tracked = [
+        index
+        for index, munition in enumerate(munitions)
+        if check_has_track(track_store, munition)
+    ]
+    if tracked:
+        add_track_metrics(
+            metrics, file_data, [munitions[index] for index in tracked], tracked
+        )
+    logger.debug(
+        f"Munition metrics: {len(munitions)} munitions, {len(tracked)} tracked {file_data.file_name}"
+    )
+    return {
+        munition.uid: [metrics[field][index] for field in munition_metrics_header]
+        for index, munition in enumerate(munitions)
+    }
+
+
+def add_track_metrics(metrics: dict, file_data, munitions: list, indices: list):
+    """Adds the track metrics of tracked munitions (at indices of metrics' values) to metrics (see get_munition_metrics)."""
+    track_store = file_data.track_store
+    lat_ref, long_ref = get_reference(file_data)
+    # possible targets of missed munitions (tracked, not munitions)
+    targets = [
+        obj
+        for obj in file_data.get_all_objs()
+        if check_has_track(track_store, obj)
+        and not check_is_type(obj, munition_types_mask)
+    ]
+    stacked_targets = (
+        stack_tracks(track_store, targets, lat_ref, long_ref) if targets else None
+    )
+    target_rows = {obj.uid: row for row, obj in enumerate(targets)}
+    stacked = stack_tracks(track_store, munitions, lat_ref, long_ref)
+    spawn_times = np.array([obj.spawn_time_stamp for obj in munitions], dtype=float)
+    end_times = stacked["end_times"]
+    launch_points = get_stacked_points_each(stacked, spawn_times)
+    end_points = get_stacked_points_each(stacked, end_times)
+
+    segments = get_segment_speeds(stacked)
+    has_segments = segments["count"] > 0
+    peak_speeds = np.full(len(munitions), np.nan)
+    terminal_speeds = np.full(len(munitions), np.nan)
+    if has_segments.any():
+        first = segments["first"][has_segments]
+        peak_speeds[has_segments] = np.maximum.reduceat(segments["speeds"], first)
+        terminal_speeds[has_segments] = segments["speeds"][
+            first + segments["count"][has_segments] - 1
+        ]
+    launch_speeds = get_launch_speeds(track_store, munitions, lat_ref, long_ref)
+
+    # targets (victim or closest approach) and their points at launch/end of flight
+    target_points = np.full((2, len(munitions), 3), np.nan)
+    tracked_targets = []  # (munition row, stacked_targets row) of tracked targets
+    has_target = np.zeros(len(munitions), dtype=bool)
+    for row, (index, munition) in enumerate(zip(indices, munitions)):
+        launch_altitude = launch_points[row, 2]
+        if not np.isnan(launch_altitude):
+            metrics["launchAltitude"][index] = float(launch_altitude)
+        metrics["launchSpeed"][index] = launch_speeds[row]
+        if has_segments[row]:
+            metrics["peakSpeed"][index] = float(peak_speeds[row])
+            metrics["terminalSpeed"][index] = float(terminal_speeds[row])
+        victim = munition.kills.get(munition)
+        approach_rows, approach_distances, approach_times = get_closest_approaches(
+            stacked_targets, munition, track_store, lat_ref, long_ref
+        )
+        target = victim
+        if len(approach_rows):
+            if target is None:
+                # likely intended target
+                closest = approach_distances.argmin()
+            else:
+                closest = np.flatnonzero(
+                    stacked_targets["uids"][approach_rows] == target.uid
+                )
+                closest = closest[0] if len(closest) else None
+            if closest is not None and approach_distances[closest] < np.inf:
+                target = stacked_targets["objs"][approach_rows[closest]]
+                metrics["closestApproach"][index] = float(approach_distances[closest])
+                metrics["closestApproachTime"][index] = float(approach_times[closest])
+        if target is None:
+            continue
+        has_target[row] = True
+        metrics["target"][index] = target.uid
+        if victim is None and munition.death_time_stamp is not None:
+            closest_approach = metrics["closestApproach"][index]
+            metrics["outcome"][index] = (
+                "Hit"
+                if closest_approach <= hit_distance
+                else "Near Miss"
+                if closest_approach <= near_miss_distance
+                else "Miss"
+            )
+        if target.uid in target_rows:
+            tracked_targets.append((row, target_rows[target.uid]))
+        else:
+            # untracked victims (e.g.: ground units) only have a death position
+            target_points[1, row] = to_real_points(
+                target.get_death_pos() or [np.nan] * 3, lat_ref, long_ref
+            )[0]
+    if tracked_targets:
+        rows, stacked_rows = np.array(tracked_targets).T
+        target_points[0, rows] = get_stacked_points_each(
+            stacked_targets, spawn_times[rows], stacked_rows
+        )
+        target_points[1, rows] = get_stacked_points_each(
+            stacked_targets, end_times[rows], stacked_rows
+        )
+    distances = haversine_distances(
+        np.stack([launch_points, end_points]), target_points, "m"
+    )
+    for row in np.flatnonzero(has_target):
+        index = indices[row]
+        metrics["launchRange"][index], metrics["missDistance"][index] = [
+            None if np.isnan(distance) else float(distance)
+            for distance in distances[:, row]
+        ]
+
+
+def check_has_track(track_store, obj) -> bool:
+    """Returns True if obj has a track with samples (False if tracks are not enabled)."""
+    if track_store is None:
+        return False
+    track = track_store.tracks.get(obj.uid)
+    return track is not None and len(track[0]) > 0
+
+
+def get_reference(file_data) -> tuple[float, float]:
+    """Returns lat/long references of file_data as floats (0, 0 if not set, i.e.: coordinates are absolute)."""
+    try:
+        lat_ref, long_ref = file_data.get_coord_reference()
+    except (ValueError, TypeError):
+        return 0.0, 0.0
+    return float(lat_ref), float(long_ref)
+
+
+def to_real_points(points: list, lat_ref: float, long_ref: float) -> np.ndarray:
+    """Returns array (n x 3) of points [lat, long, alt] with the lat/long references added (None values are NaN)."""
+    points = np.array(points, dtype=np.float64).reshape(-1, 3)
+    points[:, 0] += lat_ref
+    points[:, 1] += long_ref
+    return points
+
+
+def get_stacked_points_each(
+    stacked: dict, times: np.ndarray, rows: np.ndarray = None
+) -> np.ndarray:
+    """Returns array (rows x 3) of each stacked track's (rows, default: all) real [lat, long, alt] at its own time (times, one per row), NaN if unknown (see get_stacked_points_at)."""
+    if rows is None:
+        rows = np.arange(len(stacked["objs"]))
+    times = np.asarray(times, dtype=np.float64)[:, np.newaxis]
+    return get_stacked_points_at(stacked, times, rows)[:, 0, :]
+
+
+def get_segment_speeds(stacked: dict) -> dict:
+    """Returns the end time and speed (meters per second) of each segment (pair of samples with time between) of every stacked track (see stack_tracks), in one pass.\n
+    Segments are grouped by track row: a row's segments are first to first + count (count is 0 if it has none).
+    """
+    times, points = stacked["times"], stacked["points"]
+    track_count = len(stacked["objs"])
+    sample_rows = np.repeat(
+        np.arange(track_count), stacked["last"] - stacked["first"] + 1
+    )
+    durations = np.diff(times)
+    # a track's last sample and the next track's first sample are not a segment
+    segments = (durations > 0) & (sample_rows[1:] == sample_rows[:-1])
+    distances = haversine_distances(points[:-1][segments], points[1:][segments], "m")
+    segment_rows = sample_rows[:-1][segments]
+    count = np.bincount(segment_rows, minlength=track_count)
+    return {
+        "rows": segment_rows,
+        "end_times": times[1:][segments],
+        "speeds": distances / durations[segments],
+        "first": np.cumsum(count) - count,
+        "count": count,
+    }
+
+
+def get_launch_speeds(
+    track_store, munitions: list, lat_ref: float, long_ref: float
+) -> list:
+    """Returns each munition's launcher speed at launch: the speed of the launcher's segment ending at or after launch (the last segment if after its track).\n
+    None if the launcher is unknown, untracked, or has no segments. Launcher segments are found with one stacked searchsorted.
+    """
+    launch_speeds = [None] * len(munitions)
+    launchers = {
+        munition.launcher.uid: munition.launcher
+        for munition in munitions
+        if munition.launcher is not None
+        and check_has_track(track_store, munition.launcher)
+    }
+    if not launchers:
+        return launch_speeds
+    stacked = stack_tracks(track_store, list(launchers.values()), lat_ref, long_ref)
+    segments = get_segment_speeds(stacked)
+    launcher_rows = {uid: row for row, uid in enumerate(launchers)}
+    launched = [
+        (index, launcher_rows[munition.launcher.uid], munition.spawn_time_stamp)
+        for index, munition in enumerate(munitions)
+        if munition.launcher is not None
+        and munition.launcher.uid in launcher_rows
+        and segments["count"][launcher_rows[munition.launcher.uid]]
+    ]
+    if not launched:
+        return launch_speeds
+    indices, rows, spawn_times = (np.array(values) for values in zip(*launched))
+    rows = rows.astype(int)
+    # segment end times offset by row * span (as stack_tracks), so every launcher's segments are searched at once
+    keys = segments["rows"] * stacked["span"] + (
+        segments["end_times"] - stacked["start_time"]
+    )
+    first = segments["first"][rows]
+    segment_indices = np.clip(
+        np.searchsorted(
+            keys, rows * stacked["span"] + (spawn_times - stacked["start_time"])
+        ),
+        first,
+        first + segments["count"][rows] - 1,
+    )
+    for index, speed in zip(indices, segments["speeds"][segment_indices]):
+        launch_speeds[index] = float(speed)
+    return launch_speeds
+
+
+def get_closest_approaches(
+    stacked_targets: dict, munition, track_store, lat_ref: float, long_ref: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns (rows, distances, times) of munition's closest approach (meters) to each candidate of stacked_targets.\n
+    Candidates are alive during munition's flight, not its launcher, of another coalition (if known), and have a track bounding box within max_approach_distance of munition's track.\n
+    The closest approach is the closest of munition's track samples, and of the closest point of approach within each segment between samples (see get_segment_approach_times),
+    so a target passed between samples is found. Candidates are compared with one (candidates x samples) distance array, rather than per pair.
+    """
+    track = track_store.get_track(munition.uid)
+    times = np.asarray(track["time"])
+    points = to_real_points(
+        np.column_stack([track["lat"], track["long"], track["alt"]]), lat_ref, long_ref
+    )
+    known = ~np.isnan(points).any(axis=1)
+    times, points = times[known], points[known]
+    if stacked_targets is None or not len(times):
+        return np.array([], dtype=int), np.array([]), np.array([])
+    # lat/long degrees covering max_approach_distance (long degrees are shortest at the highest latitude)
+    margin = max_approach_distance / (
+        111_320 * max(np.cos(np.radians(np.abs(points[:, 0]).max())), 0.01)
+    )
+    candidates = (
+        (stacked_targets["start_times"] <= munition.get_end_time_stamp())
+        & (stacked_targets["end_times"] >= times[0])
+        & (
+            stacked_targets["uids"]
+            != (munition.launcher.uid if munition.launcher else -1)
+        )
+        & (stacked_targets["min_points"] <= points[:, :2].max(axis=0) + margin).all(
+            axis=1
+        )
+        & (stacked_targets["max_points"] >= points[:, :2].min(axis=0) - margin).all(
+            axis=1
+        )
+    )
+    if munition.coalition is not None:
+        candidates &= stacked_targets["coalitions"] != munition.coalition
+    rows = np.flatnonzero(candidates)
+    if not len(rows):
+        return rows, np.array([]), np.array([])
+    target_points = get_stacked_points_at(stacked_targets, times, rows)
+    # samples and segments interleaved in time order (ties go to the earliest)
+    distances = np.empty((len(rows), 2 * len(times) - 1))
+    approach_times = np.empty(distances.shape)
+    distances[:, 0::2] = haversine_distances(
+        points[np.newaxis, :, :], target_points, "m"
+    )
+    approach_times[:, 0::2] = times
+    if len(times) > 1:
+        segment_times = get_segment_approach_times(times, points, target_points)
+        segment_ratios = np.divide(
+            segment_times - times[:-1],
+            np.diff(times),
+            out=np.zeros(segment_times.shape),
+            where=np.diff(times) > 0,
+        )[..., np.newaxis]
+        # munition samples are its segments' ends, so the munition moves linearly between them
+        segment_points = points[:-1] + (points[1:] - points[:-1]) * segment_ratios
+        distances[:, 1::2] = haversine_distances(
+            segment_points,
+            get_stacked_points_at(stacked_targets, segment_times, rows),
+            "m",
+        )
+        approach_times[:, 1::2] = segment_times
+    distances[np.isnan(distances)] = np.inf
+    closest = distances.argmin(axis=1)
+    closest_rows = np.arange(len(rows))
+    return (
+        rows,
+        distances[closest_rows, closest],
+        approach_times[closest_rows, closest],
+    )
+
+
+def get_segment_approach_times(
+    times: np.ndarray, points: np.ndarray, target_points: np.ndarray
+) -> np.ndarray:
+    """Returns array (targets x segments) of the time of closest approach within each segment (pair of consecutive samples) of a munition's track to each target.\n
+    points (samples x 3) are the munition's real [lat, long, alt] at times, target_points (targets x samples x 3) each target's at the same times.\n
+    Within a segment both move linearly, so the relative position is start + ratio * (end - start), and the closest point of approach is at ratio = -start.motion / |motion|^2,
+    clamped to [0, 1] (the segment's start/end if the closest point is outside it). Positions are local meters (degrees scaled at the segment's start latitude).\n
+    Segments with an unknown target position are at their start.
+    """
+    # meters per degree of lat, long (at each segment's start latitude), and alt
+    scale = np.ones((len(times) - 1, 3))
+    scale[:, :2] = 111_320
+    scale[:, 1] *= np.cos(np.radians(points[:-1, 0]))
+    start = (target_points[:, :-1] - points[:-1]) * scale
+    motion = (target_points[:, 1:] - points[1:]) * scale - start
+    motion_squared = (motion**2).sum(axis=-1)
+    ratios = np.divide(
+        -(start * motion).sum(axis=-1),
+        motion_squared,
+        out=np.zeros(motion_squared.shape),
+        where=motion_squared > 0,
+    )
+    ratios = np.clip(np.nan_to_num(ratios), 0, 1)
+    return times[:-1] + (times[1:] - times[:-1]) * ratios
+
+
+def stack_tracks(track_store, objs: list, lat_ref: float, long_ref: float) -> dict:
+    """Returns the tracks of objs (with the lat/long references added) stacked into single arrays, so the position of every obj at a time is found with one search (see get_stacked_points_at).\n
+    Each track's times are offset by its index * span (longer than any track), so the stacked search keys stay sorted.
+    """
+    tracks = [track_store.get_track(obj.uid) for obj in objs]
+    times = np.concatenate([track["time"] for track in tracks])
+    end_times = np.array([obj.get_end_time_stamp() for obj in objs], dtype=float)
+    start_time = times.min()
+    span = max(times.max(), end_times.max()) - start_time + 1
+    lengths = np.array([len(track["time"]) for track in tracks])
+    last = np.cumsum(lengths) - 1  # index of each track's last sample
+    points = to_real_points(
+        np.column_stack(
+            [
+                np.concatenate([track[field] for track in tracks])
+                for field in ["lat", "long", "alt"]
+            ]
+        ),
+        lat_ref,
+        long_ref,
+    )
+    return {
+        "objs": objs,
+        "uids": np.array([obj.uid for obj in objs]),
+        "coalitions": np.array([obj.coalition for obj in objs], dtype=object),
+        "end_times": end_times,
+        "times": times,
+        "keys": np.repeat(np.arange(len(objs)) * span, lengths) + (times - start_time),
+        "points": points,
+        "first": last - lengths + 1,  # index of each track's first sample
+        "last": last,
+        "start_times": times[last - lengths + 1],
+        # lat/long bounding box of each track (unknown samples ignored)
+        "min_points": np.fmin.reduceat(points[:, :2], last - lengths + 1),
+        "max_points": np.fmax.reduceat(points[:, :2], last - lengths + 1),
+        "start_time": start_time,
+        "span": span,
+    }
+
+
+def get_stacked_points_at(stacked: dict, times, rows: np.ndarray = None) -> np.ndarray:
+    """Returns each stacked track's (rows, default: all) real [lat, long, alt] at times, as TrackStore.get_sample_at (with the obj's end time), NaN if unknown.\n
+    times is a time (returns array rows x 3), or an array of times (returns array rows x len(times) x 3).
+    """
+    if rows is None:
+        rows = np.arange(len(stacked["objs"]))
+    query_times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+    # times after every track (and end time) are kept within each track's keys
+    query_keys = rows[:, np.newaxis] * stacked["span"] + np.minimum(
+        query_times - stacked["start_time"], stacked["span"] - 1
+    )
+    # index of each track's last sample at or before each time
+    before = np.searchsorted(stacked["keys"], query_keys, side="right") - 1
+    last = stacked["last"][rows, np.newaxis]
+    after = np.minimum(before + 1, last)
+    track_times, points = stacked["times"], stacked["points"]
+    known = (before >= stacked["first"][rows, np.newaxis]) & (
+        (before < last)
+        | (track_times[before] == query_times)
+        | (query_times <= stacked["end_times"][rows, np.newaxis])
+    )
+    durations = track_times[after] - track_times[before]
+    ratios = np.divide(
+        query_times - track_times[before],
+        durations,
+        out=np.zeros(durations.shape),
+        where=durations > 0,
+    )
+    result = points[before] + (points[after] - points[before]) * ratios[..., np.newaxis]
+    result[~known] = np.nan
+    return result if np.ndim(times) else result[:, 0, :]
@@ -13,6 +13,7 @@
 
 from src.managers.logHandler import logger
 from math import radians, cos, sin, asin, sqrt
+import numpy as np
 from src.classes.DCSObject import DCSObject
 from src.data.valueReferences import closest_obj_alt_division
 
@@ -28,8 +29,6 @@ def get_closest_obj(obj: DCSObject, other_objs: list) -> tuple[DCSObject, float]
     if len(other_objs) <= 1:
         logger.trace(f"len(other_objs) <= 1: {len(other_objs)=}")
         return None, None
-    closest_obj = None
-    closest_dist = None
     if obj.check_is_alive():
         obj_pos = obj.get_pos()
     elif obj.check_is_dying() or obj.check_is_dead():
@@ -38,6 +37,8 @@ def get_closest_obj(obj: DCSObject, other_objs: list) -> tuple[DCSObject, float]
         raise ValueError(
             f"closest_obj reference object is not alive/dying: {obj.id=} {obj.state=} {obj.name=} {obj.type=}"
         )
+    others = []
+    other_positions = []
     for other in other_objs:
         if other == obj:
             continue
@@ -48,24 +49,108 @@ def get_closest_obj(obj: DCSObject, other_objs: list) -> tuple[DCSObject, float]
         elif other.check_is_dead():
             continue
         if other.check_is_alive():
-            other_pos = other.get_pos()
+            other_positions.append(other.get_pos())
         elif other.check_is_dying():
-            other_pos = other.get_death_pos()
+            other_positions.append(other.get_death_pos())
         else:
             raise ValueError(
                 f"Invalid comparison object state: {other.id=} {other.state=} {other.name=} {other.type=}"
             )
-        current_dist_list = [
-            abs(obj_pos[0] - other_pos[0]),
-            abs(obj_pos[1] - other_pos[1]),
-            abs(obj_pos[2] - other_pos[2])
-            / closest_obj_alt_division,  # FUTUREDO find appropriate alt division value, OR change to euclidean/haversine
-        ]
-        avg_dist = sum(current_dist_list)
-        if closest_dist is None or avg_dist < closest_dist:
-            closest_obj = other
-            closest_dist = avg_dist
-    return closest_obj, closest_dist
+        others.append(other)
+    # FUTUREDO find appropriate alt division value, OR change to euclidean/haversine
+    dists = get_closest_obj_distances(obj_pos, other_positions)
+    index = get_closest_index(dists)
+    if index is None:
+        return None, None
+    return others[index], float(dists[index])
+
+
+def get_closest_obj_to_pos(pos: list, other_objs: list) -> tuple[DCSObject, float]:
+    """Returns the closest (dying) object of other_objs to pos [lat, long, alt] and its distance (same measure as get_closest_obj).\n
+    other_objs must be dying, as their death position is compared."""
+    dists = get_closest_obj_distances(pos, [o.get_death_pos() for o in other_objs])
+    index = get_closest_index(dists)
+    if index is None:
+        return None, None
+    return other_objs[index], float(dists[index])
+
+
+def get_closest_obj_in_grid(
+    obj: DCSObject, object_grid, max_dist: float
+) -> tuple[DCSObject, float]:
+    """Returns the closest other alive object to obj within max_dist (same measure as get_closest_obj) and its distance, searching only nearby object_grid cells.\n
+    Matches get_closest_obj (over FileData.objects) whenever its closest object is within max_dist - ties go to the lowest uid (i.e.: earliest in FileData.objects).\n
+    Returns None, None if no other object is within max_dist."""
+    if not obj.check_is_alive():
+        raise ValueError(
+            f"closest_obj_in_grid reference object is not alive: {obj.id=} {obj.state=} {obj.name=} {obj.type=}"
+        )
+    pos = obj.get_pos()
+    # get_nearby is sorted by uid, so the first closest object has the lowest uid
+    others = [
+        other
+        for other in object_grid.get_nearby(pos[0], pos[1], max_dist)
+        if other is not obj
+    ]
+    dists = get_closest_obj_distances(
+        pos, [[other.lat, other.long, other.alt] for other in others]
+    )
+    index = get_closest_index(dists, max_dist)
+    if index is None:
+        return None, None
+    return others[index], float(dists[index])
+
+
+def get_closest_dying_obj_in_grid(
+    pos: list, dying_grid, max_dist: float, exclude=None, order: dict = None
+) -> tuple[DCSObject, float]:
+    """Returns the closest (dying) object of dying_grid to pos [lat, long, alt] within max_dist and its distance (same measure as get_closest_obj).\n
+    dying_grid must index objects by death position, as their death position is compared. exclude (e.g.: the object at pos) is ignored.\n
+    Ties go to the lowest order[uid] (default: uid), so results can match get_closest_obj over a list in that order.\n
+    Returns None, None if no object is within max_dist."""
+    others = [
+        other
+        for other in dying_grid.get_nearby(pos[0], pos[1], max_dist)
+        if other is not exclude
+    ]
+    dists = get_closest_obj_distances(pos, [other.get_death_pos() for other in others])
+    ranks = [order[other.uid] if order else other.uid for other in others]
+    index = get_closest_index(dists, max_dist, ranks)
+    if index is None:
+        return None, None
+    return others[index], float(dists[index])
+
+
+def get_closest_obj_distances(pos: list, positions: list) -> np.ndarray:
+    """Returns the get_closest_obj distance (lat + long difference, plus alt difference / closest_obj_alt_division) from pos to each of positions.\n
+    pos is [lat, long, alt], positions is a list/array (n x 3) of [lat, long, alt]. Unset (None/NaN) values give NaN distances.
+    """
+    differences = np.abs(
+        np.array(positions, dtype=np.float64).reshape(-1, 3)
+        - np.array(pos, dtype=np.float64)
+    )
+    return (
+        differences[:, 0]
+        + differences[:, 1]
+        + differences[:, 2] / closest_obj_alt_division
+    )
+
+
+def get_closest_index(
+    dists: np.ndarray, max_dist: float = np.inf, ranks: list = None
+) -> int:
+    """Returns the index of the smallest of dists within max_dist (NaN is never closest), or None if there is none.\n
+    Ties go to the lowest of ranks (default: the first index), as with a linear scan keeping the first closest.
+    """
+    dists = np.where(dists <= max_dist, dists, np.inf)
+    index = int(dists.argmin()) if len(dists) else None
+    if index is None or dists[index] == np.inf:
+        return None
+    if ranks is not None:
+        closest = np.flatnonzero(dists == dists[index])
+        if len(closest) > 1:
+            index = int(closest[np.argmin(np.asarray(ranks)[closest])])
+    return index
 
 
 def coords_to_euclidean_distance(point1: list, point2: list, distance_unit="nm"):
@@ -256,7 +341,91 @@ def objs_to_distance(obj1, obj2, output_unit="nm"):
     return distance
 
 
+def positions_to_distances(
+    position: list, positions: list, output_unit="nm"
+) -> np.ndarray:
+    """One-to-many coords_to_distance: returns the distance from position [U, V, alt] to each of positions (n x 3) in output_unit."""
+    position = np.asarray(position, dtype=np.float64)
+    return uv_alt_distances(
+        position, np.asarray(positions, dtype=np.float64).reshape(-1, 3), output_unit
+    )
+
+
+def positions_to_distance_matrix(
+    positions1: list, positions2: list, output_unit="nm"
+) -> np.ndarray:
+    """Many-to-many coords_to_distance: returns the distance (n x m) between each of positions1 (n x 3 [U, V, alt]) and each of positions2 (m x 3) in output_unit."""
+    positions1 = np.asarray(positions1, dtype=np.float64).reshape(-1, 3)
+    positions2 = np.asarray(positions2, dtype=np.float64).reshape(-1, 3)
+    return uv_alt_distances(
+        positions1[:, np.newaxis, :], positions2[np.newaxis, :, :], output_unit
+    )
+
+
+def objs_to_distances(obj, other_objs: list, output_unit="nm") -> np.ndarray:
+    """One-to-many objs_to_distance: returns the distance from obj to each of other_objs (using U, V, alt) in output_unit."""
+    return positions_to_distances(
+        [obj.u, obj.v, obj.alt],
+        [[other.u, other.v, other.alt] for other in other_objs],
+        output_unit,
+    )
+
+
+def uv_alt_distances(
+    positions1: np.ndarray, positions2: np.ndarray, output_unit="nm"
+) -> np.ndarray:
+    """Returns the 3D euclidean distance between (broadcast) [U, V, alt] arrays positions1 and positions2 (last axis) in output_unit."""
+    difference = positions2 - positions1
+    meter_distance = np.sqrt(
+        difference[..., 0] ** 2 + difference[..., 1] ** 2 + difference[..., 2] ** 2
+    )
+    return meters_to_unit(meter_distance, output_unit)
+
+
+def coords_to_haversine_distances(
+    point: list, points: list, distance_unit="nm"
+) -> np.ndarray:
+    """One-to-many coords_to_haversine_distance_updated: returns the distance from point [lat, long, alt] to each of points (n x 3) in distance_unit."""
+    point = np.asarray(point, dtype=np.float64)
+    return haversine_distances(
+        point, np.asarray(points, dtype=np.float64).reshape(-1, 3), distance_unit
+    )
+
+
+def coords_to_haversine_distance_matrix(
+    points1: list, points2: list, distance_unit="nm"
+) -> np.ndarray:
+    """Many-to-many coords_to_haversine_distance_updated: returns the distance (n x m) between each of points1 (n x 3 [lat, long, alt]) and each of points2 (m x 3) in distance_unit."""
+    points1 = np.asarray(points1, dtype=np.float64).reshape(-1, 3)
+    points2 = np.asarray(points2, dtype=np.float64).reshape(-1, 3)
+    return haversine_distances(
+        points1[:, np.newaxis, :], points2[np.newaxis, :, :], distance_unit
+    )
+
+
+def haversine_distances(
+    points1: np.ndarray, points2: np.ndarray, distance_unit="nm"
+) -> np.ndarray:
+    """Returns the haversine distance (with altitude difference) between (broadcast) [lat, long, alt] arrays points1 and points2 (last axis) in distance_unit."""
+    lat1_rad, long1_rad = np.radians(points1[..., 0]), np.radians(points1[..., 1])
+    lat2_rad, long2_rad = np.radians(points2[..., 0]), np.radians(points2[..., 1])
+    earth_radius = 6371  # km
+    xz_stage1 = (
+        np.sin(np.abs(lat2_rad - lat1_rad) / 2) ** 2
+        + np.cos(lat1_rad)
+        * np.cos(lat2_rad)
+        * np.sin(np.abs(long2_rad - long1_rad) / 2) ** 2
+    )
+    xz_distance = 2 * earth_radius * np.arcsin(np.sqrt(xz_stage1))
+    y_distance = (
+        np.abs(points1[..., 2] - points2[..., 2]) / 1_000
+    )  # alt stored as meters MSL
+    distance = np.sqrt(xz_distance**2 + y_distance**2)
+    return meters_to_unit(distance * 1_000, distance_unit.lower())
+
+
 def meters_to_unit(meters: float, unit: str):
+    """Returns meters (float or array) in unit."""
     if unit in ["nautical mile", "nautical miles", "nm", "nmi"]:
         convert_units = 0.000539957
     elif unit in ["kilometres", "kilometre", "km"]:
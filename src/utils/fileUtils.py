@@ -12,7 +12,9 @@ from src.utils.coordUtils import coords_to_euclidean_distance
 
 
 def attr_split(string):  # regex look-behind not (easily?) applicable
-    """Takes an acmi file line and splits it into a list of attributes and values (e.g.: 'Color=Grey')"""
+    """Takes an acmi file line and splits it into a list of attributes and values (e.g.: 'Color=Grey')\n
+    Reference implementation - tokenUtils.split_attrs is used when processing files (and must match this).
+    """
     splits = [0]
     for i, char in enumerate(string):
         if char == "," and string[i - 1] != "\\":
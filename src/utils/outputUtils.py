@@ -1,3 +1,5 @@
+from src.data.typeReferences import get_types_mask
+
 files_csv_header = [
     "FileID",
     "FileName",
@@ -35,8 +37,21 @@ objects_csv_header = [
     "deathTimeStamp",
     "origin",
     "launcher",
+    # munition metrics (see analyticsUtils.get_munition_metrics), blank for other objects
+    "timeOfFlight",  # seconds
+    "launchAltitude",  # meters MSL
+    "launchSpeed",  # launcher speed at launch, meters per second
+    "peakSpeed",  # meters per second
+    "terminalSpeed",  # meters per second
+    "launchRange",  # range to target (victim, or closest approach target) at launch, meters
+    "missDistance",  # distance to target at death, meters
+    "target",  # UID of the victim, or the likely intended target (closest approach)
+    "closestApproach",  # closest distance to target during flight, meters
+    "closestApproachTime",
+    "outcome",  # Kill / Hit / Near Miss / Miss
     "counter",
 ]
+munition_metrics_header = objects_csv_header[-12:-1]
 
 output_csv_header = [
     "FileID",
@@ -68,3 +83,4 @@ output_exclude_object_types = [
     "Bullseye",
     "Container",
 ]
+output_exclude_types_mask = get_types_mask(output_exclude_object_types)
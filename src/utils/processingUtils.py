@@ -1,9 +1,6 @@
-def check_is_type(obj, type_list):
-    """If obj.type shares element with type_list, returns True, else returns False."""
-    for type in type_list:
-        if type in obj.type:
-            return True
-    return False
+def check_is_type(obj, types_mask: int) -> bool:
+    """If obj.type shares element with the types of types_mask (typeReferences.get_types_mask), returns True, else returns False."""
+    return bool(obj.type_flags & types_mask)
 
 
 def check_lists_share_element(list1: list, list2: list) -> bool:
@@ -0,0 +1,17 @@
+import re
+from src.utils.fileUtils import attr_split
+
+# commas not preceded by an escape (\,) - e.g.: Pilot=Spirit 1-1 \, Zen
+unescaped_comma_pattern = re.compile(r"(?<!\\),")
+
+
+def split_attrs(line: str) -> list[str]:
+    """Splits an acmi file line into a list of attributes and values at unescaped commas (e.g.: ['1402', 'T=...', 'Color=Red']).\n
+    Equivalent to fileUtils.attr_split: lines without an escaped comma use str.split, others a compiled regex.\n
+    Empty lines and lines starting with a comma (not valid object lines) fall back to attr_split.
+    """
+    if not line or line[0] == ",":
+        return attr_split(line)
+    if "\\," not in line:
+        return line.split(",")
+    return unescaped_comma_pattern.split(line)